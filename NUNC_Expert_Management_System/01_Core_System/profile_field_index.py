@@ -0,0 +1,82 @@
+"""
+NUNC Expert Management System - Core System
+Sekundär-Indizes (Feldwert -> Profil-IDs) für Filter-Abfragen
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+
+def availability_status(profile: Dict) -> List[str]:
+    """Verfügbarkeits-Status (availability.status)"""
+    availability = profile.get("availability") or {}
+    status = availability.get("status") if isinstance(availability, dict) else None
+    return [status] if status else []
+
+
+def top_level_field(field_name: str) -> Callable[[Dict], List[Hashable]]:
+    """Extraktor für ein einfaches Feld"""
+    def extract(profile: Dict) -> List[Hashable]:
+        value = profile.get(field_name)
+        return [value] if value not in (None, "") else []
+    return extract
+
+
+def list_field(field_name: str) -> Callable[[Dict], List[Hashable]]:
+    """Extraktor für ein Listen-Feld (z.B. tags)"""
+    def extract(profile: Dict) -> List[Hashable]:
+        values = profile.get(field_name) or []
+        if isinstance(values, str):
+            values = [values]
+        return [value for value in values if isinstance(value, Hashable)]
+    return extract
+
+
+class FieldIndex:
+    """Index von Feldwerten auf Profil-IDs, inkrementell gepflegt"""
+
+    def __init__(self, extractor: Callable[[Dict], Iterable[Hashable]]):
+        self.extractor = extractor
+        self._postings: Dict[Hashable, Set[str]] = defaultdict(set)
+        self._doc_values: Dict[str, Tuple[Hashable, ...]] = {}
+
+    def clear(self):
+        """Leert den Index"""
+        self._postings.clear()
+        self._doc_values.clear()
+
+    def add(self, profile_id: str, profile: Dict):
+        """Indexiert ein Profil (ersetzt einen vorhandenen Eintrag)"""
+        if profile_id in self._doc_values:
+            self.remove(profile_id)
+
+        values = tuple(dict.fromkeys(self.extractor(profile)))
+        for value in values:
+            self._postings[value].add(profile_id)
+        self._doc_values[profile_id] = values
+
+    def remove(self, profile_id: str):
+        """Entfernt ein Profil aus dem Index"""
+        for value in self._doc_values.pop(profile_id, ()):
+            postings = self._postings[value]
+            postings.discard(profile_id)
+            if not postings:
+                del self._postings[value]
+
+    def lookup(self, value: Hashable) -> Set[str]:
+        """Profil-IDs mit diesem Wert (nicht verändern!)"""
+        return self._postings.get(value, set())
+
+    def values(self) -> Dict[Hashable, int]:
+        """Vorhandene Werte mit Anzahl der Profile"""
+        return {value: len(ids) for value, ids in self._postings.items()}
+
+
+def default_field_indexes() -> Dict[str, FieldIndex]:
+    """Standard-Indizes des ProfileManagers (Name = Filter-Argument von find())"""
+    return {
+        "availability_status": FieldIndex(availability_status),
+        "status": FieldIndex(top_level_field("status")),
+        "source": FieldIndex(top_level_field("source")),
+        "tags": FieldIndex(list_field("tags")),
+    }
@@ -0,0 +1,293 @@
+"""
+NUNC Expert Management System - Core System
+Append-only Journal für Profil-Mutationen
+"""
+
+from pathlib import Path
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from binary_snapshot import load_json, write_snapshot
+from file_lock import FileLock, atomic_write_json, file_stamp
+
+
+class ProfileJournal:
+    """Journal-Speicher: Snapshot (profiles.json) + Append-only Log.
+
+    Jede Mutation wird als eine kompakte JSON-Zeile an das Log angehängt
+    (O(1) pro Schreibvorgang). Sobald das Log `compact_threshold` Einträge
+    erreicht, faltet ein Hintergrund-Thread es in einen neuen Snapshot.
+    Beim Start wird Snapshot + Log wieder eingespielt. Mit
+    `binary_snapshot=True` wird neben profiles.json ein Pickle-Snapshot
+    gepflegt und beim Start bevorzugt geladen.
+
+    Mehrere Prozesse können dasselbe Journal nutzen: Schreiber halten
+    `file_lock`, read_tail() liest nur die seit dem letzten Stand
+    angehängten Zeilen, und die Kompaktierung ist über eine eigene
+    Lock-Datei prozessübergreifend exklusiv.
+    """
+
+    def __init__(self, snapshot_file: Path, compact_threshold: int = 1000,
+                 background: bool = True, binary_snapshot: bool = False,
+                 file_lock: Optional[FileLock] = None):
+        self.snapshot_file = Path(snapshot_file)
+        self.binary_snapshot = binary_snapshot
+        self.journal_file = self.snapshot_file.with_name(self.snapshot_file.stem + ".journal.jsonl")
+        self.compacting_file = self.snapshot_file.with_name(self.snapshot_file.stem + ".journal.compacting.jsonl")
+        self.compact_threshold = compact_threshold
+        self.background = background
+        self.file_lock = file_lock or FileLock(self.snapshot_file.with_suffix(".lock"))
+        self._compaction_file_lock = FileLock(self.snapshot_file.with_suffix(".compact.lock"))
+
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._handle = None
+        self._entries = 0
+        self._snapshot_provider: Optional[Callable[[], List[Dict]]] = None
+        self._compaction_thread: Optional[threading.Thread] = None
+
+        # Gelesener Stand: Snapshot-/Rotations-Stempel, Inode und Offset des Logs
+        self._snapshot_stamp = None
+        self._compacting_stamp = None
+        self._journal_inode = None
+        self._offset = 0
+
+    def load(self) -> List[Dict]:
+        """Spielt Snapshot + Log ein und gibt die Profile in Einfüge-Reihenfolge zurück"""
+        with self._lock:
+            # Ein anderer Prozess kann das Log rotiert haben - Handle neu öffnen
+            self._close_handle()
+            profiles: Dict[str, Dict] = {}
+
+            self._snapshot_stamp = file_stamp(self.snapshot_file)
+            for profile in load_json(self.snapshot_file, self.binary_snapshot) or []:
+                profiles[profile["id"]] = profile
+
+            # Ein abgebrochener Kompaktierungslauf hinterlässt das rotierte Log
+            self._compacting_stamp = file_stamp(self.compacting_file)
+            self._replay(self.compacting_file, profiles)
+
+            journal_stamp = file_stamp(self.journal_file)
+            self._journal_inode = journal_stamp[2] if journal_stamp else None
+            records, self._offset = self._read_records(self.journal_file)
+            self._entries = self.apply(records, profiles)
+            if journal_stamp and journal_stamp[1] > self._offset:
+                # Unvollständige letzte Zeile nach Absturz ignorieren
+                print(f"⚠️ Defekter Journal-Eintrag übersprungen: {self.journal_file.name}")
+
+            return list(profiles.values())
+
+    @staticmethod
+    def apply(records: List[Dict], profiles: Dict[str, Dict]) -> int:
+        """Wendet Log-Einträge auf einen Bestand an, gibt die Anzahl zurück"""
+        for record in records:
+            if record["op"] == "put":
+                profile = record["profile"]
+                profiles[profile["id"]] = profile
+            elif record["op"] == "delete":
+                profiles.pop(record["id"], None)
+        return len(records)
+
+    def _replay(self, path: Path, profiles: Dict[str, Dict]) -> int:
+        """Wendet alle Log-Einträge einer Datei an, gibt die Anzahl zurück"""
+        records, _ = self._read_records(path)
+        return self.apply(records, profiles)
+
+    @staticmethod
+    def _read_records(path: Path, offset: int = 0) -> Tuple[List[Dict], int]:
+        """Liest Log-Einträge ab `offset`, gibt Einträge und neuen Offset zurück
+
+        Der Offset steht immer hinter der letzten vollständigen Zeile; eine
+        gerade geschriebene (noch unvollständige) Zeile wird beim nächsten
+        Mal gelesen.
+        """
+        if not path.exists():
+            return [], offset
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+
+        complete = data.rfind(b"\n") + 1
+        records = []
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"⚠️ Defekter Journal-Eintrag übersprungen: {path.name}")
+        return records, offset + complete
+
+    def generation(self) -> Tuple:
+        """Änderungsstempel von Snapshot und Log (günstig, nur stat-Aufrufe)"""
+        return (file_stamp(self.snapshot_file), file_stamp(self.compacting_file),
+                file_stamp(self.journal_file))
+
+    def read_tail(self) -> Optional[List[Dict]]:
+        """Liest die von anderen Prozessen angehängten Einträge
+
+        Gibt None zurück, wenn inzwischen kompaktiert oder rotiert wurde -
+        dann muss der Aufrufer mit load() komplett neu laden.
+        """
+        with self._lock:
+            if (file_stamp(self.snapshot_file) != self._snapshot_stamp
+                    or file_stamp(self.compacting_file) != self._compacting_stamp):
+                return None
+
+            journal_stamp = file_stamp(self.journal_file)
+            if journal_stamp is None:
+                return None if self._journal_inode is not None else []
+            if self._journal_inode is None:
+                self._journal_inode = journal_stamp[2]
+            elif journal_stamp[2] != self._journal_inode or journal_stamp[1] < self._offset:
+                return None
+
+            records, self._offset = self._read_records(self.journal_file, self._offset)
+            self._entries += len(records)
+            return records
+
+    def set_snapshot_provider(self, provider: Callable[[], List[Dict]]):
+        """Setzt die Quelle für den aktuellen Gesamtbestand (für Kompaktierung)"""
+        self._snapshot_provider = provider
+
+    def append_put(self, profile: Dict):
+        """Protokolliert ein angelegtes oder geändertes Profil"""
+        self._append([{"op": "put", "profile": profile}])
+
+    def append_puts(self, profiles: List[Dict]):
+        """Protokolliert mehrere Profile mit einem Schreibvorgang"""
+        self._append([{"op": "put", "profile": profile} for profile in profiles])
+
+    def append_delete(self, profile_id: str):
+        """Protokolliert ein gelöschtes Profil"""
+        self._append([{"op": "delete", "id": profile_id}])
+
+    def append_rename(self, profile: Dict, old_id: str):
+        """Protokolliert eine ID-Änderung (neue ID anlegen, alte löschen) mit einem Schreibvorgang"""
+        self._append([{"op": "put", "profile": profile}, {"op": "delete", "id": old_id}])
+
+    def _append(self, records: List[Dict]):
+        """Hängt Einträge an das Log an und stößt ggf. die Kompaktierung an"""
+        lines = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+            for record in records
+        )
+        with self.file_lock, self._lock:
+            if self._handle is None:
+                self._handle = open(self.journal_file, 'a', encoding='utf-8')
+                self._journal_inode = os.fstat(self._handle.fileno()).st_ino
+            if os.fstat(self._handle.fileno()).st_size > self._offset:
+                # Rest einer abgebrochenen Zeile abschließen, sonst verschmilzt er mit dem neuen Eintrag
+                lines = "\n" + lines
+            self._handle.write(lines)
+            self._handle.flush()
+            # Aufrufer hält den Datei-Lock und hat vorher nachgeladen
+            self._offset = os.fstat(self._handle.fileno()).st_size
+            self._entries += len(records)
+            needs_compaction = self._entries >= self.compact_threshold
+
+        if needs_compaction:
+            self._schedule_compaction()
+
+    def _schedule_compaction(self):
+        """Startet die Kompaktierung im Hintergrund (höchstens ein Lauf gleichzeitig)"""
+        if not self.background:
+            self.compact()
+            return
+
+        with self._lock:
+            if self._compaction_thread and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(target=self.compact, daemon=True)
+            self._compaction_thread.start()
+
+    def compact(self):
+        """Faltet das Log in einen neuen Snapshot"""
+        if self._snapshot_provider is None:
+            return
+
+        with self._compaction_lock:
+            # Kompaktiert gerade ein anderer Prozess, übernimmt dieser den Lauf
+            if not self._compaction_file_lock.acquire(blocking=False):
+                return
+            try:
+                self._compact()
+            finally:
+                self._compaction_file_lock.release()
+
+    def _compact(self):
+        """Kompaktierung (Aufrufer hält beide Kompaktierungs-Locks)"""
+        with self.file_lock, self._lock:
+            journal_stamp = file_stamp(self.journal_file)
+            if journal_stamp and (journal_stamp[2] != self._journal_inode or journal_stamp[1] != self._offset):
+                # Ein anderer Prozess hat angehängt, was hier noch nicht
+                # eingespielt ist - beim nächsten Schreibvorgang erneut versuchen
+                return
+
+            # Log rotieren und Bestand kopieren - beides unter demselben Lock,
+            # damit der Snapshot genau die rotierten Einträge enthält
+            self._close_handle()
+            if self.compacting_file.exists():
+                self._merge_leftover()
+            elif self.journal_file.exists():
+                os.replace(self.journal_file, self.compacting_file)
+            self._compacting_stamp = file_stamp(self.compacting_file)
+            self._journal_inode = None
+            self._offset = 0
+            self._entries = 0
+            profiles = [dict(p) for p in self._snapshot_provider()]
+
+        # Snapshot ohne Datei-Lock schreiben - Schreiber hängen weiter an das neue Log an
+        atomic_write_json(self.snapshot_file, profiles)
+        if self.binary_snapshot:
+            write_snapshot(self.snapshot_file, profiles)
+
+        with self.file_lock, self._lock:
+            self._snapshot_stamp = file_stamp(self.snapshot_file)
+            if self.compacting_file.exists():
+                self.compacting_file.unlink()
+            self._compacting_stamp = None
+
+        print(f"✅ Profil-Journal kompaktiert: {len(profiles)} Profile")
+
+    def _merge_leftover(self):
+        """Hängt das aktuelle Log hinter den Rest eines abgebrochenen Laufs
+
+        Die älteren Einträge bleiben vorn: Das zusammengeführte Log ersetzt
+        die Rotationsdatei atomar, erst danach wird das Log entfernt. Bricht
+        der Vorgang dazwischen ab, werden die neueren Einträge beim Laden
+        doppelt, aber in der richtigen Reihenfolge eingespielt.
+        """
+        merged_file = self.compacting_file.with_name(self.compacting_file.name + ".tmp")
+        with open(merged_file, 'wb') as dst:
+            for path in (self.compacting_file, self.journal_file):
+                if path.exists():
+                    data = path.read_bytes()
+                    # Unvollständige letzte Zeile eines Absturzes verwerfen
+                    dst.write(data[:data.rfind(b"\n") + 1])
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(merged_file, self.compacting_file)
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+
+    def _close_handle(self):
+        """Schließt das offene Log-Handle"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def close(self):
+        """Wartet auf laufende Kompaktierung und schließt das Log"""
+        thread = self._compaction_thread
+        if thread and thread.is_alive():
+            thread.join()
+        with self._lock:
+            self._close_handle()
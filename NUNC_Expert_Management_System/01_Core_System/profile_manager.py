@@ -6,38 +6,329 @@ Profil-Management für Experten
 
 from pathlib import Path
 import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import wraps
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from binary_snapshot import load_json, write_snapshot
+from config import Config
+from file_lock import FileLock, atomic_write_json, file_stamp
+from storage_backends import create_storage
+
+from profile_journal import ProfileJournal
+from profile_search_index import ProfileSearchIndex
+from profile_field_index import default_field_indexes
+from supabase_outbox import SupabaseOutbox
+
+# Indizierte SQLite-Spalten (Spalte -> Feld im Profil)
+PROFILE_INDEX_COLUMNS = {
+    "status": "status",
+    "availability_status": "availability.status",
+    "source": "source",
+    "email": "email",
+}
+
+def _exclusive(method):
+    """Führt eine Mutation unter dem Datei-Lock auf dem aktuellen Stand aus"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.file_lock:
+            self._refresh(locked=True)
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class ProfileManager:
-    """Verwaltet Experten-Profile mit CRUD-Operationen"""
+    """Verwaltet Experten-Profile mit CRUD-Operationen
+    
+    Mehrere Prozesse (z.B. Flask-Worker und CLI-Skripte) können denselben
+    Speicher nutzen: Mutationen laufen unter einem Datei-Lock auf dem
+    aktuellen Stand, Lesezugriffe prüfen per stat-Aufruf, ob ein anderer
+    Prozess geschrieben hat, und laden nur dann nach.
+    """
     
-    def __init__(self, supabase_client=None):
+    def __init__(self, supabase_client=None, profiles_file: str = None,
+                 storage_mode: Optional[str] = None, journal_compact_threshold: int = 1000,
+                 supabase_mode: str = "sync", config: Optional[Config] = None):
+        self.config = config or Config()
         self.supabase_client = supabase_client
-        self.profiles_file = Path("08_Output_Files/profiles.json")
+        self.profiles_file = Path(profiles_file or "08_Output_Files/profiles.json")
         self.profiles_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Lade bestehende Profile
-        self.profiles = self._load_profiles()
+        # Supabase-Spiegelung: "sync" (inline) oder "async" (Write-behind-Outbox)
+        self.outbox = None
+        if supabase_client and supabase_mode == "async":
+            self.outbox = SupabaseOutbox(supabase_client, self.profiles_file.with_name("supabase_outbox.jsonl"))
+        elif supabase_mode not in ("sync", "async"):
+            raise ValueError(f"Unbekannter Supabase-Modus: {supabase_mode}")
+        
+        # Speicher-Modus: "json" (komplette Datei), "journal" (Append-only Log)
+        # oder "sqlite" (Storage-Backend); Standard aus Config.STORAGE
+        if storage_mode is None:
+            storage_settings = self.config.STORAGE
+            if storage_settings.get("backend") == "sqlite":
+                storage_mode = "sqlite"
+            else:
+                storage_mode = "journal" if storage_settings.get("profile_journal") else "json"
+        
+        self.storage_mode = storage_mode
+        self.binary_snapshot = self.config.STORAGE.get("binary_snapshot", False)
+        self.file_lock = FileLock(self.profiles_file.with_suffix(".lock"))
+        self.journal = None
+        self.storage = None
+        if storage_mode == "journal":
+            self.journal = ProfileJournal(self.profiles_file, compact_threshold=journal_compact_threshold,
+                                          binary_snapshot=self.binary_snapshot, file_lock=self.file_lock)
+            self.journal.set_snapshot_provider(lambda: self.profiles)
+        elif storage_mode == "sqlite":
+            self.storage = create_storage("profiles", self.profiles_file, PROFILE_INDEX_COLUMNS,
+                                          config=self.config, backend="sqlite")
+        elif storage_mode != "json":
+            raise ValueError(f"Unbekannter Speicher-Modus: {storage_mode}")
+        
+        # Primärindex: Profil-ID -> Profil (Einfüge-Reihenfolge bleibt erhalten)
+        self._profiles_by_id: Dict[str, Dict] = {}
+        self._positions: Dict[str, int] = {}
+        self._position_counter = count()
+        # Sortierte IDs für Cursor-Pagination (gelöschte IDs bleiben als Grabstein stehen)
+        self._sorted_ids: List[str] = []
+        self._tombstones = 0
+        self._last_id_base = None
+        self._last_id_suffix = 1
+        
+        # Volltext-Index für search_profiles, Sekundär-Indizes für find()
+        self.search_index = ProfileSearchIndex()
+        self.field_indexes = default_field_indexes()
+        
+        # Änderungs-Listener (z.B. Feature-Cache des ProjectMatchers)
+        self._change_listeners: List[Callable[[str, Optional[str], Optional[Dict]], None]] = []
+        
+        # Lade bestehende Profile (Stempel vorher, damit spätere Änderungen auffallen)
+        with self.file_lock:
+            self._generation = self._store_generation()
+            self.profiles = self._load_profiles()
+    
+    @property
+    def profiles(self) -> List[Dict]:
+        """Alle Profile in Einfüge-Reihenfolge"""
+        return list(self._profiles_by_id.values())
+    
+    @profiles.setter
+    def profiles(self, profiles: List[Dict]):
+        """Ersetzt den Bestand und baut alle Indizes neu auf"""
+        self._profiles_by_id = {}
+        self._positions = {}
+        self._sorted_ids = []
+        self._tombstones = 0
+        self.search_index.clear()
+        for index in self.field_indexes.values():
+            index.clear()
+        for profile in profiles:
+            if profile["id"] in self._profiles_by_id:
+                print(f"⚠️ Doppelte Profil-ID ignoriert: {profile['id']}")
+                continue
+            self._index_profile(profile)
+    
+    def _index_profile(self, profile: Dict):
+        """Nimmt ein Profil in alle Indizes auf"""
+        profile_id = profile["id"]
+        self._profiles_by_id[profile_id] = profile
+        if profile_id not in self._positions:
+            self._positions[profile_id] = next(self._position_counter)
+            self._add_sorted_id(profile_id)
+        self.search_index.add(profile_id, profile)
+        for index in self.field_indexes.values():
+            index.add(profile_id, profile)
+    
+    def _unindex_profile(self, profile: Dict):
+        """Entfernt ein Profil aus allen Indizes"""
+        del self._profiles_by_id[profile["id"]]
+        del self._positions[profile["id"]]
+        self._remove_from_secondary_indexes(profile["id"])
+        
+        # Grabsteine erst aufräumen, wenn sie die Hälfte der Liste ausmachen
+        self._tombstones += 1
+        if self._tombstones > 64 and self._tombstones * 2 > len(self._sorted_ids):
+            self._sorted_ids = [pid for pid in self._sorted_ids if pid in self._profiles_by_id]
+            self._tombstones = 0
+    
+    def _add_sorted_id(self, profile_id: str):
+        """Fügt eine ID in die sortierte Liste ein (neue IDs landen meist am Ende)"""
+        ids = self._sorted_ids
+        if not ids or profile_id > ids[-1]:
+            ids.append(profile_id)
+            return
+        position = bisect_left(ids, profile_id)
+        if position < len(ids) and ids[position] == profile_id:
+            # Grabstein einer gelöschten ID wird wiederbelebt
+            self._tombstones -= 1
+        else:
+            ids.insert(position, profile_id)
+    
+    def _remove_from_secondary_indexes(self, profile_id: str):
+        """Entfernt ein Profil aus allen Indizes außer dem Primärindex"""
+        self.search_index.remove(profile_id)
+        for index in self.field_indexes.values():
+            index.remove(profile_id)
     
     def _load_profiles(self) -> List[Dict]:
         """Lädt Profile aus lokaler Datei oder Supabase"""
-        if self.profiles_file.exists():
-            with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        if self.journal:
+            return self.journal.load()
+        if self.storage:
+            return self.storage.load_all()
+        return load_json(self.profiles_file, self.binary_snapshot) or []
     
     def _save_profiles(self):
-        """Speichert Profile in lokaler Datei"""
-        with open(self.profiles_file, 'w', encoding='utf-8') as f:
-            json.dump(self.profiles, f, indent=4, ensure_ascii=False)
+        """Speichert Profile in lokaler Datei (atomar per Umbenennen)"""
+        profiles = self.profiles
+        atomic_write_json(self.profiles_file, profiles)
+        if self.binary_snapshot:
+            write_snapshot(self.profiles_file, profiles)
     
-    def create_profile(self, profile_data: Dict) -> str:
-        """Erstellt ein neues Experten-Profil"""
-        profile_id = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    def _store_generation(self):
+        """Änderungsstempel des Speichers (stat-Aufrufe bzw. SQLite data_version)"""
+        if self.journal:
+            return self.journal.generation()
+        if self.storage:
+            return self.storage.generation()
+        return file_stamp(self.profiles_file)
+    
+    def refresh(self):
+        """Übernimmt Änderungen anderer Prozesse (nur bei geändertem Speicher)"""
+        self._refresh()
+    
+    def _refresh(self, locked: bool = False):
+        """Lädt nach, wenn ein anderer Prozess den Speicher geändert hat"""
+        if self._store_generation() == self._generation:
+            return
+        if not locked:
+            with self.file_lock:
+                self._refresh(locked=True)
+            return
+        
+        generation = self._store_generation()
+        if generation == self._generation:
+            return
         
-        # Vollständige Profil-Struktur
-        full_profile = {
+        records = self.journal.read_tail() if self.journal else None
+        if records is not None:
+            # Nur die neu angehängten Journal-Einträge einspielen
+            for record in records:
+                if record["op"] == "put":
+                    profile = record["profile"]
+                    existing = self._profiles_by_id.get(profile["id"])
+                    if existing is not None:
+                        self._remove_from_secondary_indexes(profile["id"])
+                    self._index_profile(profile)
+                    self._notify("put", profile["id"], profile)
+                elif record["op"] == "delete" and record["id"] in self._profiles_by_id:
+                    self._unindex_profile(self._profiles_by_id[record["id"]])
+                    self._notify("delete", record["id"])
+        else:
+            self.profiles = self._load_profiles()
+            self._notify("reload")
+        self._generation = generation
+    
+    def add_change_listener(self, listener: Callable[[str, Optional[str], Optional[Dict]], None]):
+        """Registriert einen Listener für Profil-Änderungen
+        
+        Aufruf als listener(event, profile_id, profile) mit event "put"
+        (angelegt/geändert), "delete" oder "reload" (Bestand komplett neu
+        geladen, profile_id und profile sind dann None).
+        """
+        self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[str, Optional[str], Optional[Dict]], None]):
+        """Entfernt einen Listener"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def _notify(self, event: str, profile_id: Optional[str] = None, profile: Optional[Dict] = None):
+        """Benachrichtigt alle Listener über eine Änderung"""
+        for listener in list(self._change_listeners):
+            try:
+                listener(event, profile_id, profile)
+            except Exception as e:
+                print(f"⚠️ Fehler im Änderungs-Listener: {e}")
+    
+    def _mark_persisted(self):
+        """Eigener Schreibvorgang: Stempel übernehmen, damit nicht neu geladen wird"""
+        self._generation = self._store_generation()
+    
+    def _persist_put(self, profile: Dict):
+        """Persistiert ein angelegtes oder geändertes Profil"""
+        if self.journal:
+            self.journal.append_put(profile)
+        elif self.storage:
+            self.storage.save(lambda: self.profiles, changed=[profile])
+        else:
+            self._save_profiles()
+        self._mark_persisted()
+    
+    def _persist_puts(self, profiles: List[Dict]):
+        """Persistiert mehrere Profile mit einem einzigen Schreibvorgang"""
+        if not profiles:
+            return
+        if self.journal:
+            self.journal.append_puts(profiles)
+        elif self.storage:
+            self.storage.save(lambda: self.profiles, changed=profiles)
+        else:
+            self._save_profiles()
+        self._mark_persisted()
+    
+    def _persist_delete(self, profile_id: str):
+        """Persistiert das Löschen eines Profils"""
+        if self.journal:
+            self.journal.append_delete(profile_id)
+        elif self.storage:
+            self.storage.save(lambda: self.profiles, deleted=[profile_id])
+        else:
+            self._save_profiles()
+        self._mark_persisted()
+    
+    def _persist_rename(self, profile: Dict, old_id: str):
+        """Persistiert eine ID-Änderung als Anlegen der neuen und Löschen der alten ID"""
+        if self.journal:
+            self.journal.append_rename(profile, old_id)
+        elif self.storage:
+            self.storage.save(lambda: self.profiles, changed=[profile], deleted=[old_id])
+        else:
+            self._save_profiles()
+        self._mark_persisted()
+    
+    def close(self):
+        """Schließt offene Speicher-Ressourcen"""
+        if self.outbox:
+            self.outbox.stop()
+        if self.journal:
+            self.journal.close()
+        if self.storage:
+            self.storage.close()
+    
+    def _generate_profile_id(self) -> str:
+        """Erzeugt eine kollisionsfreie Profil-ID (Suffix bei gleicher Sekunde)"""
+        base_id = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if base_id != self._last_id_base:
+            self._last_id_base = base_id
+            self._last_id_suffix = 1
+        
+        profile_id = base_id if self._last_id_suffix == 1 else f"{base_id}_{self._last_id_suffix}"
+        while profile_id in self._profiles_by_id:
+            self._last_id_suffix += 1
+            profile_id = f"{base_id}_{self._last_id_suffix}"
+        self._last_id_suffix += 1
+        return profile_id
+    
+    def _build_profile(self, profile_id: str, profile_data: Dict) -> Dict:
+        """Erstellt die vollständige Profil-Struktur"""
+        return {
             "id": profile_id,
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat(),
@@ -85,13 +376,22 @@ class ProfileManager:
             "tags": profile_data.get("tags", []),
             "notes": profile_data.get("notes", "")
         }
+    
+    @_exclusive
+    def create_profile(self, profile_data: Dict) -> str:
+        """Erstellt ein neues Experten-Profil"""
+        profile_id = self._generate_profile_id()
+        full_profile = self._build_profile(profile_id, profile_data)
         
         # Profil speichern
-        self.profiles.append(full_profile)
-        self._save_profiles()
+        self._index_profile(full_profile)
+        self._persist_put(full_profile)
+        self._notify("put", profile_id, full_profile)
         
         # In Supabase speichern (falls verfügbar)
-        if self.supabase_client:
+        if self.outbox:
+            self.outbox.enqueue("insert", profile_id, full_profile)
+        elif self.supabase_client:
             try:
                 self.supabase_client.insert_profile(full_profile)
                 print(f"✅ Profil in Supabase gespeichert: {profile_id}")
@@ -101,88 +401,291 @@ class ProfileManager:
         print(f"✅ Profil erstellt: {profile_id}")
         return profile_id
     
+    @_exclusive
+    def create_profiles_bulk(self, profiles_data: Iterable[Dict], batch_size: int = 100) -> List[str]:
+        """Erstellt viele Profile auf einmal
+        
+        Alle Profile werden im Speicher angelegt und mit einem einzigen
+        Schreibvorgang persistiert; Supabase erhält sie in Batches.
+        """
+        created = []
+        for profile_data in profiles_data:
+            full_profile = self._build_profile(self._generate_profile_id(), profile_data)
+            self._index_profile(full_profile)
+            created.append(full_profile)
+        
+        self._persist_puts(created)
+        for profile in created:
+            self._notify("put", profile["id"], profile)
+        if self.outbox:
+            self.outbox.enqueue_many("insert", [(p["id"], p) for p in created])
+        else:
+            self._mirror_bulk("insert_profiles", "insert_profile", [dict(p) for p in created], batch_size)
+        
+        print(f"✅ {len(created)} Profile erstellt")
+        return [profile["id"] for profile in created]
+    
+    @_exclusive
+    def update_profiles_bulk(self, updates: Dict[str, Dict], batch_size: int = 100) -> Dict[str, bool]:
+        """Aktualisiert viele Profile auf einmal (Profil-ID -> Update-Daten)
+        
+        Gibt je Profil-ID zurück, ob das Profil gefunden und geändert wurde.
+        """
+        results = {}
+        updated = []
+        mirrored = []
+        now = datetime.now().isoformat()
+        
+        for profile_id, update_data in updates.items():
+            profile = self._profiles_by_id.get(profile_id)
+            if profile is None or update_data.get("id", profile_id) != profile_id:
+                # Unbekannt oder ID-Änderung (nur über update_profile möglich)
+                results[profile_id] = False
+                continue
+            
+            self._remove_from_secondary_indexes(profile_id)
+            profile.update(update_data)
+            profile["updated_at"] = now
+            self._index_profile(profile)
+            
+            updated.append(profile)
+            mirrored.append((profile_id, update_data))
+            results[profile_id] = True
+        
+        self._persist_puts(updated)
+        for profile in updated:
+            self._notify("put", profile["id"], profile)
+        if self.outbox:
+            self.outbox.enqueue_many("update", mirrored)
+        else:
+            self._mirror_bulk("update_profiles", "update_profile", mirrored, batch_size)
+        
+        print(f"✅ {len(updated)} Profile aktualisiert")
+        return results
+    
+    def _mirror_bulk(self, bulk_method: str, single_method: str, items: List, batch_size: int):
+        """Spiegelt Änderungen in Batches nach Supabase (falls verfügbar)
+        
+        Nutzt die Bulk-Methode des Clients, sonst Einzelaufrufe je Eintrag.
+        """
+        if not self.supabase_client or not items:
+            return
+        
+        bulk = getattr(self.supabase_client, bulk_method, None)
+        single = getattr(self.supabase_client, single_method, None)
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            try:
+                if bulk:
+                    bulk(batch)
+                else:
+                    for item in batch:
+                        if isinstance(item, tuple):
+                            single(*item)
+                        else:
+                            single(item)
+                print(f"✅ {len(batch)} Profile mit Supabase synchronisiert")
+            except Exception as e:
+                print(f"⚠️ Supabase-Fehler: {e}")
+    
     def read_profile(self, profile_id: str) -> Optional[Dict]:
         """Liest ein Profil anhand der ID"""
-        for profile in self.profiles:
-            if profile["id"] == profile_id:
-                return profile
-        return None
+        self._refresh()
+        return self._profiles_by_id.get(profile_id)
+    
+    def read_profiles(self, profile_ids: Iterable[str]) -> List[Dict]:
+        """Liest mehrere Profile anhand der IDs (unbekannte IDs werden übersprungen)"""
+        self._refresh()
+        return [self._profiles_by_id[pid] for pid in dict.fromkeys(profile_ids) if pid in self._profiles_by_id]
     
+    @_exclusive
     def update_profile(self, profile_id: str, update_data: Dict) -> bool:
         """Aktualisiert ein Profil"""
-        for i, profile in enumerate(self.profiles):
-            if profile["id"] == profile_id:
-                # Update-Daten hinzufügen
-                self.profiles[i].update(update_data)
-                self.profiles[i]["updated_at"] = datetime.now().isoformat()
-                
-                # Speichern
-                self._save_profiles()
-                
-                # Supabase aktualisieren (falls verfügbar)
-                if self.supabase_client:
-                    try:
-                        self.supabase_client.update_profile(profile_id, update_data)
-                        print(f"✅ Profil in Supabase aktualisiert: {profile_id}")
-                    except Exception as e:
-                        print(f"⚠️ Supabase-Fehler: {e}")
-                
-                print(f"✅ Profil aktualisiert: {profile_id}")
-                return True
-        
-        print(f"❌ Profil nicht gefunden: {profile_id}")
-        return False
+        profile = self._profiles_by_id.get(profile_id)
+        if profile is None:
+            print(f"❌ Profil nicht gefunden: {profile_id}")
+            return False
+        
+        new_id = update_data.get("id", profile_id)
+        renamed = new_id != profile_id
+        if renamed and new_id in self._profiles_by_id:
+            print(f"❌ Profil-ID bereits vergeben: {new_id}")
+            return False
+        
+        # Update-Daten hinzufügen (Position im Primärindex bleibt erhalten)
+        self._remove_from_secondary_indexes(profile_id)
+        profile.update(update_data)
+        profile["updated_at"] = datetime.now().isoformat()
+        if renamed:
+            del self._profiles_by_id[profile_id]
+            del self._positions[profile_id]
+            self._tombstones += 1
+        self._index_profile(profile)
+        
+        # Speichern (ID-Änderung: neue ID anlegen, alte löschen)
+        if renamed:
+            self._persist_rename(profile, profile_id)
+            self._notify("delete", profile_id)
+        else:
+            self._persist_put(profile)
+        self._notify("put", new_id, profile)
+        
+        # Supabase aktualisieren (falls verfügbar)
+        if self.outbox:
+            if renamed:
+                self.outbox.enqueue("delete", profile_id)
+                self.outbox.enqueue("insert", new_id, profile)
+            else:
+                self.outbox.enqueue("update", profile_id, update_data)
+        elif self.supabase_client:
+            try:
+                if renamed:
+                    self.supabase_client.delete_profile(profile_id)
+                    self.supabase_client.insert_profile(profile)
+                else:
+                    self.supabase_client.update_profile(profile_id, update_data)
+                print(f"✅ Profil in Supabase aktualisiert: {profile_id}")
+            except Exception as e:
+                print(f"⚠️ Supabase-Fehler: {e}")
+        
+        print(f"✅ Profil aktualisiert: {profile_id}")
+        return True
     
+    @_exclusive
     def delete_profile(self, profile_id: str) -> bool:
         """Löscht ein Profil"""
-        for i, profile in enumerate(self.profiles):
-            if profile["id"] == profile_id:
-                # Profil entfernen
-                deleted_profile = self.profiles.pop(i)
-                self._save_profiles()
-                
-                # Supabase löschen (falls verfügbar)
-                if self.supabase_client:
-                    try:
-                        self.supabase_client.delete_profile(profile_id)
-                        print(f"✅ Profil aus Supabase gelöscht: {profile_id}")
-                    except Exception as e:
-                        print(f"⚠️ Supabase-Fehler: {e}")
-                
-                print(f"✅ Profil gelöscht: {profile_id}")
-                return True
-        
-        print(f"❌ Profil nicht gefunden: {profile_id}")
-        return False
-    
-    def get_all_profiles(self) -> List[Dict]:
-        """Gibt alle Profile zurück"""
-        return self.profiles
-    
-    def search_profiles(self, query: str) -> List[Dict]:
-        """Sucht Profile basierend auf Query"""
-        results = []
-        query_lower = query.lower()
-        
-        for profile in self.profiles:
-            # Suche in verschiedenen Feldern
-            searchable_text = f"""
-                {profile.get('expert_name', '')}
-                {profile.get('hauptfokus', '')}
-                {profile.get('technologien', '')}
-                {profile.get('branchenkenntnisse', '')}
-                {profile.get('zertifizierungen', '')}
-                {profile.get('projekthistorie_text', '')}
-            """.lower()
+        profile = self._profiles_by_id.get(profile_id)
+        if profile is None:
+            print(f"❌ Profil nicht gefunden: {profile_id}")
+            return False
+        
+        # Profil entfernen
+        self._unindex_profile(profile)
+        self._persist_delete(profile_id)
+        self._notify("delete", profile_id)
+        
+        # Supabase löschen (falls verfügbar)
+        if self.outbox:
+            self.outbox.enqueue("delete", profile_id)
+        elif self.supabase_client:
+            try:
+                self.supabase_client.delete_profile(profile_id)
+                print(f"✅ Profil aus Supabase gelöscht: {profile_id}")
+            except Exception as e:
+                print(f"⚠️ Supabase-Fehler: {e}")
+        
+        print(f"✅ Profil gelöscht: {profile_id}")
+        return True
+    
+    def get_all_profiles(self, fields: Optional[Sequence[str]] = None, after: Optional[str] = None,
+                         limit: Optional[int] = None) -> List[Dict]:
+        """Gibt alle Profile zurück
+        
+        Ohne `after`/`limit` in Einfüge-Reihenfolge, sonst als Seite nach
+        Profil-ID sortiert (siehe get_profiles_page). `fields` beschränkt die
+        Rückgabe auf die genannten Felder (plus `id`).
+        """
+        self._refresh()
+        if after is None and limit is None:
+            profiles = self.profiles
+            return profiles if fields is None else [self._project(p, fields) for p in profiles]
+        return self.get_profiles_page(fields=fields, after=after, limit=limit)["profiles"]
+    
+    def get_profiles_page(self, fields: Optional[Sequence[str]] = None, after: Optional[str] = None,
+                          limit: Optional[int] = None) -> Dict:
+        """Eine Seite Profile, sortiert nach Profil-ID (Keyset-Pagination)
+        
+        `after` ist der `next_cursor` der vorherigen Seite (die letzte
+        gelieferte Profil-ID). Der Cursor bleibt auch bei zwischenzeitlichen
+        Anlagen/Löschungen und über Prozess-Neustarts hinweg gültig; der
+        Aufwand hängt nur von der Seitengröße ab.
+        """
+        self._refresh()
+        ids = self._sorted_ids
+        position = bisect_right(ids, after) if after is not None else 0
+        end = len(ids)
+        limit = end if limit is None else limit
+        
+        page = []
+        while position < end and len(page) < limit:
+            profile = self._profiles_by_id.get(ids[position])
+            position += 1
+            if profile is not None:
+                page.append(profile if fields is None else self._project(profile, fields))
+        
+        # Folgeseite nur, wenn nach dem Cursor noch ein lebendes Profil steht
+        while position < end and ids[position] not in self._profiles_by_id:
+            position += 1
+        next_cursor = page[-1]["id"] if page and position < end else None
+        
+        return {"profiles": page, "next_cursor": next_cursor}
+    
+    @staticmethod
+    def _project(profile: Dict, fields: Sequence[str]) -> Dict:
+        """Projektion auf die angegebenen Felder (id ist immer enthalten)"""
+        projected = {"id": profile["id"]}
+        for field_name in fields:
+            if field_name in profile:
+                projected[field_name] = profile[field_name]
+        return projected
+    
+    def search_profiles(self, query: str, operator: str = "and", limit: Optional[int] = None) -> List[Dict]:
+        """Sucht Profile basierend auf Query, sortiert nach Relevanz (BM25)
+        
+        Mehrere Begriffe werden UND-verknüpft, "OR"/"ODER" trennt Alternativen
+        ("apex lwc OR mulesoft"); operator="or" verknüpft alle Begriffe mit ODER.
+        """
+        if not query or not query.strip():
+            return self.get_all_profiles()[:limit]
+        
+        self._refresh()
+        ranked = self.search_index.search(query, operator)
+        return [self._profiles_by_id[profile_id] for profile_id, _ in ranked[:limit]]
+    
+    def find(self, **filters) -> List[Dict]:
+        """Filtert Profile über die Sekundär-Indizes
+        
+        Unterstützte Filter: availability_status, status, source, tags.
+        Mehrere Filter werden UND-verknüpft; eine Liste als Wert bedeutet ODER
+        innerhalb des Feldes, z.B. find(availability_status="available", tags=["sap", "crm"]).
+        """
+        self._refresh()
+        candidate_sets = []
+        for name, value in filters.items():
+            index = self.field_indexes.get(name)
+            if index is None:
+                raise ValueError(f"Kein Index für Filter: {name}")
             
-            if query_lower in searchable_text:
-                results.append(profile)
+            if isinstance(value, (list, tuple, set, frozenset)):
+                ids = set()
+                for item in value:
+                    ids |= index.lookup(item)
+            else:
+                ids = index.lookup(value)
+            candidate_sets.append(ids)
         
-        return results
+        if not candidate_sets:
+            return self.get_all_profiles()
+        
+        # Kleinste Posting-Liste zuerst schneiden
+        candidate_sets.sort(key=len)
+        matches = set(candidate_sets[0])
+        for ids in candidate_sets[1:]:
+            if not matches:
+                break
+            matches &= ids
+        
+        return [self._profiles_by_id[profile_id] for profile_id in sorted(matches, key=self._positions.__getitem__)]
     
     def get_available_profiles(self) -> List[Dict]:
         """Gibt verfügbare Profile zurück"""
-        return [p for p in self.profiles if p.get("availability", {}).get("status") == "available"]
+        return self.find(availability_status="available")
+    
+    def get_replication_metrics(self) -> Dict:
+        """Metriken der Supabase-Outbox (Queue-Tiefe, Verzögerung, Fehler)"""
+        if not self.outbox:
+            return {"mode": "sync" if self.supabase_client else "disabled"}
+        return {"mode": "async", **self.outbox.metrics()}
     
     def update_availability(self, profile_id: str, availability_data: Dict) -> bool:
         """Aktualisiert die Verfügbarkeit eines Profils"""
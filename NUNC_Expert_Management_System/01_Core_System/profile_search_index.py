@@ -0,0 +1,197 @@
+"""
+NUNC Expert Management System - Core System
+Invertierter Volltext-Index mit BM25-Ranking für die Profil-Suche
+"""
+
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+# Durchsuchte Felder mit Gewichtung (BM25F-artig)
+SEARCH_FIELDS = {
+    "expert_name": 2.0,
+    "hauptfokus": 1.5,
+    "technologien": 1.5,
+    "zertifizierungen": 1.2,
+    "branchenkenntnisse": 1.0,
+    "projekthistorie_text": 1.0,
+}
+
+# Häufige deutsche und englische Füllwörter
+STOPWORDS = {
+    "und", "oder", "der", "die", "das", "den", "dem", "des", "ein", "eine", "einer",
+    "in", "im", "mit", "für", "fuer", "von", "vom", "zu", "zum", "zur", "auf", "bei", "als",
+    "the", "and", "or", "of", "for", "with", "to", "a", "an", "at", "on", "by", "as",
+}
+
+# Suffixe für leichtes Stemming (längste zuerst)
+SUFFIXES = ("ungen", "ung", "ern", "ing", "en", "er", "es", "ed", "e", "s")
+
+# Operatoren in Suchanfragen
+OR_OPERATORS = {"OR", "ODER", "|"}
+
+TOKEN_PATTERN = re.compile(r"\w+(?:[+#]+|\.\w+)*")
+UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def normalize_token(token: str) -> str:
+    """Normalisiert ein Token (Umlaute, Akzente, leichtes Stemming)"""
+    token = token.lower().translate(UMLAUTS)
+    token = "".join(c for c in unicodedata.normalize("NFKD", token) if not unicodedata.combining(c))
+
+    if len(token) > 4 and token.isalpha():
+        for suffix in SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= 4:
+                return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Zerlegt Text in normalisierte Tokens ohne Füllwörter"""
+    if not text:
+        return []
+    if not isinstance(text, str):
+        text = " ".join(str(part) for part in text) if isinstance(text, list) else str(text)
+
+    return [
+        normalize_token(token)
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+class ProfileSearchIndex:
+    """Invertierter Index über die Suchfelder der Profile.
+
+    Wird bei jedem Anlegen/Ändern/Löschen inkrementell gepflegt. Anfragen
+    werden als Disjunktion von Konjunktionen ausgewertet ("a b OR c" =
+    (a UND b) ODER c); jeder Suchbegriff trifft auch Index-Terme, die mit
+    ihm beginnen. Treffer werden nach BM25 sortiert.
+    """
+
+    K1 = 1.2
+    B = 0.75
+    PREFIX_WEIGHT = 0.5
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Leert den Index"""
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, profile_id: str, profile: Dict):
+        """Indexiert ein Profil (ersetzt einen vorhandenen Eintrag)"""
+        if profile_id in self._doc_lengths:
+            self.remove(profile_id)
+
+        frequencies: Dict[str, float] = defaultdict(float)
+        length = 0.0
+        for field_name, weight in SEARCH_FIELDS.items():
+            for term in tokenize(profile.get(field_name, "")):
+                frequencies[term] += weight
+                length += weight
+
+        for term, frequency in frequencies.items():
+            if term not in self._postings:
+                self._sorted_terms = None
+            self._postings[term][profile_id] = frequency
+
+        self._doc_terms[profile_id] = tuple(frequencies)
+        self._doc_lengths[profile_id] = length
+        self._total_length += length
+
+    def remove(self, profile_id: str):
+        """Entfernt ein Profil aus dem Index"""
+        terms = self._doc_terms.pop(profile_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            postings = self._postings[term]
+            del postings[profile_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+
+        self._total_length -= self._doc_lengths.pop(profile_id)
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """Gibt alle Index-Terme mit Präfix `term` samt Gewichtung zurück"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+
+        expansions = []
+        position = bisect_left(self._sorted_terms, term)
+        while position < len(self._sorted_terms) and self._sorted_terms[position].startswith(term):
+            candidate = self._sorted_terms[position]
+            expansions.append((candidate, 1.0 if candidate == term else self.PREFIX_WEIGHT))
+            position += 1
+        return expansions
+
+    def _score_term(self, term: str) -> Dict[str, float]:
+        """BM25-Beiträge eines Suchbegriffs je Profil"""
+        doc_count = len(self._doc_lengths)
+        if not doc_count:
+            return {}
+        avg_length = (self._total_length / doc_count) or 1.0
+        scores: Dict[str, float] = defaultdict(float)
+
+        for index_term, weight in self._expand(term):
+            postings = self._postings[index_term]
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for profile_id, frequency in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self._doc_lengths[profile_id] / avg_length)
+                scores[profile_id] += weight * idf * frequency * (self.K1 + 1) / (frequency + norm)
+        return scores
+
+    @staticmethod
+    def parse_query(query: str, operator: str = "and") -> List[List[str]]:
+        """Zerlegt eine Anfrage in ODER-Gruppen von UND-verknüpften Termen"""
+        groups: List[List[str]] = [[]]
+        for word in query.split():
+            if word in OR_OPERATORS:
+                groups.append([])
+                continue
+            for term in tokenize(word):
+                if operator == "or":
+                    groups.append([term])
+                else:
+                    groups[-1].append(term)
+        return [group for group in groups if group]
+
+    def search(self, query: str, operator: str = "and") -> List[Tuple[str, float]]:
+        """Sucht Profile und gibt (Profil-ID, Score) absteigend sortiert zurück"""
+        results: Dict[str, float] = {}
+        term_scores: Dict[str, Dict[str, float]] = {}
+        if not self._doc_lengths:
+            return []
+
+        for group in self.parse_query(query, operator):
+            group_scores = []
+            for term in group:
+                if term not in term_scores:
+                    term_scores[term] = self._score_term(term)
+                group_scores.append(term_scores[term])
+
+            # UND: nur Profile, die jeden Term der Gruppe enthalten
+            group_scores.sort(key=len)
+            matches = set(group_scores[0])
+            for scores in group_scores[1:]:
+                matches.intersection_update(scores)
+
+            for profile_id in matches:
+                score = sum(scores[profile_id] for scores in group_scores)
+                results[profile_id] = max(results.get(profile_id, 0.0), score)
+
+        return sorted(results.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,465 @@
+"""
+NUNC Expert Management System - Core System
+Write-behind-Queue für die Supabase-Spiegelung
+"""
+
+from pathlib import Path
+from collections import OrderedDict
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from file_lock import FileLock
+
+# Client-Methoden je Operation: (Bulk-Methode, Einzel-Methode)
+CLIENT_METHODS = {
+    "insert": ("insert_profiles", "insert_profile"),
+    "update": ("update_profiles", "update_profile"),
+    "delete": ("delete_profiles", "delete_profile"),
+}
+
+
+class SupabaseOutbox:
+    """Persistente Outbox, die ein Hintergrund-Worker nach Supabase leert.
+
+    Operationen landen zuerst als JSON-Zeile in der Outbox-Datei und werden
+    dann asynchron in Batches gesendet. Noch nicht gesendete Operationen auf
+    dasselbe Profil werden zusammengefasst (z.B. insert + update -> insert,
+    update + delete -> delete). Fehlgeschlagene Batches werden mit
+    exponentiellem Backoff wiederholt; nach `max_retries` Versuchen landet
+    die Operation in der Dead-Letter-Datei.
+
+    Jeder Prozess (z.B. jeder Flask-Worker) schreibt in eine eigene Datei
+    neben `outbox_file` (`supabase_outbox.<owner>.jsonl`) und hält deren
+    Owner-Lock bis stop().
+    Beim Start übernimmt die Outbox die nicht bestätigten Operationen aller
+    Dateien, deren Owner-Lock frei ist (beendete Prozesse), und löscht sie.
+    Der Client muss Fehler werfen; Clients mit `raise_errors`-Schalter
+    (SupabaseIntegration) werden dafür umgestellt.
+    """
+
+    def __init__(self, client, outbox_file: Path, batch_size: int = 50,
+                 max_retries: int = 8, base_backoff: float = 0.5, max_backoff: float = 60.0,
+                 poll_interval: float = 0.2, start_worker: bool = True):
+        self.client = client
+        # Fehler müssen bis zur Outbox durchschlagen, sonst greifen Retry und Dead-Letter nicht
+        if hasattr(client, "raise_errors"):
+            client.raise_errors = True
+
+        self.base_file = Path(outbox_file)
+        self.base_file.parent.mkdir(parents=True, exist_ok=True)
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.outbox_file = self.base_file.with_name(f"{self.base_file.stem}.{self.owner}{self.base_file.suffix}")
+        self.dead_letter_file = self.base_file.with_name(self.base_file.stem + ".dead.jsonl")
+        self._owner_lock = FileLock(self.outbox_file.with_suffix(".lock"))
+        self._owner_lock.acquire()
+        self._owned = True
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: "OrderedDict[int, Dict]" = OrderedDict()
+        self._latest_by_profile: Dict[str, int] = {}
+        self._in_flight = 0
+        self._next_seq = 1
+        self._acked_lines = 0
+        self._handle = None
+        self._stopped = False
+        self._worker: Optional[threading.Thread] = None
+
+        self._stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "sent": 0,
+            "failed_attempts": 0,
+            "dead_lettered": 0,
+            "last_error": None,
+            "last_success_at": None,
+        }
+
+        self._replay()
+        if start_worker:
+            self.start()
+
+    # ------------------------------------------------------------------
+    # Persistenz
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_open_records(path: Path) -> List[Dict]:
+        """Nicht bestätigte Operationen einer Outbox-Datei"""
+        records = OrderedDict()
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record["type"] == "op":
+                    records[record["seq"]] = record
+                elif record["type"] == "ack":
+                    records.pop(record["seq"], None)
+        return list(records.values())
+
+    def _replay(self):
+        """Übernimmt nicht bestätigte Operationen beendeter Prozesse"""
+        adopted = []
+        records = []
+        with FileLock(self.base_file.with_suffix(".lock")):
+            # Alte gemeinsame Outbox-Datei und Dateien von Prozessen ohne gehaltenen Owner-Lock
+            paths = [self.base_file] if self.base_file.exists() else []
+            paths += sorted(self.base_file.parent.glob(f"{self.base_file.stem}.*{self.base_file.suffix}"))
+            for path in paths:
+                if path in (self.outbox_file, self.dead_letter_file):
+                    continue
+                owner_lock = None
+                if path != self.base_file:
+                    owner_lock = FileLock(path.with_suffix(".lock"))
+                    if not owner_lock.acquire(blocking=False):
+                        continue
+                adopted.append((path, owner_lock))
+                records.extend(self._read_open_records(path))
+
+            # Reihenfolge über alle Dateien nach Einreihungszeit
+            records.sort(key=lambda record: record["enqueued_at"])
+            for record in records:
+                seq = self._next_seq
+                self._next_seq += 1
+                self._add(record["op"], record["profile_id"], record["data"], seq, record["enqueued_at"])
+
+            # Erst die eigene Datei schreiben, dann die übernommenen löschen
+            self._rewrite_outbox()
+            for path, owner_lock in adopted:
+                path.unlink()
+                if owner_lock is not None:
+                    owner_lock.release()
+                    try:
+                        owner_lock.path.unlink()
+                    except OSError:
+                        pass
+
+        if records:
+            print(f"🔄 Supabase-Outbox: {len(records)} offene Operationen wiederhergestellt")
+
+    def _write_lines(self, records: List[Dict]):
+        """Hängt Einträge an die Outbox-Datei an (Aufrufer hält den Lock)"""
+        if self._handle is None:
+            self._handle = open(self.outbox_file, 'a', encoding='utf-8')
+        self._handle.write("".join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n" for record in records
+        ))
+        self._handle.flush()
+
+    def _rewrite_outbox(self):
+        """Schreibt die Outbox-Datei mit den offenen Einträgen neu (Aufrufer hält den Lock)"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+        records = []
+        for entry in self._pending.values():
+            for seq, op, data in entry["raw"]:
+                records.append({"type": "op", "seq": seq, "op": op, "profile_id": entry["profile_id"],
+                                "data": data, "enqueued_at": entry["enqueued_at"]})
+
+        tmp_file = self.outbox_file.with_name(self.outbox_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        tmp_file.replace(self.outbox_file)
+        self._acked_lines = 0
+
+    # ------------------------------------------------------------------
+    # Einreihen und Zusammenfassen
+    # ------------------------------------------------------------------
+
+    def enqueue(self, op: str, profile_id: str, data: Optional[Dict] = None):
+        """Reiht eine Operation ein (insert: Profil, update: Änderungen, delete: None)"""
+        self.enqueue_many(op, [(profile_id, data)])
+
+    def enqueue_many(self, op: str, items: List[Tuple[str, Optional[Dict]]]):
+        """Reiht mehrere Operationen mit einem Schreibvorgang ein"""
+        if op not in CLIENT_METHODS:
+            raise ValueError(f"Unbekannte Outbox-Operation: {op}")
+
+        now = time.time()
+        with self._lock:
+            records = []
+            for profile_id, data in items:
+                seq = self._next_seq
+                self._next_seq += 1
+                data = dict(data) if data is not None else None
+                records.append({"type": "op", "seq": seq, "op": op, "profile_id": profile_id,
+                                "data": data, "enqueued_at": now})
+                self._add(op, profile_id, data, seq, now)
+                self._stats["enqueued"] += 1
+            self._write_lines(records)
+            self._wakeup.notify()
+
+    def _add(self, op: str, profile_id: str, data: Optional[Dict], seq: int, enqueued_at: float):
+        """Fasst eine Operation mit dem letzten offenen Eintrag des Profils zusammen (Aufrufer hält den Lock)"""
+        latest_seq = self._latest_by_profile.get(profile_id)
+        entry = self._pending.get(latest_seq) if latest_seq is not None else None
+
+        if entry is not None:
+            merged = self._coalesce(entry, op, data)
+            if merged is not None:
+                entry["raw"].append((seq, op, data))
+                self._stats["coalesced"] += 1
+                if merged == "drop":
+                    # insert + delete: Supabase hat das Profil nie gesehen
+                    del self._pending[latest_seq]
+                    del self._latest_by_profile[profile_id]
+                    self._ack_raw(entry["raw"])
+                return
+
+        self._pending[seq] = {
+            "profile_id": profile_id,
+            "op": op,
+            "data": data,
+            "enqueued_at": enqueued_at,
+            "attempts": 0,
+            "next_attempt_at": 0.0,
+            "raw": [(seq, op, data)],
+        }
+        self._latest_by_profile[profile_id] = seq
+
+    @staticmethod
+    def _coalesce(entry: Dict, op: str, data: Optional[Dict]):
+        """Wendet eine neue Operation auf einen offenen Eintrag an
+
+        Gibt None zurück, wenn nicht zusammengefasst werden kann, "drop" wenn
+        sich beide Operationen aufheben, sonst True.
+        """
+        current = entry["op"]
+        if op == "update" and current in ("insert", "update"):
+            entry["data"] = {**(entry["data"] or {}), **(data or {})}
+            return True
+        if op == "delete" and current == "insert":
+            return "drop"
+        if op == "delete" and current == "update":
+            entry["op"] = "delete"
+            entry["data"] = None
+            return True
+        if op == "delete" and current == "delete":
+            return True
+        return None
+
+    def _ack_raw(self, raw: List[Tuple[int, str, Optional[Dict]]]):
+        """Bestätigt Roh-Operationen in der Outbox-Datei (Aufrufer hält den Lock)"""
+        self._write_lines([{"type": "ack", "seq": seq} for seq, _, _ in raw])
+        self._acked_lines += len(raw)
+
+    # ------------------------------------------------------------------
+    # Senden
+    # ------------------------------------------------------------------
+
+    def _take_batch(self, now: float) -> List[Tuple[int, Dict]]:
+        """Entnimmt sendebereite Einträge; Reihenfolge je Profil bleibt erhalten (Aufrufer hält den Lock)"""
+        batch = []
+        blocked = set()
+        for seq, entry in self._pending.items():
+            if len(batch) >= self.batch_size:
+                break
+            profile_id = entry["profile_id"]
+            if profile_id in blocked:
+                continue
+            if entry["next_attempt_at"] > now:
+                blocked.add(profile_id)
+                continue
+            batch.append((seq, entry))
+            blocked.add(profile_id)
+
+        for seq, entry in batch:
+            del self._pending[seq]
+            if self._latest_by_profile.get(entry["profile_id"]) == seq:
+                del self._latest_by_profile[entry["profile_id"]]
+        self._in_flight += len(batch)
+        return batch
+
+    def _send(self, op: str, entries: List[Dict]):
+        """Sendet gleichartige Einträge über die Bulk- oder Einzel-Methode des Clients"""
+        bulk_name, single_name = CLIENT_METHODS[op]
+        bulk = getattr(self.client, bulk_name, None)
+
+        if op == "insert":
+            payload = [entry["data"] for entry in entries]
+            if bulk:
+                bulk(payload)
+            else:
+                for profile in payload:
+                    getattr(self.client, single_name)(profile)
+        elif op == "update":
+            payload = [(entry["profile_id"], entry["data"]) for entry in entries]
+            if bulk:
+                bulk(payload)
+            else:
+                for profile_id, data in payload:
+                    getattr(self.client, single_name)(profile_id, data)
+        else:
+            payload = [entry["profile_id"] for entry in entries]
+            if bulk:
+                bulk(payload)
+            else:
+                for profile_id in payload:
+                    getattr(self.client, single_name)(profile_id)
+
+    def process_pending(self) -> int:
+        """Sendet einen Batch; gibt die Anzahl erfolgreich gesendeter Einträge zurück"""
+        with self._lock:
+            batch = self._take_batch(time.time())
+        if not batch:
+            return 0
+
+        # Nach Operation gruppieren, Reihenfolge der ersten Vorkommen beibehalten
+        groups: "OrderedDict[str, List[Tuple[int, Dict]]]" = OrderedDict()
+        for seq, entry in batch:
+            groups.setdefault(entry["op"], []).append((seq, entry))
+
+        succeeded = 0
+        for op, items in groups.items():
+            try:
+                self._send(op, [entry for _, entry in items])
+            except Exception as e:
+                self._handle_failure(items, e)
+            else:
+                with self._lock:
+                    for _, entry in items:
+                        self._ack_raw(entry["raw"])
+                    self._stats["sent"] += len(items)
+                    self._stats["last_success_at"] = time.time()
+                succeeded += len(items)
+
+        with self._lock:
+            self._in_flight -= len(batch)
+            if not self._pending and not self._in_flight:
+                self._rewrite_outbox()
+            elif self._acked_lines > 1000:
+                self._rewrite_outbox()
+            self._wakeup.notify_all()
+        return succeeded
+
+    def _handle_failure(self, items: List[Tuple[int, Dict]], error: Exception):
+        """Plant Wiederholungen mit Backoff oder verschiebt in die Dead-Letter-Datei"""
+        now = time.time()
+        with self._lock:
+            self._stats["failed_attempts"] += len(items)
+            self._stats["last_error"] = str(error)
+
+            for seq, entry in reversed(items):
+                entry["attempts"] += 1
+                if entry["attempts"] > self.max_retries:
+                    self._dead_letter(entry, error)
+                    continue
+
+                delay = min(self.max_backoff, self.base_backoff * 2 ** (entry["attempts"] - 1))
+                entry["next_attempt_at"] = now + delay * random.uniform(0.5, 1.0)
+
+                # Vor neuere Einträge desselben Profils zurücklegen
+                self._pending[seq] = entry
+                self._pending.move_to_end(seq, last=False)
+                self._latest_by_profile.setdefault(entry["profile_id"], seq)
+
+        print(f"⚠️ Supabase-Outbox: {len(items)} Operationen fehlgeschlagen ({error})")
+
+    def _dead_letter(self, entry: Dict, error: Exception):
+        """Gibt eine Operation auf und protokolliert sie (Aufrufer hält den Lock)"""
+        with open(self.dead_letter_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                "op": entry["op"],
+                "profile_id": entry["profile_id"],
+                "data": entry["data"],
+                "enqueued_at": entry["enqueued_at"],
+                "attempts": entry["attempts"],
+                "error": str(error),
+            }, ensure_ascii=False) + "\n")
+        self._ack_raw(entry["raw"])
+        self._stats["dead_lettered"] += 1
+
+    # ------------------------------------------------------------------
+    # Worker und Metriken
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Startet den Hintergrund-Worker"""
+        if self._worker and self._worker.is_alive():
+            return
+        self._stopped = False
+        self._worker = threading.Thread(target=self._run, name="supabase-outbox", daemon=True)
+        self._worker.start()
+
+    def _run(self):
+        """Worker-Schleife"""
+        while not self._stopped:
+            try:
+                sent = self.process_pending()
+            except Exception as e:
+                print(f"❌ Supabase-Outbox Worker-Fehler: {e}")
+                sent = 0
+
+            if not sent:
+                with self._lock:
+                    if not self._stopped:
+                        self._wakeup.wait(self._next_wait())
+
+    def _next_wait(self) -> float:
+        """Wartezeit bis zum nächsten fälligen Eintrag (Aufrufer hält den Lock)"""
+        if not self._pending:
+            return self.poll_interval * 10
+        next_attempt = min(entry["next_attempt_at"] for entry in self._pending.values())
+        return max(self.poll_interval, min(next_attempt - time.time(), self.max_backoff))
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Wartet, bis die Queue leer ist; gibt False bei Timeout zurück"""
+        deadline = time.time() + timeout
+        with self._lock:
+            while self._pending or self._in_flight:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._wakeup.notify_all()
+                self._wakeup.wait(min(remaining, self.poll_interval))
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Stoppt den Worker (offene Operationen bleiben in der Outbox-Datei)"""
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify_all()
+        if self._worker:
+            self._worker.join(timeout)
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            if self._owned:
+                # Offene Operationen übernimmt der nächste startende Prozess
+                if not self._pending and not self._in_flight:
+                    self.outbox_file.unlink(missing_ok=True)
+                self._owner_lock.release()
+                self._owned = False
+
+    def metrics(self) -> Dict:
+        """Queue-Tiefe, Verzögerung und Zähler"""
+        now = time.time()
+        with self._lock:
+            oldest = min((entry["enqueued_at"] for entry in self._pending.values()), default=None)
+            return {
+                "queue_depth": len(self._pending) + self._in_flight,
+                "in_flight": self._in_flight,
+                "retrying": sum(1 for entry in self._pending.values() if entry["attempts"]),
+                "lag_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                **self._stats,
+            }
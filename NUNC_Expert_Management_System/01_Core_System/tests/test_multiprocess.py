@@ -0,0 +1,123 @@
+"""
+NUNC Expert Management System - Core System Tests
+Unit-Tests für den prozessübergreifenden Betrieb des ProfileManagers
+"""
+
+import multiprocessing
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent / '05_Shared_Components'))
+
+from config import Config
+from profile_manager import ProfileManager
+
+
+def _create_profiles(profiles_file: str, storage_mode: str, worker: int, count: int):
+    """Worker-Prozess: legt `count` Profile an"""
+    manager = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode)
+    for i in range(count):
+        manager.create_profile({"expert_name": f"Worker {worker} / {i}"})
+    manager.close()
+
+
+class TestMultiProcess:
+    """Test-Klasse für Datei-Lock und Änderungserkennung"""
+
+    @pytest.mark.parametrize("storage_mode", ["json", "journal"])
+    def test_instances_see_each_others_writes(self, tmp_path, storage_mode):
+        """Test zwei Instanzen auf derselben Datei überschreiben sich nicht"""
+        profiles_file = str(tmp_path / "profiles.json")
+        first = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode)
+        second = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode)
+
+        a = first.create_profile({"expert_name": "A"})
+        assert second.read_profile(a)["expert_name"] == "A"
+
+        b = second.create_profile({"expert_name": "B"})
+        second.update_profile(a, {"hauptfokus": "SAP"})
+        first.delete_profile(b)
+
+        assert first.read_profile(a)["hauptfokus"] == "SAP"
+        assert [p["id"] for p in second.get_all_profiles()] == [a]
+        first.close()
+        second.close()
+
+        assert [p["id"] for p in ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode).profiles] == [a]
+
+    @pytest.mark.parametrize("storage_mode", ["json", "journal", "sqlite"])
+    def test_id_change_removes_old_id(self, tmp_path, storage_mode):
+        """Test ID-Änderung: alte ID bleibt nach Neustart und in anderen Instanzen gelöscht"""
+        profiles_file = str(tmp_path / "profiles.json")
+        config = Config(STORAGE={"sqlite_path": str(tmp_path / "nems.db")})
+        first = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode, config=config)
+        second = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode, config=config)
+
+        a = first.create_profile({"expert_name": "A"})
+        b = first.create_profile({"expert_name": "B"})
+        assert second.read_profile(a)["expert_name"] == "A"
+
+        assert first.update_profile(a, {"id": b}) is False
+        assert first.read_profile(b)["expert_name"] == "B"
+
+        assert first.update_profile(a, {"id": "renamed"}) is True
+        assert second.read_profile(a) is None
+        assert second.read_profile("renamed")["expert_name"] == "A"
+        first.close()
+        second.close()
+
+        restarted = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode, config=config)
+        assert sorted(p["id"] for p in restarted.profiles) == sorted([b, "renamed"])
+        restarted.close()
+
+    def test_journal_reads_only_the_tail(self, tmp_path, monkeypatch):
+        """Test fremde Journal-Einträge werden ohne kompletten Neuladevorgang übernommen"""
+        profiles_file = str(tmp_path / "profiles.json")
+        first = ProfileManager(profiles_file=profiles_file, storage_mode="journal")
+        second = ProfileManager(profiles_file=profiles_file, storage_mode="journal")
+
+        reloads = []
+        monkeypatch.setattr(second.journal, "load", lambda: reloads.append(1) or [])
+
+        profile_id = first.create_profile({"expert_name": "Tail"})
+        assert second.search_profiles("tail")[0]["id"] == profile_id
+        assert reloads == []
+
+    def test_compaction_by_other_instance(self, tmp_path):
+        """Test Kompaktierung einer Instanz wird von der anderen erkannt"""
+        profiles_file = str(tmp_path / "profiles.json")
+        first = ProfileManager(profiles_file=profiles_file, storage_mode="journal", journal_compact_threshold=3)
+        second = ProfileManager(profiles_file=profiles_file, storage_mode="journal")
+
+        second.create_profile({"expert_name": "S1"})
+        for i in range(3):
+            first.create_profile({"expert_name": f"F{i}"})
+        first.close()  # wartet auf die Hintergrund-Kompaktierung
+
+        second.create_profile({"expert_name": "S2"})
+        assert len(second.get_all_profiles()) == 5
+        second.close()
+
+        assert len(ProfileManager(profiles_file=profiles_file, storage_mode="journal").profiles) == 5
+
+    @pytest.mark.parametrize("storage_mode", ["json", "journal"])
+    def test_parallel_processes_lose_no_writes(self, tmp_path, storage_mode):
+        """Test parallele Prozesse verlieren keine Profile"""
+        profiles_file = str(tmp_path / "profiles.json")
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_create_profiles, args=(profiles_file, storage_mode, worker, 15))
+            for worker in range(3)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        profiles = ProfileManager(profiles_file=profiles_file, storage_mode=storage_mode).profiles
+        assert len(profiles) == 45
+        assert len({p["id"] for p in profiles}) == 45
@@ -0,0 +1,216 @@
+"""
+NUNC Expert Management System - Core System Tests
+Unit-Tests für die Profil-Indizes des ProfileManagers
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import Mock
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from profile_manager import ProfileManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """ProfileManager mit leerem Speicher"""
+    return ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+
+
+class TestPrimaryIndex:
+    """Test-Klasse für den Primärindex (ID -> Profil)"""
+
+    def test_read_update_delete_by_id(self, manager):
+        """Test Lesen, Ändern und Löschen über den Primärindex"""
+        manager.profiles = [{"id": "p1", "expert_name": "A"}, {"id": "p2", "expert_name": "B"}]
+
+        assert manager.read_profile("p2")["expert_name"] == "B"
+        assert manager.update_profile("p1", {"expert_name": "A2"}) is True
+        assert manager.delete_profile("p2") is True
+
+        assert manager.read_profile("p2") is None
+        assert [p["expert_name"] for p in manager.get_all_profiles()] == ["A2"]
+
+    def test_update_keeps_insertion_order(self, manager):
+        """Test Änderungen verschieben Profile nicht ans Ende"""
+        manager.profiles = [{"id": "p1"}, {"id": "p2"}, {"id": "p3"}]
+        manager.update_profile("p1", {"notes": "x"})
+
+        assert [p["id"] for p in manager.profiles] == ["p1", "p2", "p3"]
+
+    def test_unknown_id(self, manager):
+        """Test unbekannte IDs liefern None/False"""
+        assert manager.read_profile("missing") is None
+        assert manager.update_profile("missing", {}) is False
+        assert manager.delete_profile("missing") is False
+
+    def test_read_profiles_by_ids(self, manager):
+        """Test mehrere IDs in der angefragten Reihenfolge, unbekannte übersprungen"""
+        manager.profiles = [{"id": "p1"}, {"id": "p2"}, {"id": "p3"}]
+        assert [p["id"] for p in manager.read_profiles(["p3", "missing", "p1", "p3"])] == ["p3", "p1"]
+
+
+class TestSearchIndex:
+    """Test-Klasse für den Volltext-Index von search_profiles"""
+
+    @pytest.fixture
+    def search_manager(self, manager):
+        manager.profiles = [
+            {"id": "p1", "expert_name": "Lukas Pfanner", "hauptfokus": "Salesforce Architekt",
+             "technologien": "Salesforce, Apex, LWC", "branchenkenntnisse": "Banken"},
+            {"id": "p2", "expert_name": "Anna Müller", "hauptfokus": "Mulesoft Entwicklerin",
+             "technologien": "Mulesoft, Java", "zertifizierungen": "MuleSoft Certified Developer"},
+            {"id": "p3", "expert_name": "Tim Jäger", "hauptfokus": "Salesforce Consultant",
+             "technologien": "Salesforce", "projekthistorie_text": "Implementierungen im Banking"},
+        ]
+        return manager
+
+    def test_and_query_is_ranked(self, search_manager):
+        """Test UND-Verknüpfung und Ranking"""
+        results = search_manager.search_profiles("salesforce apex")
+        assert [p["id"] for p in results] == ["p1"]
+
+        results = search_manager.search_profiles("salesforce")
+        assert {p["id"] for p in results} == {"p1", "p3"}
+
+    def test_or_query(self, search_manager):
+        """Test ODER-Verknüpfung"""
+        results = search_manager.search_profiles("apex OR mulesoft")
+        assert {p["id"] for p in results} == {"p1", "p2"}
+
+        results = search_manager.search_profiles("apex java", operator="or")
+        assert {p["id"] for p in results} == {"p1", "p2"}
+
+    def test_german_normalization_and_prefix(self, search_manager):
+        """Test Umlaut-Normalisierung, Stemming und Präfix-Suche"""
+        assert [p["id"] for p in search_manager.search_profiles("Mueller")] == ["p2"]
+        assert [p["id"] for p in search_manager.search_profiles("Implementierung")] == ["p3"]
+        assert {p["id"] for p in search_manager.search_profiles("bank")} == {"p1", "p3"}
+
+    def test_index_follows_mutations(self, search_manager):
+        """Test inkrementelle Pflege bei Update und Delete"""
+        search_manager.update_profile("p2", {"technologien": "Apex"})
+        assert {p["id"] for p in search_manager.search_profiles("apex")} == {"p1", "p2"}
+        assert search_manager.search_profiles("java") == []
+
+        search_manager.delete_profile("p1")
+        assert [p["id"] for p in search_manager.search_profiles("apex")] == ["p2"]
+
+    def test_empty_store(self, manager):
+        """Test Suche im leeren Speicher liefert keine Treffer"""
+        assert manager.search_profiles("apex") == []
+        assert manager.search_profiles("apex OR java", operator="or") == []
+
+    def test_search_after_deleting_all_profiles(self, search_manager):
+        """Test Suche nach Löschen aller Profile liefert keine Treffer"""
+        for profile in list(search_manager.get_all_profiles()):
+            search_manager.delete_profile(profile["id"])
+        assert search_manager.search_profiles("apex") == []
+
+
+class TestFieldIndexes:
+    """Test-Klasse für die Sekundär-Indizes von find()"""
+
+    @pytest.fixture
+    def filter_manager(self, manager):
+        manager.profiles = [
+            {"id": "p1", "status": "active", "source": "pdf", "tags": ["sap", "crm"],
+             "availability": {"status": "available"}},
+            {"id": "p2", "status": "active", "source": "mail", "tags": ["crm"],
+             "availability": {"status": "busy"}},
+            {"id": "p3", "status": "archived", "source": "pdf", "tags": [],
+             "availability": {"status": "available"}},
+        ]
+        return manager
+
+    def test_find_intersects_filters(self, filter_manager):
+        """Test UND über Felder, ODER innerhalb eines Feldes"""
+        assert [p["id"] for p in filter_manager.find(availability_status="available")] == ["p1", "p3"]
+        assert [p["id"] for p in filter_manager.find(status="active", tags="crm")] == ["p1", "p2"]
+        assert [p["id"] for p in filter_manager.find(source="pdf", tags=["sap", "none"])] == ["p1"]
+        assert filter_manager.find(status="active", source="unknown") == []
+
+    def test_get_available_profiles_uses_index(self, filter_manager):
+        """Test get_available_profiles folgt Verfügbarkeits-Updates"""
+        filter_manager.update_availability("p2", {"status": "available"})
+        filter_manager.update_availability("p1", {"status": "busy"})
+
+        assert [p["id"] for p in filter_manager.get_available_profiles()] == ["p2", "p3"]
+
+    def test_unknown_filter(self, filter_manager):
+        """Test unbekannte Filter werden abgelehnt"""
+        with pytest.raises(ValueError):
+            filter_manager.find(email="a@example.com")
+
+
+class TestBulkOperations:
+    """Test-Klasse für create_profiles_bulk / update_profiles_bulk"""
+
+    def test_bulk_create_has_unique_ids_and_single_flush(self, manager, monkeypatch):
+        """Test kollisionsfreie IDs und genau ein Schreibvorgang"""
+        writes = []
+        original_save = manager._save_profiles
+        monkeypatch.setattr(manager, "_save_profiles", lambda: writes.append(1) or original_save())
+
+        ids = manager.create_profiles_bulk({"expert_name": f"Expert {i}"} for i in range(50))
+
+        assert len(set(ids)) == 50
+        assert len(writes) == 1
+        assert len(manager.find(availability_status="available")) == 50
+
+    def test_bulk_update_and_supabase_batches(self, tmp_path):
+        """Test Bulk-Update mit Supabase-Batches"""
+        client = Mock(spec=["insert_profiles", "update_profile"])
+        manager = ProfileManager(supabase_client=client, profiles_file=str(tmp_path / "profiles.json"))
+        ids = manager.create_profiles_bulk([{"expert_name": str(i)} for i in range(5)], batch_size=2)
+
+        results = manager.update_profiles_bulk({ids[0]: {"tags": ["crm"]}, "missing": {}}, batch_size=2)
+
+        assert results == {ids[0]: True, "missing": False}
+        assert client.insert_profiles.call_count == 3
+        client.update_profile.assert_called_once_with(ids[0], {"tags": ["crm"]})
+        assert [p["id"] for p in manager.find(tags="crm")] == [ids[0]]
+
+    def test_single_creates_do_not_collide(self, manager):
+        """Test mehrere create_profile-Aufrufe in derselben Sekunde"""
+        ids = {manager.create_profile({"expert_name": str(i)}) for i in range(3)}
+        assert len(ids) == 3
+
+
+class TestPagination:
+    """Test-Klasse für Cursor-Pagination und Feld-Projektion"""
+
+    def test_pages_cover_all_profiles_once(self, manager):
+        """Test Seiten sind lückenlos, auch wenn zwischendurch gelöscht wird"""
+        manager.profiles = [{"id": f"p{i:02d}", "expert_name": str(i)} for i in range(10)]
+
+        first = manager.get_profiles_page(limit=4)
+        assert [p["id"] for p in first["profiles"]] == ["p00", "p01", "p02", "p03"]
+
+        manager.delete_profile("p04")
+        second = manager.get_profiles_page(after=first["next_cursor"], limit=4)
+        assert [p["id"] for p in second["profiles"]] == ["p05", "p06", "p07", "p08"]
+
+        last = manager.get_profiles_page(after=second["next_cursor"], limit=4)
+        assert [p["id"] for p in last["profiles"]] == ["p09"]
+        assert last["next_cursor"] is None
+
+    def test_no_cursor_when_only_tombstones_follow(self, manager):
+        """Test gelöschte Profile am Ende erzeugen keine leere Folgeseite"""
+        manager.profiles = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        manager.delete_profile("c")
+
+        page = manager.get_profiles_page(limit=2)
+        assert [p["id"] for p in page["profiles"]] == ["a", "b"]
+        assert page["next_cursor"] is None
+
+    def test_field_projection(self, manager):
+        """Test nur angeforderte Felder (plus id) werden geliefert"""
+        manager.profiles = [{"id": "p1", "expert_name": "A", "projekthistorie_text": "lang" * 100}]
+
+        profiles = manager.get_all_profiles(fields=["expert_name", "hauptfokus"])
+        assert profiles == [{"id": "p1", "expert_name": "A"}]
+        assert manager.get_all_profiles(fields=["expert_name"], limit=1) == [{"id": "p1", "expert_name": "A"}]
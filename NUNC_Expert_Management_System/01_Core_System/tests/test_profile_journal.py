@@ -0,0 +1,100 @@
+"""
+NUNC Expert Management System - Core System Tests
+Unit-Tests für den Journal-Speicher des ProfileManagers
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from profile_manager import ProfileManager
+from profile_journal import ProfileJournal
+
+
+class TestProfileJournal:
+    """Test-Klasse für ProfileJournal"""
+
+    def test_mutation_appends_single_line(self, tmp_path):
+        """Test dass jede Mutation genau eine Log-Zeile erzeugt"""
+        profiles_file = tmp_path / "profiles.json"
+        manager = ProfileManager(profiles_file=str(profiles_file), storage_mode="journal")
+
+        profile_id = manager.create_profile({"expert_name": "Anna Schmidt"})
+        manager.update_profile(profile_id, {"hauptfokus": "Salesforce"})
+        manager.close()
+
+        lines = manager.journal.journal_file.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["profile"]["hauptfokus"] == "Salesforce"
+        assert not profiles_file.exists()
+
+    def test_replay_snapshot_and_log(self, tmp_path):
+        """Test Neustart: Snapshot + Log werden eingespielt"""
+        profiles_file = tmp_path / "profiles.json"
+        profiles_file.write_text(json.dumps([{"id": "p1", "expert_name": "Alt"}]), encoding='utf-8')
+
+        manager = ProfileManager(profiles_file=str(profiles_file), storage_mode="journal")
+        manager.update_profile("p1", {"expert_name": "Neu"})
+        new_id = manager.create_profile({"expert_name": "Zweites Profil"})
+        manager.delete_profile(new_id)
+        manager.close()
+
+        manager2 = ProfileManager(profiles_file=str(profiles_file), storage_mode="journal")
+        assert [p["id"] for p in manager2.profiles] == ["p1"]
+        assert manager2.read_profile("p1")["expert_name"] == "Neu"
+
+    def test_compaction_folds_log_into_snapshot(self, tmp_path):
+        """Test Kompaktierung schreibt Snapshot und leert das Log"""
+        profiles_file = tmp_path / "profiles.json"
+        profiles = [{"id": f"p{i}"} for i in range(3)]
+        journal = ProfileJournal(profiles_file, compact_threshold=3, background=False)
+        journal.set_snapshot_provider(lambda: profiles)
+
+        for profile in profiles:
+            journal.append_put(profile)
+        journal.close()
+
+        assert json.loads(profiles_file.read_text(encoding='utf-8')) == profiles
+        assert not journal.journal_file.exists()
+        assert not journal.compacting_file.exists()
+        assert ProfileJournal(profiles_file).load() == profiles
+
+    def test_leftover_rotation_stays_before_newer_entries(self, tmp_path, monkeypatch):
+        """Test Rest eines abgebrochenen Laufs überschreibt nie neuere Einträge"""
+        profiles_file = tmp_path / "profiles.json"
+        journal = ProfileJournal(profiles_file, background=False)
+        journal.append_put({"id": "p1", "expert_name": "Alt"})
+        journal.close()
+        # Absturz nach dem Rotieren, vor dem Schreiben des Snapshots
+        journal.journal_file.replace(journal.compacting_file)
+
+        journal = ProfileJournal(profiles_file, background=False)
+        profiles = {p["id"]: p for p in journal.load()}
+        journal.set_snapshot_provider(lambda: list(profiles.values()))
+        profiles["p1"] = {"id": "p1", "expert_name": "Neu"}
+        journal.append_put(profiles["p1"])
+
+        # Erneuter Absturz vor dem Snapshot
+        def crash(*args, **kwargs):
+            raise OSError("Absturz")
+        monkeypatch.setattr("profile_journal.atomic_write_json", crash)
+        with pytest.raises(OSError):
+            journal.compact()
+        journal.close()
+
+        assert ProfileJournal(profiles_file).load() == [{"id": "p1", "expert_name": "Neu"}]
+
+    def test_truncated_last_line_is_ignored(self, tmp_path):
+        """Test Absturz mitten im Schreiben hinterlässt lesbares Journal"""
+        profiles_file = tmp_path / "profiles.json"
+        journal = ProfileJournal(profiles_file)
+        journal.append_put({"id": "p1"})
+        journal.close()
+        with open(journal.journal_file, 'a', encoding='utf-8') as f:
+            f.write('{"op":"put","prof')
+
+        assert ProfileJournal(profiles_file).load() == [{"id": "p1"}]
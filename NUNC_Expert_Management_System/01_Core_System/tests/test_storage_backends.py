@@ -0,0 +1,125 @@
+"""
+NUNC Expert Management System - Core System Tests
+Unit-Tests für die Storage-Backends (SQLite, Binär-Snapshots) und den SQLite-Modus des ProfileManagers
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent / '05_Shared_Components'))
+
+from binary_snapshot import load_json, read_snapshot, snapshot_path
+from config import Config
+from profile_manager import ProfileManager
+from storage_backends import JsonFileStorage, SQLiteStorage, create_storage
+
+
+class TestSQLiteStorage:
+    """Test-Klasse für SQLiteStorage"""
+
+    def test_upsert_keeps_order_and_uses_wal(self, tmp_path):
+        """Test Upsert ändert Daten, aber nicht die Reihenfolge"""
+        storage = SQLiteStorage(tmp_path / "nems.db", "projects", {"status": "status"})
+        storage.save([], changed=[{"id": "a", "status": "active"}, {"id": "b", "status": "active"}])
+        storage.save([], changed=[{"id": "a", "status": "completed"}])
+        storage.save([], deleted=["b"])
+        storage.save([], changed=[{"id": "c", "status": "active"}])
+
+        assert storage.load_all() == [{"id": "a", "status": "completed"}, {"id": "c", "status": "active"}]
+        assert [r["id"] for r in storage.find_by("status", "active")] == ["c"]
+
+        mode = storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        storage.close()
+
+    def test_index_columns_are_indexed(self, tmp_path):
+        """Test Fremdschlüssel-Spalten erhalten einen Index"""
+        storage = SQLiteStorage(tmp_path / "nems.db", "project_matches", {"project_id": "project_id"})
+        storage.close()
+
+        conn = sqlite3.connect(str(tmp_path / "nems.db"))
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(project_matches)")}
+        conn.close()
+        assert "idx_project_matches_project_id" in indexes
+
+    def test_migrates_existing_json_file(self, tmp_path):
+        """Test bestehende JSON-Datei wird beim ersten Öffnen übernommen"""
+        json_path = tmp_path / "projects.json"
+        json_path.write_text(json.dumps([{"id": "p1"}, {"id": "p2"}]), encoding='utf-8')
+
+        config = Config(STORAGE={"backend": "sqlite", "sqlite_path": None})
+        storage = create_storage("projects", json_path, config=config)
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.db_path == tmp_path / "nems.db"
+        assert [r["id"] for r in storage.load_all()] == ["p1", "p2"]
+        storage.close()
+
+    def test_json_backend_is_default(self, tmp_path):
+        """Test ohne Konfiguration bleibt es bei der JSON-Datei"""
+        config = Config(STORAGE={"backend": "json"})
+        storage = create_storage("projects", tmp_path / "projects.json", config=config)
+        assert isinstance(storage, JsonFileStorage)
+
+
+class TestProfileManagerSQLite:
+    """Test-Klasse für den SQLite-Modus des ProfileManagers"""
+
+    def test_crud_survives_restart(self, tmp_path):
+        """Test CRUD-Operationen landen zeilenweise in SQLite"""
+        profiles_file = tmp_path / "profiles.json"
+        config = Config(STORAGE={"backend": "sqlite", "sqlite_path": str(tmp_path / "nems.db")})
+
+        manager = ProfileManager(profiles_file=str(profiles_file), config=config)
+        assert manager.storage_mode == "sqlite"
+        first_id = manager.create_profile({"expert_name": "Anna Schmidt"})
+        second_id = manager.create_profile({"expert_name": "Ben Weber"})
+        manager.update_profile(first_id, {"hauptfokus": "Salesforce"})
+        manager.delete_profile(second_id)
+        manager.close()
+
+        assert not profiles_file.exists()
+
+        manager2 = ProfileManager(profiles_file=str(profiles_file), config=config)
+        assert [p["id"] for p in manager2.profiles] == [first_id]
+        assert manager2.read_profile(first_id)["hauptfokus"] == "Salesforce"
+        assert manager2.storage.find_by("availability_status", "available")[0]["id"] == first_id
+        manager2.close()
+
+
+class TestBinarySnapshot:
+    """Test-Klasse für Binär-Snapshots neben JSON-Dateien"""
+
+    def test_snapshot_written_and_preferred(self, tmp_path):
+        """Test nach dem ersten Laden existiert ein passender Snapshot"""
+        json_path = tmp_path / "projects.json"
+        json_path.write_text(json.dumps([{"id": "p1"}]), encoding='utf-8')
+
+        assert load_json(json_path) == [{"id": "p1"}]
+        assert snapshot_path(json_path).exists()
+        assert read_snapshot(json_path) == [{"id": "p1"}]
+
+    def test_stale_snapshot_falls_back_to_json(self, tmp_path):
+        """Test extern geänderte JSON-Datei macht den Snapshot ungültig"""
+        json_path = tmp_path / "projects.json"
+        storage = JsonFileStorage(json_path, binary_snapshot=True)
+        storage.save([{"id": "p1"}])
+
+        json_path.write_text(json.dumps([{"id": "p1"}, {"id": "p2"}]), encoding='utf-8')
+        assert read_snapshot(json_path) is None
+        assert [r["id"] for r in storage.load_all()] == ["p1", "p2"]
+
+    def test_profile_manager_uses_snapshot(self, tmp_path):
+        """Test ProfileManager lädt beim Neustart aus dem Snapshot"""
+        profiles_file = tmp_path / "profiles.json"
+        config = Config(STORAGE={"backend": "json", "binary_snapshot": True})
+
+        manager = ProfileManager(profiles_file=str(profiles_file), config=config)
+        profile_id = manager.create_profile({"expert_name": "Anna Schmidt"})
+        assert read_snapshot(profiles_file)[0]["id"] == profile_id
+
+        manager2 = ProfileManager(profiles_file=str(profiles_file), config=config)
+        assert manager2.read_profile(profile_id)["expert_name"] == "Anna Schmidt"
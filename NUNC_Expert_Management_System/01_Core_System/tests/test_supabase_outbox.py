@@ -0,0 +1,179 @@
+"""
+NUNC Expert Management System - Core System Tests
+Unit-Tests für die Supabase-Outbox (Write-behind-Queue)
+"""
+
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from profile_manager import ProfileManager
+from supabase_outbox import SupabaseOutbox
+
+
+class FakeSupabaseClient:
+    """Lokaler Fake-Client, der Aufrufe protokolliert und Fehler simulieren kann"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = []
+        self.rows = {}
+
+    def _maybe_fail(self):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Supabase nicht erreichbar")
+
+    def insert_profiles(self, profiles):
+        self._maybe_fail()
+        self.calls.append(("insert_profiles", len(profiles)))
+        for profile in profiles:
+            self.rows[profile["id"]] = dict(profile)
+
+    def update_profile(self, profile_id, data):
+        self._maybe_fail()
+        self.calls.append(("update_profile", profile_id))
+        self.rows[profile_id].update(data)
+
+    def delete_profile(self, profile_id):
+        self._maybe_fail()
+        self.calls.append(("delete_profile", profile_id))
+        self.rows.pop(profile_id, None)
+
+
+@pytest.fixture
+def outbox_file(tmp_path):
+    return tmp_path / "supabase_outbox.jsonl"
+
+
+class TestSupabaseOutbox:
+    """Test-Klasse für SupabaseOutbox"""
+
+    def test_coalesces_updates_into_insert(self, outbox_file):
+        """Test insert + update werden zu einem insert zusammengefasst"""
+        client = FakeSupabaseClient()
+        outbox = SupabaseOutbox(client, outbox_file, start_worker=False)
+
+        outbox.enqueue("insert", "p1", {"id": "p1", "expert_name": "A"})
+        outbox.enqueue("update", "p1", {"expert_name": "B"})
+        outbox.enqueue("update", "p1", {"hauptfokus": "SAP"})
+        assert outbox.metrics()["queue_depth"] == 1
+
+        assert outbox.process_pending() == 1
+        assert client.calls == [("insert_profiles", 1)]
+        assert client.rows["p1"] == {"id": "p1", "expert_name": "B", "hauptfokus": "SAP"}
+        assert outbox.metrics()["queue_depth"] == 0
+
+    def test_insert_then_delete_is_dropped(self, outbox_file):
+        """Test insert + delete heben sich auf"""
+        client = FakeSupabaseClient()
+        outbox = SupabaseOutbox(client, outbox_file, start_worker=False)
+
+        outbox.enqueue("insert", "p1", {"id": "p1"})
+        outbox.enqueue("delete", "p1")
+
+        assert outbox.process_pending() == 0
+        assert client.calls == []
+
+    def test_retry_with_backoff(self, outbox_file):
+        """Test Wiederholung nach Fehler"""
+        client = FakeSupabaseClient(failures=1)
+        outbox = SupabaseOutbox(client, outbox_file, base_backoff=0.0, start_worker=False)
+
+        outbox.enqueue("insert", "p1", {"id": "p1"})
+        assert outbox.process_pending() == 0
+        assert outbox.metrics()["retrying"] == 1
+
+        assert outbox.process_pending() == 1
+        metrics = outbox.metrics()
+        assert metrics["failed_attempts"] == 1
+        assert metrics["sent"] == 1
+
+    def test_dead_letter_after_max_retries(self, outbox_file):
+        """Test Aufgabe nach max_retries Versuchen"""
+        client = FakeSupabaseClient(failures=10)
+        outbox = SupabaseOutbox(client, outbox_file, max_retries=1, base_backoff=0.0, start_worker=False)
+
+        outbox.enqueue("delete", "p1")
+        outbox.process_pending()
+        outbox.process_pending()
+
+        assert outbox.metrics()["dead_lettered"] == 1
+        assert outbox.metrics()["queue_depth"] == 0
+        assert outbox.dead_letter_file.exists()
+
+    def test_pending_operations_survive_restart(self, outbox_file):
+        """Test offene Operationen werden nach Neustart wieder eingespielt"""
+        outbox = SupabaseOutbox(FakeSupabaseClient(failures=1), outbox_file, start_worker=False)
+        outbox.enqueue("insert", "p1", {"id": "p1"})
+        outbox.enqueue("insert", "p2", {"id": "p2"})
+        outbox.stop()
+
+        client = FakeSupabaseClient()
+        restarted = SupabaseOutbox(client, outbox_file, start_worker=False)
+        assert restarted.metrics()["queue_depth"] == 2
+        restarted.process_pending()
+        assert set(client.rows) == {"p1", "p2"}
+
+    def test_workers_keep_each_others_operations(self, outbox_file):
+        """Test mehrere Prozesse auf derselben Outbox überschreiben keine fremden Operationen"""
+        first = SupabaseOutbox(FakeSupabaseClient(), outbox_file, start_worker=False)
+        second = SupabaseOutbox(FakeSupabaseClient(failures=1), outbox_file, start_worker=False)
+        first.enqueue("insert", "p1", {"id": "p1"})
+        second.enqueue("insert", "p2", {"id": "p2"})
+        assert first.outbox_file != second.outbox_file
+
+        # Laufende Prozesse werden nicht übernommen
+        assert SupabaseOutbox(FakeSupabaseClient(), outbox_file, start_worker=False).metrics()["queue_depth"] == 0
+
+        first.process_pending()
+        second.process_pending()
+        first.stop()
+        second.stop()
+
+        client = FakeSupabaseClient()
+        restarted = SupabaseOutbox(client, outbox_file, start_worker=False)
+        assert restarted.metrics()["queue_depth"] == 1
+        restarted.process_pending()
+        assert set(client.rows) == {"p2"}
+        restarted.stop()
+        assert [path.name for path in outbox_file.parent.glob("*.jsonl")] == []
+
+    def test_client_errors_are_raised_for_retries(self, outbox_file):
+        """Test Clients mit raise_errors-Schalter reichen Fehler an die Outbox weiter"""
+        client = FakeSupabaseClient()
+        client.raise_errors = False
+        SupabaseOutbox(client, outbox_file, start_worker=False).stop()
+        assert client.raise_errors is True
+
+    def test_profile_manager_async_mode(self, tmp_path):
+        """Test ProfileManager spiegelt im async-Modus über den Worker"""
+        client = FakeSupabaseClient()
+        manager = ProfileManager(supabase_client=client, profiles_file=str(tmp_path / "profiles.json"),
+                                 supabase_mode="async")
+
+        profile_id = manager.create_profile({"expert_name": "Anna"})
+        manager.update_profile(profile_id, {"hauptfokus": "Mulesoft"})
+        assert manager.outbox.flush(timeout=5)
+        manager.close()
+
+        assert client.rows[profile_id]["hauptfokus"] == "Mulesoft"
+        assert manager.get_replication_metrics()["queue_depth"] == 0
+
+    def test_profile_manager_id_change_mirrors_delete_and_insert(self, tmp_path):
+        """Test ID-Änderung wird als Löschen der alten und Anlegen der neuen ID gespiegelt"""
+        client = FakeSupabaseClient()
+        manager = ProfileManager(supabase_client=client, profiles_file=str(tmp_path / "profiles.json"),
+                                 supabase_mode="async")
+
+        profile_id = manager.create_profile({"expert_name": "Anna"})
+        assert manager.outbox.flush(timeout=5)
+        manager.update_profile(profile_id, {"id": "renamed"})
+        assert manager.outbox.flush(timeout=5)
+        manager.close()
+
+        assert set(client.rows) == {"renamed"}
+        assert client.rows["renamed"]["expert_name"] == "Anna"
@@ -13,10 +13,19 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import uuid
 
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from config import Config
+from storage_backends import create_storage
+from utils import generate_record_id
+
 class AvailabilityManager:
     """Verwaltet Verfügbarkeits-Abfragen und Updates"""
     
-    def __init__(self, smtp_config: Dict = None):
+    def __init__(self, smtp_config: Dict = None, config: Optional[Config] = None):
+        self.config = config or Config()
         self.smtp_config = smtp_config or {
             "smtp_server": "smtp.gmail.com",
             "smtp_port": 587,
@@ -26,24 +35,24 @@ class AvailabilityManager:
         self.requests_file = Path("08_Output_Files/availability_requests.json")
         self.requests_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Speicher-Backend (JSON-Datei oder SQLite, siehe Config.STORAGE)
+        self.storage = create_storage("availability_requests", self.requests_file,
+                                      {"status": "status"}, config=self.config)
+        
         # Lade bestehende Anfragen
         self.requests = self._load_requests()
     
     def _load_requests(self) -> List[Dict]:
-        """Lädt Verfügbarkeits-Anfragen aus lokaler Datei"""
-        if self.requests_file.exists():
-            with open(self.requests_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        """Lädt Verfügbarkeits-Anfragen aus dem Speicher-Backend"""
+        return self.storage.load_all()
     
-    def _save_requests(self):
-        """Speichert Verfügbarkeits-Anfragen in lokaler Datei"""
-        with open(self.requests_file, 'w', encoding='utf-8') as f:
-            json.dump(self.requests, f, indent=4, ensure_ascii=False)
+    def _save_requests(self, changed: Optional[List[Dict]] = None):
+        """Speichert Verfügbarkeits-Anfragen (nur `changed`, sofern das Backend es unterstützt)"""
+        self.storage.save(self.requests, changed=changed or ())
     
     def create_availability_request(self, expert_emails: List[str], project_info: Dict) -> str:
         """Erstellt eine Verfügbarkeits-Anfrage"""
-        request_id = f"avail_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        request_id = generate_record_id("avail", {r["id"] for r in self.requests})
         
         # Anfrage-Struktur
         request = {
@@ -59,7 +68,7 @@ class AvailabilityManager:
         
         # Anfrage speichern
         self.requests.append(request)
-        self._save_requests()
+        self._save_requests([request])
         
         # E-Mails senden
         self._send_availability_emails(request)
@@ -180,7 +189,7 @@ class AvailabilityManager:
                     request["status"] = "completed"
                 
                 # Speichern
-                self._save_requests()
+                self._save_requests([request])
                 
                 print(f"✅ Verfügbarkeits-Antwort verarbeitet: {request_id}")
                 return True
@@ -230,7 +239,7 @@ class AvailabilityManager:
                     self._send_email(email, subject, html_content)
                 
                 request["reminder_sent"] = True
-                self._save_requests()
+                self._save_requests([request])
                 
                 print(f"✅ Erinnerung gesendet für: {request_id}")
                 return True
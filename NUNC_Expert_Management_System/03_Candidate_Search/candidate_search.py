@@ -8,108 +8,102 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import re
 
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from config import Config
+from storage_backends import create_storage
+from utils import generate_record_id
+
+from dedup import deduplicate_candidates
+from providers import PROVIDERS, CandidateProvider, SessionPool
+from result_cache import SearchResultCache, normalize_search_params
+
 class CandidateSearch:
     """Automatisierte Kandidaten-Suche auf verschiedenen Plattformen"""
     
-    def __init__(self):
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
         self.search_results_file = Path("08_Output_Files/candidate_search_results.json")
         self.search_results_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Speicher-Backend (JSON-Datei oder SQLite, siehe Config.STORAGE)
+        self.storage = create_storage("candidate_search_results", self.search_results_file,
+                                      config=self.config)
+        
         # Lade bestehende Suchergebnisse
         self.search_results = self._load_search_results()
+        
+        # Plattform-Provider (Registry) mit gemeinsamen HTTP-Sessions je Host
+        self.search_config = self.config.CANDIDATE_SEARCH
+        self.sessions = SessionPool()
+        provider_settings = self.search_config["providers"]
+        self.providers: Dict[str, CandidateProvider] = {}
+        for name, provider_class in PROVIDERS.items():
+            settings = provider_settings.get(name, {})
+            if settings.get("enabled", True):
+                self.providers[name] = provider_class(settings, self.sessions)
+        
+        # Plattformen in der Reihenfolge der Ergebnisliste, parallel abgefragt
+        self.platforms: Dict[str, Callable[[Dict], List[Dict]]] = {
+            name: partial(self.search_provider, name) for name in self.providers
+        }
+        self._executor = ThreadPoolExecutor(max_workers=self.search_config["max_workers"],
+                                            thread_name_prefix="candidate-search")
+        
+        # Ergebnis-Cache je Plattform und kanonisierten Suchparametern
+        cache_config = self.search_config["cache"]
+        self.result_cache: Optional[SearchResultCache] = None
+        if cache_config["enabled"]:
+            persist_file = Path("08_Output_Files/candidate_search_cache.json") if cache_config["persist"] else None
+            self.result_cache = SearchResultCache(ttl=cache_config["ttl"], ttls=cache_config["provider_ttls"],
+                                                  max_entries=cache_config["max_entries"], persist_file=persist_file)
+    
+    def close(self):
+        """Beendet Thread-Pool und HTTP-Sessions (laufende Plattform-Abfragen werden nicht abgewartet)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.sessions.close()
     
     def _load_search_results(self) -> List[Dict]:
-        """Lädt Suchergebnisse aus lokaler Datei"""
-        if self.search_results_file.exists():
-            with open(self.search_results_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        """Lädt Suchergebnisse aus dem Speicher-Backend"""
+        return self.storage.load_all()
     
-    def _save_search_results(self):
-        """Speichert Suchergebnisse in lokaler Datei"""
-        with open(self.search_results_file, 'w', encoding='utf-8') as f:
-            json.dump(self.search_results, f, indent=4, ensure_ascii=False)
+    def _save_search_results(self, changed: Optional[List[Dict]] = None):
+        """Speichert Suchergebnisse (nur `changed`, sofern das Backend es unterstützt)"""
+        self.storage.save(self.search_results, changed=changed or ())
     
-    def search_linkedin(self, search_params: Dict) -> List[Dict]:
-        """Sucht Kandidaten auf LinkedIn (Simulation)"""
-        print("🔍 Suche auf LinkedIn...")
+    def search_provider(self, name: str, search_params: Dict) -> List[Dict]:
+        """Sucht Kandidaten über einen registrierten Provider und filtert sie
         
-        # Simulierte LinkedIn-Suche (in Produktion würde hier die LinkedIn API verwendet)
-        linkedin_results = [
-            {
-                "platform": "linkedin",
-                "name": "Dr. Sarah Weber",
-                "title": "Senior Salesforce Consultant",
-                "location": "München, Deutschland",
-                "experience": "8 Jahre",
-                "skills": ["Salesforce", "CRM", "Python", "Agile"],
-                "certifications": ["Salesforce Certified Administrator", "PMP"],
-                "profile_url": "https://linkedin.com/in/sarah-weber",
-                "availability": "available",
-                "match_score": 0.95
-            },
-            {
-                "platform": "linkedin",
-                "name": "Michael Schmidt",
-                "title": "Salesforce Developer",
-                "location": "Berlin, Deutschland",
-                "experience": "5 Jahre",
-                "skills": ["Salesforce", "Apex", "Lightning", "JavaScript"],
-                "certifications": ["Salesforce Certified Developer"],
-                "profile_url": "https://linkedin.com/in/michael-schmidt",
-                "availability": "available",
-                "match_score": 0.88
-            }
-        ]
+        Gefiltert wird mit den kanonischen Suchparametern - denselben, die
+        den Cache-Schlüssel bilden, damit gecachte und frische Ergebnisse
+        übereinstimmen.
+        """
+        provider = self.providers[name]
+        print(f"🔍 Suche auf {provider.label}...")
         
         # Filtere basierend auf Suchparametern
-        filtered_results = self._filter_candidates(linkedin_results, search_params)
+        search_params = normalize_search_params(search_params)
+        filtered_results = self._filter_candidates(provider.search(search_params), search_params)
         
-        print(f"✅ LinkedIn: {len(filtered_results)} Kandidaten gefunden")
+        print(f"✅ {provider.label}: {len(filtered_results)} Kandidaten gefunden")
         return filtered_results
     
+    def search_linkedin(self, search_params: Dict) -> List[Dict]:
+        """Sucht Kandidaten auf LinkedIn (ohne konfigurierte base_url: Simulation)"""
+        return self.search_provider("linkedin", search_params)
+    
     def search_freelancermap(self, search_params: Dict) -> List[Dict]:
-        """Sucht Kandidaten auf Freelancermap (Simulation)"""
-        print("🔍 Suche auf Freelancermap...")
-        
-        # Simulierte Freelancermap-Suche
-        freelancermap_results = [
-            {
-                "platform": "freelancermap",
-                "name": "Thomas Müller",
-                "title": "Freelance Salesforce Consultant",
-                "location": "Hamburg, Deutschland",
-                "experience": "6 Jahre",
-                "skills": ["Salesforce", "CRM", "Integration", "Consulting"],
-                "certifications": ["Salesforce Certified Administrator"],
-                "profile_url": "https://freelancermap.de/profile/thomas-mueller",
-                "availability": "available",
-                "match_score": 0.92
-            },
-            {
-                "platform": "freelancermap",
-                "name": "Anna Fischer",
-                "title": "Salesforce Technical Architect",
-                "location": "Stuttgart, Deutschland",
-                "experience": "10 Jahre",
-                "skills": ["Salesforce", "Architecture", "Integration", "Leadership"],
-                "certifications": ["Salesforce Certified Technical Architect"],
-                "profile_url": "https://freelancermap.de/profile/anna-fischer",
-                "availability": "busy",
-                "match_score": 0.85
-            }
-        ]
-        
-        # Filtere basierend auf Suchparametern
-        filtered_results = self._filter_candidates(freelancermap_results, search_params)
-        
-        print(f"✅ Freelancermap: {len(filtered_results)} Kandidaten gefunden")
-        return filtered_results
+        """Sucht Kandidaten auf Freelancermap (ohne konfigurierte base_url: Simulation)"""
+        return self.search_provider("freelancermap", search_params)
     
     def _filter_candidates(self, candidates: List[Dict], search_params: Dict) -> List[Dict]:
         """Filtert Kandidaten basierend auf Suchparametern"""
@@ -167,40 +161,157 @@ class CandidateSearch:
         
         return 0
     
-    def search_all_platforms(self, search_params: Dict) -> List[Dict]:
-        """Sucht auf allen Plattformen"""
+    def _provider_timeout(self, platform: str, timeout: Optional[float]) -> float:
+        """Timeout einer Plattform (Argument, sonst Config je Plattform bzw. Standard)"""
+        if timeout is not None:
+            return timeout
+        return self.search_config["provider_timeouts"].get(platform, self.search_config["provider_timeout"])
+    
+    @staticmethod
+    def _run_platform(search: Callable[[Dict], List[Dict]], search_params: Dict) -> Dict:
+        """Führt eine Plattform-Suche aus und misst die Dauer (im Worker-Thread)"""
+        start = time.monotonic()
+        results = search(search_params)
+        return {"results": results, "duration_ms": round((time.monotonic() - start) * 1000, 1)}
+    
+    def iter_platforms(self, search_params: Dict, timeout: Optional[float] = None,
+                       deadline: Optional[float] = None, use_cache: bool = True) -> Iterator[Tuple[str, Dict]]:
+        """Fragt alle Plattformen parallel ab und liefert (Plattform, Ergebnis), sobald es vorliegt
+        
+        Jede Plattform hat einen eigenen Timeout (`timeout` bzw. Config),
+        die gesamte Suche endet spätestens nach `deadline` Sekunden. Die
+        Laufzeit entspricht damit der langsamsten Plattform, höchstens der
+        Deadline. Ergebnis je Plattform: {"status": "ok" | "error" | "timeout",
+        "results": [...], "duration_ms": ..., "error": ...}. Abgelaufene
+        Abfragen laufen im Hintergrund weiter, ihre Ergebnisse werden verworfen.
+        Gecachte Ergebnisse (`use_cache`) werden ohne Abfrage sofort geliefert
+        ("cached": True), erfolgreiche Abfragen im Cache abgelegt.
+        """
+        start = time.monotonic()
+        if deadline is None:
+            deadline = self.search_config["search_deadline"]
+        deadline_at = start + deadline
+        
+        # Einmal kanonisieren: Abfrage, Filter und Cache-Schlüssel nutzen dieselben Parameter
+        search_params = normalize_search_params(search_params)
+        cache = self.result_cache if use_cache else None
+        futures = {}
+        cutoffs = {}
+        for platform, search in self.platforms.items():
+            cached = cache.get(platform, search_params) if cache is not None else None
+            if cached is not None:
+                yield platform, {"status": "ok", "results": cached, "duration_ms": 0.0, "cached": True}
+                continue
+            futures[platform] = self._executor.submit(self._run_platform, search, search_params)
+            cutoffs[platform] = min(start + self._provider_timeout(platform, timeout), deadline_at)
+        
+        pending = dict(futures)
+        while pending:
+            now = time.monotonic()
+            for platform in [p for p in pending if cutoffs[p] <= now and not pending[p].done()]:
+                pending.pop(platform).cancel()
+                yield platform, {"status": "timeout", "results": [], "duration_ms": round((now - start) * 1000, 1)}
+            if not pending:
+                break
+            
+            done, _ = wait(pending.values(), timeout=max(min(cutoffs[p] for p in pending) - now, 0),
+                           return_when=FIRST_COMPLETED)
+            for platform in [p for p, future in pending.items() if future in done]:
+                future = pending.pop(platform)
+                try:
+                    outcome = dict(future.result(), status="ok")
+                    if self.result_cache is not None:
+                        self.result_cache.put(platform, search_params, outcome["results"])
+                except Exception as e:
+                    outcome = {"status": "error", "results": [], "error": str(e),
+                               "duration_ms": round((time.monotonic() - start) * 1000, 1)}
+                yield platform, outcome
+    
+    def search_platforms(self, search_params: Dict, timeout: Optional[float] = None,
+                         deadline: Optional[float] = None, use_cache: bool = True) -> Dict[str, Dict]:
+        """Fragt alle Plattformen parallel ab (siehe iter_platforms), Ergebnis in Plattform-Reihenfolge"""
+        outcomes = dict(self.iter_platforms(search_params, timeout, deadline, use_cache))
+        return {platform: outcomes[platform] for platform in self.platforms}
+    
+    def search(self, search_params: Dict, timeout: Optional[float] = None,
+               deadline: Optional[float] = None, use_cache: bool = True) -> Dict:
+        """Sucht auf allen Plattformen und speichert den Suchlauf inkl. Status je Plattform"""
         print("🚀 Starte Kandidaten-Suche auf allen Plattformen...")
+        return self._record_search(search_params, self.search_platforms(search_params, timeout, deadline, use_cache))
+    
+    def search_stream(self, search_params: Dict, timeout: Optional[float] = None,
+                      deadline: Optional[float] = None, use_cache: bool = True) -> Iterator[Dict]:
+        """Sucht auf allen Plattformen und liefert die Kandidaten je Plattform, sobald sie vorliegen
         
-        all_results = []
+        Ereignisse: je Plattform {"type": "platform", "platform": ..., "status": ...,
+        "candidates": [...], "duration_ms": ...}, zum Schluss {"type": "done",
+        "search_id": ..., "total_candidates": ..., "platform_status": {...},
+        "merged": [...]} - dann ist der Suchlauf gespeichert. `merged` enthält
+        die plattformübergreifend zusammengeführten Kandidaten (mit `sources`).
+        Wird der Iterator vorher verworfen, entfällt das Speichern.
+        """
+        print("🚀 Starte Kandidaten-Suche auf allen Plattformen (Streaming)...")
+        outcomes = {}
+        for platform, outcome in self.iter_platforms(search_params, timeout, deadline, use_cache):
+            outcomes[platform] = outcome
+            event = {"type": "platform", "platform": platform, "candidates": outcome["results"]}
+            event.update((key, value) for key, value in outcome.items() if key != "results")
+            yield event
         
-        # LinkedIn-Suche
-        try:
-            linkedin_results = self.search_linkedin(search_params)
-            all_results.extend(linkedin_results)
-        except Exception as e:
-            print(f"❌ LinkedIn-Suche fehlgeschlagen: {e}")
+        search_result = self._record_search(search_params, {p: outcomes[p] for p in self.platforms})
+        yield {
+            "type": "done",
+            "search_id": search_result["id"],
+            "total_candidates": search_result["total_candidates"],
+            "platform_status": search_result["platform_status"],
+            "merged": [candidate for candidate in search_result["results"] if "sources" in candidate]
+        }
+    
+    def _record_search(self, search_params: Dict, outcomes: Dict[str, Dict]) -> Dict:
+        """Fasst die Ergebnisse je Plattform zusammen und speichert den Suchlauf"""
+        all_results = []
+        platform_status = {}
+        for platform, outcome in outcomes.items():
+            all_results.extend(outcome["results"])
+            platform_status[platform] = {key: value for key, value in outcome.items() if key != "results"}
+            platform_status[platform]["count"] = len(outcome["results"])
+            if outcome["status"] == "timeout":
+                print(f"⚠️ {platform}: Zeitüberschreitung nach {outcome['duration_ms']:.0f} ms")
+            elif outcome["status"] == "error":
+                print(f"❌ {platform}-Suche fehlgeschlagen: {outcome['error']}")
         
-        # Freelancermap-Suche
-        try:
-            freelancermap_results = self.search_freelancermap(search_params)
-            all_results.extend(freelancermap_results)
-        except Exception as e:
-            print(f"❌ Freelancermap-Suche fehlgeschlagen: {e}")
+        # Dubletten über Plattformen hinweg zusammenführen
+        found = len(all_results)
+        if self.search_config["deduplicate"]:
+            all_results = deduplicate_candidates(all_results)
         
         # Ergebnisse speichern
         search_result = {
-            "id": f"search_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "id": generate_record_id("search", {r["id"] for r in self.search_results}),
             "created_at": datetime.now().isoformat(),
             "search_params": search_params,
             "results": all_results,
-            "total_candidates": len(all_results)
+            "total_candidates": len(all_results),
+            "duplicates_merged": found - len(all_results),
+            "platform_status": platform_status
         }
         
         self.search_results.append(search_result)
-        self._save_search_results()
+        self._save_search_results([search_result])
         
         print(f"✅ Gesamt: {len(all_results)} Kandidaten gefunden")
-        return all_results
+        return search_result
+    
+    def search_all_platforms(self, search_params: Dict, timeout: Optional[float] = None,
+                             deadline: Optional[float] = None, use_cache: bool = True) -> List[Dict]:
+        """Sucht auf allen Plattformen (parallel, Teilergebnisse bei Fehlern oder Timeouts, ohne Dubletten)"""
+        return self.search(search_params, timeout, deadline, use_cache)["results"]
+    
+    def get_cache_stats(self) -> Dict:
+        """Statistik des Ergebnis-Caches (Einträge, Treffer, Trefferquote)"""
+        if self.result_cache is None:
+            return {"enabled": False}
+        return dict(self.result_cache.stats(), enabled=True)
     
     def get_search_history(self) -> List[Dict]:
         """Gibt Suchhistorie zurück"""
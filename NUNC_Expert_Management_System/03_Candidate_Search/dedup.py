@@ -0,0 +1,253 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche
+Plattformübergreifende Dublettenerkennung und Zusammenführung von Kandidaten
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Set, Tuple
+from urllib.parse import urlsplit
+
+# Titel und Namenszusätze, die beim Namensvergleich ignoriert werden
+NAME_TITLES = {"dr", "prof", "dipl", "ing", "inf", "med", "mba", "msc", "bsc", "phd", "mag"}
+
+# Schreibweisen von Orten, die auf denselben Schlüssel abgebildet werden
+CITY_ALIASES = {
+    "munich": "muenchen",
+    "cologne": "koeln",
+    "nuremberg": "nuernberg",
+    "vienna": "wien",
+    "zurich": "zuerich",
+}
+
+# Hosts je Plattform ohne Sprach-/www-Präfix (de.linkedin.com -> linkedin.com)
+HOST_PREFIX = re.compile(r'^(?:www|[a-z]{2})\.(?=[^.]+\.[^.]+$)')
+
+UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+# Schwellen für Dubletten innerhalb eines Blocks
+NAME_SIMILARITY = 0.88
+TITLE_SIMILARITY = 0.5
+SKILL_OVERLAP = 0.3
+
+# Vergleichsfenster je Block (sortiert nach Name), hält die Laufzeit bei häufigen Namen linear
+BLOCK_WINDOW = 20
+
+
+def _fold(text: str) -> str:
+    """Kleinbuchstaben, Umlaute ausgeschrieben, übrige Akzente entfernt"""
+    text = (text or "").lower().translate(UMLAUTS)
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+def normalize_name(name: str) -> str:
+    """Name ohne Titel, Akzente und Satzzeichen ("Dr. Jürgen Groß" -> "juergen gross")"""
+    tokens = re.findall(r"[a-z]+", _fold(name))
+    return " ".join(token for token in tokens if token not in NAME_TITLES)
+
+
+def normalize_location(location: str) -> str:
+    """Stadt als Schlüssel ("München, Deutschland" -> "muenchen")"""
+    city = _fold((location or "").split(",")[0])
+    city = re.sub(r"[^a-z]+", " ", city).strip()
+    return CITY_ALIASES.get(city, city)
+
+
+def canonical_profile_url(url: str) -> str:
+    """Profil-URL ohne Schema, Sprach-/www-Präfix, Query, Fragment und abschließenden Slash"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip() if "://" in url else "https://" + url.strip())
+    host = HOST_PREFIX.sub("", parts.netloc.lower())
+    path = re.sub(r"/+$", "", parts.path)
+    return f"{host}{path.lower()}" if host else ""
+
+
+def blocking_keys(candidate: Dict) -> Set[str]:
+    """Block-Schlüssel: nur Kandidaten mit gemeinsamem Schlüssel werden verglichen
+
+    Vor- und Nachname (sortiert) bzw. Initiale + Nachname, jeweils mit Ort;
+    so landen auch "S. Weber" und "Sarah Weber" im selben Block.
+    """
+    tokens = normalize_name(candidate.get("name", "")).split()
+    if not tokens:
+        return set()
+    city = normalize_location(candidate.get("location", ""))
+    return {
+        f"{' '.join(sorted(tokens))}|{city}",
+        f"{tokens[0][0]} {tokens[-1]}|{city}",
+    }
+
+
+def _token_similarity(first: Iterable[str], second: Iterable[str]) -> float:
+    """Jaccard-Ähnlichkeit zweier Token-Mengen"""
+    first, second = set(first), set(second)
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def _comparable(candidate: Dict) -> Tuple[str, Set[str], Set[str]]:
+    """Normalisierter Name, Titel-Tokens und Skills eines Kandidaten (einmal je Kandidat)"""
+    return (normalize_name(candidate.get("name", "")),
+            set(re.findall(r"[a-z]+", _fold(candidate.get("title", "")))),
+            {_fold(skill) for skill in candidate.get("skills", [])})
+
+
+def _source(candidate: Dict) -> Tuple[str, str]:
+    """Plattform und kanonische Profil-URL eines Kandidaten"""
+    return candidate.get("platform", ""), canonical_profile_url(candidate.get("profile_url", ""))
+
+
+def _distinct_profiles(first: Tuple[str, str], second: Tuple[str, str]) -> bool:
+    """Zwei Profile derselben Plattform mit eigener Profil-URL gehören zu verschiedenen Personen"""
+    return first[0] == second[0] and bool(first[1]) and bool(second[1]) and first[1] != second[1]
+
+
+def _similar(first: Tuple[str, Set[str], Set[str]], second: Tuple[str, Set[str], Set[str]]) -> bool:
+    """Vergleich zweier vorbereiteter Kandidaten (siehe is_duplicate)"""
+    name_a, title_a, skills_a = first
+    name_b, title_b, skills_b = second
+    if SequenceMatcher(None, name_a, name_b).ratio() < NAME_SIMILARITY:
+        tokens_a, tokens_b = name_a.split(), name_b.split()
+        # Abgekürzte Vornamen ("s weber" / "sarah weber")
+        if not (tokens_a and tokens_b and tokens_a[-1] == tokens_b[-1] and tokens_a[0][0] == tokens_b[0][0]
+                and min(len(tokens_a[0]), len(tokens_b[0])) == 1):
+            return False
+    return (_token_similarity(title_a, title_b) >= TITLE_SIMILARITY
+            or _token_similarity(skills_a, skills_b) >= SKILL_OVERLAP)
+
+
+def is_duplicate(first: Dict, second: Dict) -> bool:
+    """Unscharfer Vergleich zweier Kandidaten desselben Blocks
+
+    Die Namen müssen sehr ähnlich sein (oder sich nur durch einen
+    abgekürzten Vornamen unterscheiden), zusätzlich der Titel oder die Skills.
+    Profile derselben Plattform mit verschiedenen Profil-URLs sind nie
+    Dubletten (z.B. /in/sarah-weber und /in/sarah-weber-2).
+    """
+    if _distinct_profiles(_source(first), _source(second)):
+        return False
+    return _similar(_comparable(first), _comparable(second))
+
+
+class UnionFind:
+    """Disjunkte Mengen über Listen-Indizes (Pfadkompression, Union by Size)"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, first: int, second: int):
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+
+
+def _score(candidate: Dict) -> float:
+    return candidate.get("calculated_match_score", candidate.get("match_score", 0.0))
+
+
+def merge_candidates(candidates: List[Dict]) -> Dict:
+    """Führt Dubletten zu einem Datensatz zusammen (Basis: bester Score)
+
+    Skills und Zertifikate werden vereinigt; `sources` hält je Fundstelle
+    Plattform, Profil-URL, Titel und Score (Provenienz).
+    """
+    best = max(candidates, key=_score)
+    merged = dict(best)
+    for field in ("skills", "certifications"):
+        merged[field] = list(dict.fromkeys(item for c in [best] + candidates for item in c.get(field, [])))
+    merged["sources"] = [
+        {
+            "platform": c.get("platform", ""),
+            "profile_url": c.get("profile_url", ""),
+            "title": c.get("title", ""),
+            "location": c.get("location", ""),
+            "match_score": _score(c)
+        }
+        for c in candidates
+    ]
+    merged["platforms"] = list(dict.fromkeys(c.get("platform", "") for c in candidates))
+    if any(c.get("availability") == "available" for c in candidates):
+        merged["availability"] = "available"
+    return merged
+
+
+def deduplicate_candidates(candidates: List[Dict]) -> List[Dict]:
+    """Erkennt und verschmilzt Dubletten (nahezu lineare Laufzeit)
+
+    Gleiche kanonische Profil-URLs werden direkt verbunden; sonst werden
+    nur Kandidaten mit gemeinsamem Block-Schlüssel (Name + Ort) unscharf
+    verglichen, innerhalb eines Blocks höchstens BLOCK_WINDOW Nachbarn -
+    und nur, wenn sie von verschiedenen Plattformen stammen oder einer
+    keine Profil-URL hat. Ein Cluster enthält nie zwei verschiedene
+    Profil-URLs derselben Plattform, auch nicht über Dritte verkettet.
+    Die Reihenfolge folgt dem ersten Auftreten; Einzeltreffer bleiben
+    unverändert, zusammengeführte erhalten `sources` und `platforms`.
+    """
+    clusters = UnionFind(len(candidates))
+    by_url: Dict[str, int] = {}
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    sources = [_source(candidate) for candidate in candidates]
+    # Profil-URLs je Plattform pro Cluster-Wurzel: verhindert, dass ein
+    # Profil einer anderen Plattform zwei verschiedene Profile verkettet
+    profile_urls: Dict[int, Dict[str, str]] = {
+        i: {platform: url} if url else {} for i, (platform, url) in enumerate(sources)
+    }
+
+    def merge(first: int, second: int):
+        first, second = clusters.find(first), clusters.find(second)
+        if first == second:
+            return
+        urls_a, urls_b = profile_urls[first], profile_urls[second]
+        if any(urls_a.get(platform, url) != url for platform, url in urls_b.items()):
+            return
+        clusters.union(first, second)
+        root = clusters.find(first)
+        profile_urls[root] = {**urls_a, **urls_b}
+        profile_urls.pop(second if root == first else first, None)
+
+    for i, candidate in enumerate(candidates):
+        url = sources[i][1]
+        if url:
+            if url in by_url:
+                merge(by_url[url], i)
+            else:
+                by_url[url] = i
+        for key in blocking_keys(candidate):
+            blocks[key].append(i)
+
+    comparable: Dict[int, Tuple[str, Set[str], Set[str]]] = {}
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        for i in members:
+            if i not in comparable:
+                comparable[i] = _comparable(candidates[i])
+        members = sorted(members, key=lambda i: comparable[i][0])
+        for position, i in enumerate(members):
+            for j in members[position + 1:position + 1 + BLOCK_WINDOW]:
+                if (clusters.find(i) != clusters.find(j) and not _distinct_profiles(sources[i], sources[j])
+                        and _similar(comparable[i], comparable[j])):
+                    merge(i, j)
+
+    groups: Dict[int, List[Dict]] = {}
+    for i, candidate in enumerate(candidates):
+        groups.setdefault(clusters.find(i), []).append(candidate)
+    return [group[0] if len(group) == 1 else merge_candidates(group) for group in groups.values()]
@@ -0,0 +1,283 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche
+Plattform-Provider mit gemeinsamen HTTP-Sessions, Rate-Limit und Parallelitäts-Grenze
+"""
+
+import json
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Type
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from exceptions import NetworkError
+
+USER_AGENT = "NUNC-Expert-Management-System/1.0"
+
+# Standard-Einstellungen je Provider (überschreibbar über Config.CANDIDATE_SEARCH["providers"])
+DEFAULT_PROVIDER_SETTINGS = {
+    "enabled": True,
+    "base_url": None,  # ohne URL liefert der Provider Beispieldaten (Simulation)
+    "rate_per_second": 2.0,  # Token-Bucket: Anfragen pro Sekunde ...
+    "burst": 2,  # ... und maximale Anfragen am Stück
+    "max_concurrency": 2,  # gleichzeitige Anfragen an die Plattform
+    "request_timeout": 10  # Sekunden je HTTP-Anfrage
+}
+
+
+class TokenBucket:
+    """Token-Bucket-Rate-Limiter (thread-sicher, blockierend)
+
+    Füllt sich mit `rate` Tokens pro Sekunde bis `capacity`; jede Anfrage
+    verbraucht ein Token und wartet, bis eines verfügbar ist.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Nimmt ein Token (auch auf Vorschuss) und gibt die Wartezeit zurück"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self):
+        """Wartet, bis die nächste Anfrage erlaubt ist"""
+        wait_time = self._reserve()
+        if wait_time > 0:
+            self._sleep(wait_time)
+
+
+class SessionPool:
+    """Eine requests.Session je Host (Keep-Alive, Verbindungs-Pool), thread-sicher"""
+
+    def __init__(self, pool_maxsize: int = 10):
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        """Session für den Host der URL (wird beim ersten Zugriff angelegt)"""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount(host, adapter)
+                session.headers["User-Agent"] = USER_AGENT
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        """Schließt alle Sessions"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+class CandidateProvider(ABC):
+    """Basis-Klasse einer Such-Plattform: fetch() lädt die Trefferseite, parse() extrahiert Kandidaten
+
+    Alle Anfragen laufen über die gemeinsame Session des Hosts, den
+    Token-Bucket des Providers und höchstens `max_concurrency` gleichzeitig.
+    Ohne `base_url` liefert search() die Beispieldaten aus sample_results().
+    """
+
+    name = ""
+    label = ""
+    search_path = "/"
+
+    def __init__(self, settings: Dict, sessions: SessionPool):
+        self.settings = {**DEFAULT_PROVIDER_SETTINGS, **settings}
+        self.base_url: Optional[str] = self.settings["base_url"]
+        self.sessions = sessions
+        self.limiter = TokenBucket(self.settings["rate_per_second"], self.settings["burst"])
+        self._slots = threading.BoundedSemaphore(self.settings["max_concurrency"])
+
+    def request_params(self, search_params: Dict) -> Dict:
+        """Query-Parameter der Suchanfrage"""
+        return {
+            "skills": ",".join(search_params.get("required_skills", [])),
+            "location": search_params.get("location", "")
+        }
+
+    def fetch(self, search_params: Dict) -> str:
+        """Lädt die Trefferseite der Plattform"""
+        url = urljoin(self.base_url, self.search_path)
+        with self._slots:
+            self.limiter.acquire()
+            try:
+                response = self.sessions.session_for(url).get(url, params=self.request_params(search_params),
+                                                              timeout=self.settings["request_timeout"])
+                response.raise_for_status()
+            except requests.RequestException as e:
+                raise NetworkError(url, str(e)) from e
+            return response.text
+
+    @abstractmethod
+    def parse(self, content: str) -> List[Dict]:
+        """Extrahiert Kandidaten (Format wie CandidateSearch._filter_candidates) aus der Trefferseite"""
+        raise NotImplementedError("Subclasses must implement parse")
+
+    def sample_results(self) -> List[Dict]:
+        """Beispieldaten, solange keine base_url konfiguriert ist"""
+        return []
+
+    def search(self, search_params: Dict) -> List[Dict]:
+        """Ungefilterte Kandidaten der Plattform"""
+        if not self.base_url:
+            return [dict(candidate) for candidate in self.sample_results()]
+        return self.parse(self.fetch(search_params))
+
+
+# Registrierte Provider nach Name (Reihenfolge = Reihenfolge der Ergebnisliste)
+PROVIDERS: Dict[str, Type[CandidateProvider]] = {}
+
+
+def register_provider(provider_class: Type[CandidateProvider]) -> Type[CandidateProvider]:
+    """Klassen-Dekorator: macht einen Provider für CandidateSearch verfügbar"""
+    PROVIDERS[provider_class.name] = provider_class
+    return provider_class
+
+
+def _years(text: str) -> str:
+    """Erfahrungsangabe im Format "N Jahre" """
+    numbers = re.findall(r'\d+', text or "")
+    return f"{numbers[0]} Jahre" if numbers else ""
+
+
+@register_provider
+class LinkedInProvider(CandidateProvider):
+    """LinkedIn-Personensuche (JSON-Antwort)"""
+
+    name = "linkedin"
+    label = "LinkedIn"
+    search_path = "/search/people"
+
+    def parse(self, content: str) -> List[Dict]:
+        candidates = []
+        for element in json.loads(content).get("elements", []):
+            candidates.append({
+                "platform": self.name,
+                "name": element.get("fullName", ""),
+                "title": element.get("headline", ""),
+                "location": element.get("location", ""),
+                "experience": _years(str(element.get("experienceYears", ""))),
+                "skills": element.get("skills", []),
+                "certifications": element.get("certifications", []),
+                "profile_url": element.get("profileUrl", ""),
+                "availability": "available" if element.get("openToWork") else "busy"
+            })
+        return candidates
+
+    def sample_results(self) -> List[Dict]:
+        # Simulierte LinkedIn-Suche (in Produktion würde hier die LinkedIn API verwendet)
+        return [
+            {
+                "platform": "linkedin",
+                "name": "Dr. Sarah Weber",
+                "title": "Senior Salesforce Consultant",
+                "location": "München, Deutschland",
+                "experience": "8 Jahre",
+                "skills": ["Salesforce", "CRM", "Python", "Agile"],
+                "certifications": ["Salesforce Certified Administrator", "PMP"],
+                "profile_url": "https://linkedin.com/in/sarah-weber",
+                "availability": "available",
+                "match_score": 0.95
+            },
+            {
+                "platform": "linkedin",
+                "name": "Michael Schmidt",
+                "title": "Salesforce Developer",
+                "location": "Berlin, Deutschland",
+                "experience": "5 Jahre",
+                "skills": ["Salesforce", "Apex", "Lightning", "JavaScript"],
+                "certifications": ["Salesforce Certified Developer"],
+                "profile_url": "https://linkedin.com/in/michael-schmidt",
+                "availability": "available",
+                "match_score": 0.88
+            }
+        ]
+
+
+@register_provider
+class FreelancermapProvider(CandidateProvider):
+    """Freelancermap-Freelancersuche (HTML-Trefferliste)"""
+
+    name = "freelancermap"
+    label = "Freelancermap"
+    search_path = "/freelancer-verzeichnis"
+
+    def parse(self, content: str) -> List[Dict]:
+        soup = BeautifulSoup(content, "html.parser")
+        candidates = []
+        for card in soup.select(".freelancer-card"):
+            def text(selector: str) -> str:
+                node = card.select_one(selector)
+                return node.get_text(strip=True) if node else ""
+
+            link = card.select_one("a.profile-link")
+            candidates.append({
+                "platform": self.name,
+                "name": text(".name"),
+                "title": text(".title"),
+                "location": text(".location"),
+                "experience": _years(text(".experience")),
+                "skills": [li.get_text(strip=True) for li in card.select(".skills li")],
+                "certifications": [li.get_text(strip=True) for li in card.select(".certifications li")],
+                "profile_url": urljoin(self.base_url, link["href"]) if link and link.get("href") else "",
+                "availability": "available" if "available" in card.get("class", []) else "busy"
+            })
+        return candidates
+
+    def sample_results(self) -> List[Dict]:
+        # Simulierte Freelancermap-Suche
+        return [
+            {
+                "platform": "freelancermap",
+                "name": "Thomas Müller",
+                "title": "Freelance Salesforce Consultant",
+                "location": "Hamburg, Deutschland",
+                "experience": "6 Jahre",
+                "skills": ["Salesforce", "CRM", "Integration", "Consulting"],
+                "certifications": ["Salesforce Certified Administrator"],
+                "profile_url": "https://freelancermap.de/profile/thomas-mueller",
+                "availability": "available",
+                "match_score": 0.92
+            },
+            {
+                "platform": "freelancermap",
+                "name": "Anna Fischer",
+                "title": "Salesforce Technical Architect",
+                "location": "Stuttgart, Deutschland",
+                "experience": "10 Jahre",
+                "skills": ["Salesforce", "Architecture", "Integration", "Leadership"],
+                "certifications": ["Salesforce Certified Technical Architect"],
+                "profile_url": "https://freelancermap.de/profile/anna-fischer",
+                "availability": "busy",
+                "match_score": 0.85
+            }
+        ]
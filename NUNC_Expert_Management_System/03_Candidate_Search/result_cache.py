@@ -0,0 +1,132 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche
+TTL-/LRU-Cache der Plattform-Ergebnisse je kanonisierten Suchparametern
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def normalize_search_params(search_params: Dict) -> Dict:
+    """Kanonische Form der Suchparameter (Grundlage für Filter und Cache-Schlüssel)
+
+    Skills werden getrimmt, dedupliziert und sortiert (Groß-/Kleinschreibung
+    bleibt, da der Skill-Vergleich sie berücksichtigt), der Ort in
+    Kleinbuchstaben mit einfachen Leerzeichen, Zahlen als Zahl. Übrige
+    Parameter bleiben unverändert. Mehrfaches Anwenden ändert nichts mehr.
+    """
+    params = dict(search_params)
+    params["required_skills"] = sorted({skill.strip() for skill in params.get("required_skills", []) if skill.strip()})
+    params["location"] = re.sub(r"\s+", " ", params.get("location", "")).strip().lower()
+    params["min_experience"] = float(params.get("min_experience", 0) or 0)
+    if "min_match_score" in params:
+        params["min_match_score"] = float(params["min_match_score"])
+    return params
+
+
+def canonical_params(search_params: Dict) -> str:
+    """Kanonischer Schlüssel der Suchparameter (siehe normalize_search_params)"""
+    return json.dumps(normalize_search_params(search_params), sort_keys=True, ensure_ascii=False)
+
+
+class SearchResultCache:
+    """Cache der gefilterten Ergebnisse je (Plattform, Suchparameter).
+
+    Einträge verfallen nach der TTL der Plattform (`ttls`, sonst `ttl`
+    Sekunden); über `max_entries` wird der am längsten ungenutzte Eintrag
+    verdrängt. Mit `persist_file` wird der Cache nach jeder Änderung als
+    JSON gespeichert und beim Start wieder geladen (Ablaufzeiten als
+    Unix-Zeit, damit sie einen Neustart überdauern).
+    """
+
+    def __init__(self, ttl: float = 3600, ttls: Optional[Dict[str, float]] = None, max_entries: int = 1000,
+                 persist_file: Optional[Path] = None, clock: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self.persist_file = Path(persist_file) if persist_file else None
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.persist_file is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, platform: str, search_params: Dict) -> Optional[List[Dict]]:
+        """Gültige Ergebnisse (Kopien) oder None"""
+        key = (platform, canonical_params(search_params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [dict(candidate) for candidate in entry[1]]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, platform: str, search_params: Dict, results: List[Dict]):
+        """Speichert die Ergebnisse einer Plattform"""
+        ttl = self.ttls.get(platform, self.ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        key = (platform, canonical_params(search_params))
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, [dict(candidate) for candidate in results])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._persist()
+
+    def clear(self):
+        """Leert den Cache"""
+        with self._lock:
+            self._entries.clear()
+            self._persist()
+
+    def _load(self):
+        """Lädt nicht abgelaufene Einträge aus der Cache-Datei"""
+        if not self.persist_file.exists():
+            return
+        try:
+            with open(self.persist_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Such-Cache konnte nicht geladen werden: {e}")
+            return
+        now = self._clock()
+        for platform, key, expires_at, results in entries[-self.max_entries:]:
+            if expires_at > now:
+                self._entries[(platform, key)] = (expires_at, results)
+
+    def _persist(self):
+        """Schreibt den Cache in die Cache-Datei (Aufruf unter Lock)"""
+        if self.persist_file is None:
+            return
+        entries = [[platform, key, expires_at, results]
+                   for (platform, key), (expires_at, results) in self._entries.items()]
+        self.persist_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.persist_file.with_name(self.persist_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        tmp_file.replace(self.persist_file)
+
+    def stats(self) -> Dict:
+        """Cache-Statistik"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,4 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche Tests
+Unit-Tests für CandidateSearch
+"""
@@ -0,0 +1,106 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche Tests
+Unit-Tests für die parallele Plattform-Suche
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from candidate_search import CandidateSearch
+
+
+def make_platform(name, delay=0.0, error=None):
+    """Plattform-Suche, die nach `delay` Sekunden einen Kandidaten liefert"""
+    def search(search_params):
+        time.sleep(delay)
+        if error:
+            raise RuntimeError(error)
+        return [{"platform": name, "name": f"Kandidat {name}"}]
+    return search
+
+
+@pytest.fixture
+def searcher(tmp_path, monkeypatch):
+    """CandidateSearch mit leerem Speicher im temporären Verzeichnis"""
+    monkeypatch.chdir(tmp_path)
+    searcher = CandidateSearch()
+    yield searcher
+    searcher.close()
+
+
+class TestConcurrentSearch:
+    """Test-Klasse für die parallele Abfrage der Plattformen"""
+
+    def test_simulated_platforms(self, searcher):
+        """Test die eingebauten Plattformen liefern wie bisher gefilterte Ergebnisse"""
+        results = searcher.search_all_platforms({"required_skills": ["Salesforce", "CRM"], "min_match_score": 0.7})
+        assert [c["name"] for c in results] == ["Dr. Sarah Weber", "Thomas Müller"]
+        assert searcher.get_search_history()[-1]["platform_status"]["linkedin"]["status"] == "ok"
+
+    def test_latency_is_slowest_platform(self, searcher):
+        """Test die Laufzeit entspricht der langsamsten statt der Summe der Plattformen"""
+        searcher.platforms = {name: make_platform(name, delay=0.3) for name in ("a", "b", "c")}
+        start = time.monotonic()
+        results = searcher.search_all_platforms({})
+        assert time.monotonic() - start < 0.6
+        assert [c["platform"] for c in results] == ["a", "b", "c"]
+
+    def test_timeout_and_error_give_partial_results(self, searcher):
+        """Test Timeouts und Fehler einzelner Plattformen liefern Teilergebnisse mit Status"""
+        searcher.platforms = {
+            "fast": make_platform("fast"),
+            "slow": make_platform("slow", delay=1.0),
+            "broken": make_platform("broken", error="HTTP 503"),
+        }
+        start = time.monotonic()
+        search_result = searcher.search({}, timeout=0.2)
+        assert time.monotonic() - start < 0.6
+
+        status = search_result["platform_status"]
+        assert [c["platform"] for c in search_result["results"]] == ["fast"]
+        assert (status["fast"]["status"], status["fast"]["count"]) == ("ok", 1)
+        assert status["slow"]["status"] == "timeout"
+        assert (status["broken"]["status"], status["broken"]["error"]) == ("error", "HTTP 503")
+
+    def test_deadline_caps_provider_timeouts(self, searcher):
+        """Test die globale Deadline begrenzt auch großzügige Plattform-Timeouts"""
+        searcher.search_config["provider_timeouts"] = {"slow": 5}
+        searcher.platforms = {"fast": make_platform("fast", delay=0.05), "slow": make_platform("slow", delay=1.0)}
+        start = time.monotonic()
+        outcomes = searcher.search_platforms({}, deadline=0.2)
+        assert time.monotonic() - start < 0.6
+        assert {name: o["status"] for name, o in outcomes.items()} == {"fast": "ok", "slow": "timeout"}
+
+
+class TestStreamingSearch:
+    """Test-Klasse für die Ergebnis-Lieferung je Plattform"""
+
+    def test_first_result_arrives_with_fastest_platform(self, searcher):
+        """Test Ergebnisse kommen in Eintreffens-Reihenfolge, das erste nach der schnellsten Plattform"""
+        searcher.platforms = {"slow": make_platform("slow", delay=0.4), "fast": make_platform("fast", delay=0.05)}
+        start = time.monotonic()
+        stream = searcher.search_stream({})
+
+        first = next(stream)
+        assert time.monotonic() - start < 0.3
+        assert (first["type"], first["platform"], first["status"]) == ("platform", "fast", "ok")
+        assert first["candidates"] == [{"platform": "fast", "name": "Kandidat fast"}]
+
+        rest = list(stream)
+        assert [event.get("platform") for event in rest] == ["slow", None]
+        done = rest[-1]
+        assert (done["type"], done["total_candidates"]) == ("done", 2)
+        assert searcher.get_search_history()[-1]["id"] == done["search_id"]
+
+    def test_stream_reports_failures(self, searcher):
+        """Test Fehler und Timeouts erscheinen als eigene Plattform-Ereignisse"""
+        searcher.platforms = {"broken": make_platform("broken", error="HTTP 500"),
+                              "slow": make_platform("slow", delay=1.0)}
+        events = list(searcher.search_stream({}, timeout=0.2))
+        assert [(e["platform"], e["status"]) for e in events[:-1]] == [("broken", "error"), ("slow", "timeout")]
+        assert events[-1]["platform_status"]["slow"]["status"] == "timeout"
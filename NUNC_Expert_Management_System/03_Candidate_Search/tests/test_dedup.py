@@ -0,0 +1,148 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche Tests
+Unit-Tests für die plattformübergreifende Dublettenerkennung
+"""
+
+import random
+import time
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from candidate_search import CandidateSearch
+from dedup import canonical_profile_url, deduplicate_candidates, is_duplicate, normalize_location, normalize_name
+
+
+def make_candidate(name, platform="linkedin", location="München, Deutschland", title="Salesforce Consultant",
+                   skills=("Salesforce", "CRM"), url="", score=0.8):
+    return {"platform": platform, "name": name, "title": title, "location": location, "skills": list(skills),
+            "certifications": [], "profile_url": url, "availability": "busy", "calculated_match_score": score}
+
+
+class TestNormalization:
+    """Test-Klasse für Namen, Orte und Profil-URLs"""
+
+    def test_names_and_locations(self):
+        """Test Titel, Umlaute und Satzzeichen werden vereinheitlicht"""
+        assert normalize_name("Dr. Jürgen Groß") == "juergen gross"
+        assert normalize_name("Juergen  Gross") == "juergen gross"
+        assert normalize_location("München, Deutschland") == normalize_location("Munich") == "muenchen"
+
+    def test_profile_urls(self):
+        """Test Schema, Sprach-Subdomain, Query und Slash werden entfernt"""
+        expected = "linkedin.com/in/sarah-weber"
+        for url in ("https://www.linkedin.com/in/sarah-weber/", "http://de.linkedin.com/in/Sarah-Weber?trk=abc",
+                    "linkedin.com/in/sarah-weber#about"):
+            assert canonical_profile_url(url) == expected
+
+
+class TestDeduplication:
+    """Test-Klasse für Erkennung und Zusammenführung"""
+
+    def test_cross_platform_duplicate_is_merged(self):
+        """Test dieselbe Person auf zwei Plattformen wird zu einem Datensatz mit Provenienz"""
+        candidates = [
+            make_candidate("Dr. Sarah Weber", url="https://linkedin.com/in/sarah-weber", score=0.8),
+            make_candidate("Michael Schmidt", location="Berlin"),
+            make_candidate("Sarah Weber", platform="freelancermap", location="Muenchen",
+                           title="Freelance Salesforce Consultant", skills=("Salesforce", "Apex"),
+                           url="https://freelancermap.de/profile/sarah-weber", score=0.9),
+        ]
+        merged, single = deduplicate_candidates(candidates)
+
+        assert single is candidates[1]
+        assert merged["platforms"] == ["linkedin", "freelancermap"]
+        assert merged["calculated_match_score"] == 0.9
+        assert merged["skills"] == ["Salesforce", "Apex", "CRM"]
+        assert [(s["platform"], s["profile_url"]) for s in merged["sources"]] == [
+            ("linkedin", "https://linkedin.com/in/sarah-weber"),
+            ("freelancermap", "https://freelancermap.de/profile/sarah-weber"),
+        ]
+
+    def test_same_url_merges_across_blocks(self):
+        """Test gleiche kanonische Profil-URL verbindet auch abweichende Namen"""
+        candidates = [make_candidate("Sarah Weber", url="https://www.linkedin.com/in/sarah-weber"),
+                      make_candidate("Sarah Weber-Klein", location="", url="linkedin.com/in/sarah-weber/")]
+        assert len(deduplicate_candidates(candidates)) == 1
+
+    def test_similar_but_different_people_stay_apart(self):
+        """Test gleiche Namen in anderen Städten oder mit anderem Profil bleiben getrennt"""
+        assert not is_duplicate(make_candidate("Anna Fischer"),
+                                make_candidate("Anna Fischer", title="Pflegekraft", skills=("Pflege",)))
+        candidates = [make_candidate("Anna Fischer"), make_candidate("Anna Fischer", location="Hamburg")]
+        assert len(deduplicate_candidates(candidates)) == 2
+
+    def test_same_platform_profiles_stay_apart(self):
+        """Test zwei LinkedIn-Profile mit verschiedenen URLs werden nicht zusammengeführt"""
+        first = make_candidate("Sarah Weber", url="https://linkedin.com/in/sarah-weber", skills=("Salesforce", "CRM"))
+        second = make_candidate("Sarah Weber", url="https://linkedin.com/in/sarah-weber-2", skills=("Salesforce", "SAP"))
+        assert not is_duplicate(first, second)
+        assert deduplicate_candidates([first, second]) == [first, second]
+
+        # Ohne URL oder von einer anderen Plattform bleibt der unscharfe Vergleich
+        without_url = make_candidate("Sarah Weber", skills=("Salesforce", "SAP"))
+        other_platform = make_candidate("Sarah Weber", platform="freelancermap", skills=("Salesforce", "SAP"),
+                                        url="https://freelancermap.de/profile/sarah-weber")
+        assert is_duplicate(first, without_url)
+        assert is_duplicate(first, other_platform)
+
+    def test_other_platform_does_not_chain_same_platform_profiles(self):
+        """Test ein Xing-Profil ohne URL verkettet keine zwei LinkedIn-Profile"""
+        first = make_candidate("Sarah Weber", url="https://linkedin.com/in/sarah-weber")
+        bridge = make_candidate("Sarah Weber", platform="xing")
+        second = make_candidate("Sarah Weber", url="https://linkedin.com/in/sarah-weber-2")
+
+        results = deduplicate_candidates([first, bridge, second])
+
+        assert len(results) == 2
+        merged = results[0]
+        assert {source["platform"] for source in merged["sources"]} == {"linkedin", "xing"}
+        assert results[1] == second
+
+    def test_abbreviated_first_name(self):
+        """Test abgekürzte Vornamen werden erkannt"""
+        assert is_duplicate(make_candidate("S. Weber"), make_candidate("Sarah Weber"))
+        assert not is_duplicate(make_candidate("T. Weber"), make_candidate("Sarah Weber"))
+
+    def test_near_linear_runtime(self):
+        """Test tausende Treffer mit vielen Dubletten werden schnell zusammengeführt"""
+        rng = random.Random(3)
+        first_names = ["Anna", "Jonas", "Lena", "Paul", "Marie", "Felix", "Laura", "Lukas"]
+        cities = ["München", "Berlin", "Hamburg", "Köln", "Stuttgart"]
+        last_names = {"".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8)).title() for _ in range(2500)}
+        people = [(f"{rng.choice(first_names)} {last}", rng.choice(cities)) for last in sorted(last_names)]
+        candidates = [make_candidate(name, platform=platform, location=city)
+                      for platform in ("linkedin", "freelancermap") for name, city in people]
+
+        start = time.perf_counter()
+        result = deduplicate_candidates(candidates)
+        assert time.perf_counter() - start < 2.0
+        assert len(result) == len(people)
+        assert all(c["platforms"] == ["linkedin", "freelancermap"] for c in result)
+
+
+class TestSearchDeduplication:
+    """Test-Klasse für die Dublettenerkennung in der Suche"""
+
+    def test_search_merges_platform_duplicates(self, tmp_path, monkeypatch):
+        """Test search_all_platforms liefert jede Person nur einmal"""
+        monkeypatch.chdir(tmp_path)
+        searcher = CandidateSearch()
+        searcher.platforms = {
+            "linkedin": lambda params: [make_candidate("Thomas Müller", location="Hamburg")],
+            "freelancermap": lambda params: [make_candidate("Thomas Mueller", platform="freelancermap",
+                                                            location="Hamburg, Deutschland")],
+        }
+        try:
+            search_result = searcher.search({})
+            events = list(searcher.search_stream({}, use_cache=False))
+        finally:
+            searcher.close()
+
+        assert len(search_result["results"]) == 1
+        assert search_result["duplicates_merged"] == 1
+        assert search_result["platform_status"]["freelancermap"]["count"] == 1
+        assert events[-1]["merged"][0]["platforms"] == ["linkedin", "freelancermap"]
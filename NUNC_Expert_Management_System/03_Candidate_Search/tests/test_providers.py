@@ -0,0 +1,206 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche Tests
+Unit-Tests für die Plattform-Provider gegen einen lokalen Stub-Server
+"""
+
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from candidate_search import CandidateSearch
+from config import Config
+from exceptions import NetworkError
+from providers import FreelancermapProvider, LinkedInProvider, SessionPool, TokenBucket
+
+FIXTURES = Path(__file__).parent / "fixtures"
+ROUTES = {
+    "/search/people": ("linkedin_search.json", "application/json"),
+    "/freelancer-verzeichnis": ("freelancermap_search.html", "text/html; charset=utf-8"),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Liefert die Fixture-Seiten per HTTP/1.1 mit Keep-Alive"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        with server.lock:
+            server.requests.append((parts.path, parse_qs(parts.query)))
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            route = ROUTES.get(parts.path)
+            if route is None:
+                body, status, content_type = b"not found", 404, "text/plain"
+            else:
+                body, status, content_type = (FIXTURES / route[0]).read_bytes(), 200, route[1]
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Lokaler HTTP-Server mit Fixture-Seiten"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests, server.connections = [], set()
+    server.active = server.max_active = 0
+    server.delay = 0.0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sessions():
+    pool = SessionPool()
+    yield pool
+    pool.close()
+
+
+class TestProviders:
+    """Test-Klasse für Abruf und Parsing der Plattformen"""
+
+    def test_linkedin_fetch_and_parse(self, stub_server, sessions):
+        """Test LinkedIn-JSON wird abgerufen und in Kandidaten umgesetzt"""
+        provider = LinkedInProvider({"base_url": stub_server.url}, sessions)
+        candidates = provider.search({"required_skills": ["Salesforce", "CRM"], "location": "München"})
+
+        assert [c["name"] for c in candidates] == ["Julia Brandt", "Kai Neumann"]
+        assert candidates[0]["experience"] == "9 Jahre"
+        assert [c["availability"] for c in candidates] == ["available", "busy"]
+        assert stub_server.requests[0] == ("/search/people", {"skills": ["Salesforce,CRM"], "location": ["München"]})
+
+    def test_freelancermap_fetch_and_parse(self, stub_server, sessions):
+        """Test Freelancermap-HTML wird mit BeautifulSoup geparst"""
+        provider = FreelancermapProvider({"base_url": stub_server.url}, sessions)
+        first, second = provider.search({})
+
+        assert (first["name"], first["location"], first["experience"]) == ("Lena Hoffmann", "München", "7 Jahre")
+        assert first["skills"] == ["Salesforce", "CRM", "SAP"]
+        assert first["profile_url"] == f"{stub_server.url}/profile/lena-hoffmann"
+        assert (first["availability"], second["availability"]) == ("available", "busy")
+        assert second["certifications"] == []
+
+    def test_without_base_url_returns_samples(self, sessions):
+        """Test ohne base_url liefern die Provider die bisherigen Beispieldaten"""
+        samples = LinkedInProvider({}, sessions).search({})
+        assert [c["name"] for c in samples] == ["Dr. Sarah Weber", "Michael Schmidt"]
+
+    def test_http_errors_raise_network_error(self, stub_server, sessions):
+        """Test HTTP-Fehler werden als NetworkError gemeldet"""
+        class MissingProvider(LinkedInProvider):
+            search_path = "/missing"
+
+        with pytest.raises(NetworkError):
+            MissingProvider({"base_url": stub_server.url}, sessions).search({})
+
+    def test_connections_are_reused(self, stub_server, sessions):
+        """Test alle Anfragen an einen Host laufen über eine Keep-Alive-Verbindung"""
+        linkedin = LinkedInProvider({"base_url": stub_server.url, "rate_per_second": 1000, "burst": 10}, sessions)
+        freelancermap = FreelancermapProvider({"base_url": stub_server.url}, sessions)
+        for _ in range(3):
+            linkedin.search({})
+        freelancermap.search({})
+
+        assert len(stub_server.requests) == 4
+        assert len(stub_server.connections) == 1
+
+    def test_concurrency_cap(self, stub_server, sessions):
+        """Test höchstens max_concurrency gleichzeitige Anfragen je Provider"""
+        stub_server.delay = 0.1
+        provider = LinkedInProvider({"base_url": stub_server.url, "max_concurrency": 2,
+                                     "rate_per_second": 1000, "burst": 10}, sessions)
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(lambda _: provider.search({}), range(6)))
+
+        assert len(stub_server.requests) == 6
+        assert stub_server.max_active == 2
+
+    def test_rate_limit_spreads_bursts(self, stub_server, sessions):
+        """Test der Token-Bucket verteilt Anfragen über die Zeit"""
+        provider = LinkedInProvider({"base_url": stub_server.url, "rate_per_second": 20, "burst": 1}, sessions)
+        start = time.monotonic()
+        for _ in range(5):
+            provider.search({})
+        assert time.monotonic() - start >= 0.19
+
+
+class TestTokenBucket:
+    """Test-Klasse für den Rate-Limiter"""
+
+    def test_waits_for_refill(self):
+        """Test nach dem Burst wird auf neue Tokens gewartet"""
+        now = [0.0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            bucket.acquire()
+        assert waits == [0.5, 0.5]
+
+        now[0] += 10
+        bucket.acquire()
+        bucket.acquire()
+        assert waits == [0.5, 0.5]
+
+
+class TestSearchWithProviders:
+    """Test-Klasse für CandidateSearch mit konfigurierten Providern"""
+
+    def test_search_all_platforms_against_stub(self, stub_server, tmp_path, monkeypatch):
+        """Test die Suche nutzt die registrierten Provider und filtert deren Treffer"""
+        monkeypatch.chdir(tmp_path)
+        config = Config()
+        config.CANDIDATE_SEARCH["providers"] = {
+            "linkedin": {"base_url": stub_server.url},
+            "freelancermap": {"base_url": stub_server.url},
+        }
+        searcher = CandidateSearch(config=config)
+        try:
+            results = searcher.search_all_platforms({"required_skills": ["Salesforce", "CRM"],
+                                                     "location": "München", "min_match_score": 0.7})
+        finally:
+            searcher.close()
+
+        assert [(c["platform"], c["name"]) for c in results] == \
+            [("linkedin", "Julia Brandt"), ("freelancermap", "Lena Hoffmann")]
+
+    def test_disabled_provider(self, tmp_path, monkeypatch):
+        """Test deaktivierte Provider werden nicht abgefragt"""
+        monkeypatch.chdir(tmp_path)
+        config = Config()
+        config.CANDIDATE_SEARCH["providers"] = {"linkedin": {"enabled": False}}
+        searcher = CandidateSearch(config=config)
+        searcher.close()
+        assert list(searcher.platforms) == ["freelancermap"]
@@ -0,0 +1,149 @@
+"""
+NUNC Expert Management System - Kandidaten-Suche Tests
+Unit-Tests für den Ergebnis-Cache der Kandidaten-Suche
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from candidate_search import CandidateSearch
+from result_cache import SearchResultCache, canonical_params
+
+PARAMS = {"required_skills": ["Salesforce", "CRM"], "location": "München", "min_experience": 3}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCanonicalParams:
+    """Test-Klasse für die Schlüssel-Bildung"""
+
+    def test_equivalent_params_share_key(self):
+        """Test Reihenfolge der Skills und Schreibweise des Orts spielen keine Rolle"""
+        variant = {"location": "  münchen ", "required_skills": ["CRM", "Salesforce ", "CRM"], "min_experience": 3.0}
+        assert canonical_params(variant) == canonical_params(PARAMS)
+
+    def test_relevant_differences_change_key(self):
+        """Test abweichende Skills, Erfahrung oder Mindest-Score ergeben neue Schlüssel"""
+        keys = {canonical_params(PARAMS),
+                canonical_params(dict(PARAMS, required_skills=["salesforce", "CRM"])),
+                canonical_params(dict(PARAMS, min_experience=5)),
+                canonical_params(dict(PARAMS, min_match_score=0.7))}
+        assert len(keys) == 4
+
+
+class TestSearchResultCache:
+    """Test-Klasse für TTL, LRU und Persistenz"""
+
+    def test_per_platform_ttl(self):
+        """Test Einträge verfallen nach der TTL ihrer Plattform"""
+        clock = FakeClock()
+        cache = SearchResultCache(ttl=100, ttls={"linkedin": 10}, clock=clock)
+        cache.put("linkedin", PARAMS, [{"name": "A"}])
+        cache.put("freelancermap", PARAMS, [{"name": "B"}])
+
+        clock.now += 50
+        assert cache.get("linkedin", PARAMS) is None
+        assert cache.get("freelancermap", PARAMS) == [{"name": "B"}]
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Test über max_entries wird der am längsten ungenutzte Eintrag verdrängt"""
+        cache = SearchResultCache(max_entries=2)
+        for skill in ("A", "B"):
+            cache.put("linkedin", {"required_skills": [skill]}, [])
+        cache.get("linkedin", {"required_skills": ["A"]})
+        cache.put("linkedin", {"required_skills": ["C"]}, [])
+
+        assert cache.get("linkedin", {"required_skills": ["B"]}) is None
+        assert cache.get("linkedin", {"required_skills": ["A"]}) == []
+
+    def test_results_are_copies(self):
+        """Test Änderungen an gelieferten Kandidaten verändern den Cache nicht"""
+        cache = SearchResultCache()
+        cache.put("linkedin", PARAMS, [{"name": "A"}])
+        cache.get("linkedin", PARAMS)[0]["name"] = "X"
+        assert cache.get("linkedin", PARAMS) == [{"name": "A"}]
+
+    def test_persistence_across_restarts(self, tmp_path):
+        """Test gültige Einträge werden aus der Cache-Datei geladen, abgelaufene verworfen"""
+        clock = FakeClock()
+        cache_file = tmp_path / "cache.json"
+        cache = SearchResultCache(ttl=100, ttls={"linkedin": 10}, persist_file=cache_file, clock=clock)
+        cache.put("linkedin", PARAMS, [{"name": "A"}])
+        cache.put("freelancermap", PARAMS, [{"name": "B"}])
+
+        clock.now += 50
+        restarted = SearchResultCache(ttl=100, persist_file=cache_file, clock=clock)
+        assert len(restarted) == 1
+        assert restarted.get("freelancermap", PARAMS) == [{"name": "B"}]
+
+
+class TestCachedSearch:
+    """Test-Klasse für den Cache vor search_all_platforms"""
+
+    @pytest.fixture
+    def searcher(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        searcher = CandidateSearch()
+        calls = []
+
+        def search(search_params):
+            calls.append(search_params)
+            time.sleep(0.05)
+            return [{"platform": "stub", "name": "Kandidat"}]
+
+        searcher.platforms = {"stub": search}
+        searcher.calls = calls
+        yield searcher
+        searcher.close()
+
+    def test_repeat_search_is_served_from_cache(self, searcher):
+        """Test eine wiederholte Suche fragt die Plattform nicht erneut ab"""
+        first = searcher.search(PARAMS)
+        second = searcher.search(dict(PARAMS, required_skills=["CRM", "Salesforce"]))
+
+        assert len(searcher.calls) == 1
+        assert second["results"] == first["results"]
+        assert second["platform_status"]["stub"]["cached"] is True
+        assert searcher.get_cache_stats()["hits"] == 1
+
+    def test_failures_are_not_cached(self, searcher):
+        """Test fehlgeschlagene Abfragen werden beim nächsten Mal wiederholt"""
+        searcher.platforms["broken"] = lambda params: 1 / 0
+        searcher.search(PARAMS)
+        searcher.search(PARAMS)
+        assert searcher.result_cache.get("broken", PARAMS) is None
+
+    def test_use_cache_false_refreshes(self, searcher):
+        """Test use_cache=False fragt die Plattformen erneut ab und aktualisiert den Cache"""
+        searcher.search(PARAMS)
+        searcher.search(PARAMS, use_cache=False)
+        assert len(searcher.calls) == 2
+
+    def test_cached_and_fresh_results_agree(self, tmp_path, monkeypatch):
+        """Test Filter und Cache-Schlüssel nutzen dieselben kanonischen Parameter"""
+        monkeypatch.chdir(tmp_path)
+        searcher = CandidateSearch()
+        messy = {"required_skills": ["Salesforce", "Salesforce ", "CRM"], "location": " München ",
+                 "min_experience": 3, "min_match_score": 0.9}
+        try:
+            fresh = searcher.search_platforms(messy, use_cache=False)["linkedin"]["results"]
+            cached = searcher.search_platforms(dict(messy, location="München"))["linkedin"]
+        finally:
+            searcher.close()
+
+        assert [c["name"] for c in fresh] == ["Dr. Sarah Weber"]
+        assert fresh[0]["calculated_match_score"] == 1.0
+        assert cached["cached"] is True
+        assert cached["results"] == fresh
@@ -0,0 +1,194 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Min-Cost-Flow-Solver für die kapazitätsbeschränkte Zuordnung Experten -> Projekte
+"""
+
+import heapq
+from collections import deque
+from typing import Dict, Hashable, List, Tuple
+
+# Scores werden als ganzzahlige Kosten pro Stunde geführt (exakte reduzierte Kosten)
+COST_SCALE = 10 ** 6
+
+INFINITY = float("inf")
+
+
+class MinCostFlow:
+    """Min-Cost-Flow über Residualgraph mit Knoten-Potentialen (Primal-Dual).
+
+    Je Phase bestimmt Dijkstra die kürzesten Wege bzgl. reduzierter Kosten;
+    danach wird über alle Kanten mit reduzierten Kosten 0 so viel Fluss wie
+    möglich geschickt (mehrere Pfade je Phase). Kosten müssen ganzzahlig
+    sein, negative Kosten sind erlaubt (Start-Potentiale per Bellman-Ford).
+    """
+
+    def __init__(self, node_count: int):
+        self.node_count = node_count
+        self._graph: List[List[int]] = [[] for _ in range(node_count)]
+        self._to: List[int] = []
+        self._cap: List[int] = []
+        self._cost: List[int] = []
+
+    def add_edge(self, source: int, target: int, capacity: int, cost: int) -> int:
+        """Fügt eine Kante hinzu und gibt ihren Index (für flow()) zurück"""
+        index = len(self._to)
+        self._to += [target, source]
+        self._cap += [capacity, 0]
+        self._cost += [cost, -cost]
+        self._graph[source].append(index)
+        self._graph[target].append(index + 1)
+        return index
+
+    def flow(self, edge: int) -> int:
+        """Fluss über eine mit add_edge angelegte Kante"""
+        return self._cap[edge ^ 1]
+
+    def _initial_potentials(self, source: int) -> List[float]:
+        """Kürzeste Wege ab `source` (Bellman-Ford/SPFA, negative Kosten erlaubt)"""
+        dist = [INFINITY] * self.node_count
+        dist[source] = 0
+        queue = deque([source])
+        queued = [False] * self.node_count
+        queued[source] = True
+        while queue:
+            u = queue.popleft()
+            queued[u] = False
+            for e in self._graph[u]:
+                if self._cap[e] > 0:
+                    v = self._to[e]
+                    candidate = dist[u] + self._cost[e]
+                    if candidate < dist[v]:
+                        dist[v] = candidate
+                        if not queued[v]:
+                            queued[v] = True
+                            queue.append(v)
+        return [d if d < INFINITY else 0 for d in dist]
+
+    def _dijkstra(self, source: int, potential: List[float]) -> List[float]:
+        """Kürzeste Wege ab `source` bzgl. reduzierter Kosten"""
+        dist = [INFINITY] * self.node_count
+        dist[source] = 0
+        heap = [(0, source)]
+        graph, to, cap, cost = self._graph, self._to, self._cap, self._cost
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            pu = potential[u]
+            for e in graph[u]:
+                if cap[e] > 0:
+                    v = to[e]
+                    candidate = d + cost[e] + pu - potential[v]
+                    if candidate < dist[v]:
+                        dist[v] = candidate
+                        heapq.heappush(heap, (candidate, v))
+        return dist
+
+    def _augment_admissible(self, source: int, sink: int, potential: List[float]) -> int:
+        """Schickt Fluss über Pfade aus Kanten mit reduzierten Kosten 0"""
+        graph, to, cap, cost = self._graph, self._to, self._cap, self._cost
+        pointer = [0] * self.node_count
+        dead = [False] * self.node_count
+        on_path = [False] * self.node_count
+        stack, edges = [source], []
+        on_path[source] = True
+        total = 0
+
+        while stack:
+            u = stack[-1]
+            if u == sink:
+                pushed = min(cap[e] for e in edges)
+                for e in edges:
+                    cap[e] -= pushed
+                    cap[e ^ 1] += pushed
+                total += pushed
+                for v in stack[1:]:
+                    on_path[v] = False
+                stack, edges = [source], []
+                continue
+
+            advanced = False
+            adjacency = graph[u]
+            while pointer[u] < len(adjacency):
+                e = adjacency[pointer[u]]
+                v = to[e]
+                if cap[e] > 0 and not dead[v] and not on_path[v] and cost[e] + potential[u] - potential[v] == 0:
+                    stack.append(v)
+                    edges.append(e)
+                    on_path[v] = True
+                    advanced = True
+                    break
+                pointer[u] += 1
+
+            if not advanced:
+                # Sackgasse für diese Phase (verpasste Pfade findet die nächste Phase)
+                dead[u] = True
+                on_path[u] = False
+                stack.pop()
+                if edges:
+                    edges.pop()
+                    pointer[stack[-1]] += 1
+        return total
+
+    def solve(self, source: int, sink: int, only_improving: bool = True) -> Tuple[int, int]:
+        """Berechnet den Fluss minimaler Kosten, gibt (Fluss, Kosten) zurück
+
+        Mit `only_improving` wird nur Fluss geschickt, solange er die Kosten
+        senkt (Pfade mit negativen Kosten) - das ist ein Maximum-Gewichts-
+        Fluss statt eines maximalen Flusses.
+        """
+        potential = self._initial_potentials(source)
+        total_flow = 0
+        total_cost = 0
+        while True:
+            dist = self._dijkstra(source, potential)
+            if dist[sink] == INFINITY:
+                break
+            for v in range(self.node_count):
+                if dist[v] < INFINITY:
+                    potential[v] += dist[v]
+
+            path_cost = potential[sink] - potential[source]
+            if only_improving and path_cost >= 0:
+                break
+
+            pushed = self._augment_admissible(source, sink, potential)
+            if not pushed:
+                break
+            total_flow += pushed
+            total_cost += pushed * path_cost
+        return total_flow, total_cost
+
+
+def solve_assignment(capacities: Dict[Hashable, int], demands: Dict[Hashable, int],
+                     scores: Dict[Tuple[Hashable, Hashable], float]) -> Dict[Tuple[Hashable, Hashable], int]:
+    """Zuordnung Experte -> Projekt in Stunden, die Σ Score x Stunden maximiert
+
+    `capacities` sind die verfügbaren Stunden je Experte, `demands` die
+    benötigten Stunden je Projekt, `scores` die Match-Scores der erlaubten
+    Paare (Experte, Projekt). Ergebnis: zugeordnete Stunden je Paar (> 0).
+    """
+    experts = {expert: i for i, expert in enumerate(capacities)}
+    projects = {project: len(experts) + i for i, project in enumerate(demands)}
+    source = len(experts) + len(projects)
+    sink = source + 1
+    solver = MinCostFlow(sink + 1)
+
+    for expert, node in experts.items():
+        if capacities[expert] > 0:
+            solver.add_edge(source, node, capacities[expert], 0)
+    for project, node in projects.items():
+        if demands[project] > 0:
+            solver.add_edge(node, sink, demands[project], 0)
+
+    pair_edges = {}
+    for (expert, project), score in scores.items():
+        if expert not in experts or project not in projects:
+            continue
+        capacity = min(capacities[expert], demands[project])
+        if capacity > 0:
+            pair_edges[(expert, project)] = solver.add_edge(
+                experts[expert], projects[project], capacity, -round(score * COST_SCALE))
+
+    solver.solve(source, sink)
+    return {pair: solver.flow(edge) for pair, edge in pair_edges.items() if solver.flow(edge) > 0}
@@ -0,0 +1,131 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Vektorisierte Batch-Bewertung (NumPy) aller Experten gegen ein oder viele Projekte
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional - ProjectMatcher bewertet dann skalar
+    np = None
+
+from expert_features import ExpertFeatures, ProjectRequirements
+from skill_index import (AVAILABILITY_WEIGHT, CERT_WEIGHT, EXPERIENCE_WEIGHT,
+                         INDUSTRY_WEIGHT, SKILL_WEIGHT)
+
+NUMPY_AVAILABLE = np is not None
+
+
+class BatchScorer:
+    """Spalten-Kodierung eines Experten-Bestands für die Matrix-Bewertung.
+
+    Skills und Zertifikate bilden je ein gemeinsames Vokabular; zu jedem
+    Begriff wird die Zeilen-Liste der Experten gespeichert (dünn besetzte
+    Experten x Vokabular-Matrix im CSR-Format). Die Trefferzahl je Experte
+    ist die Spaltensumme über die geforderten Begriffe. Erfahrung und
+    Verfügbarkeit sind Spalten, Branchen werden je eindeutigem Text einmal
+    geprüft. Der Score wird in derselben Reihenfolge der Gleitkomma-
+    Operationen berechnet wie ProjectMatcher._score_features und ist daher
+    bitgenau identisch.
+    """
+
+    def __init__(self, features: Iterable[ExpertFeatures]):
+        if np is None:
+            raise ImportError("NumPy ist nicht installiert - Batch-Bewertung nicht verfügbar")
+
+        self.features: List[ExpertFeatures] = list(features)
+        size = len(self.features)
+
+        self._skill_vocab, self._skill_indptr, self._skill_rows = self._encode(f.skills for f in self.features)
+        self._cert_vocab, self._cert_indptr, self._cert_rows = self._encode(f.certifications for f in self.features)
+
+        industry_codes: Dict[str, int] = {}
+        self._industry_codes = np.fromiter(
+            (industry_codes.setdefault(f.industries, len(industry_codes)) for f in self.features),
+            dtype=np.int64, count=size)
+        self._industries = list(industry_codes)
+
+        self._experience = np.fromiter((f.experience_years for f in self.features), dtype=np.int64, count=size)
+        self._available = np.fromiter((f.available for f in self.features), dtype=bool, count=size)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    @staticmethod
+    def _encode(term_sets: Iterable[Iterable[str]]) -> Tuple[Dict[str, int], "np.ndarray", "np.ndarray"]:
+        """Vokabular und CSR-Postings (indptr, Zeilen) je Begriff"""
+        vocab: Dict[str, int] = {}
+        term_ids: List[int] = []
+        rows: List[int] = []
+        for row, terms in enumerate(term_sets):
+            for term in terms:
+                term_ids.append(vocab.setdefault(term, len(vocab)))
+                rows.append(row)
+
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        order = np.argsort(term_ids, kind="stable")
+        indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(vocab)), out=indptr[1:])
+        return vocab, indptr, rows[order]
+
+    def _term_counts(self, vocab: Dict[str, int], indptr: "np.ndarray", rows: "np.ndarray",
+                     terms: Iterable[str]) -> "np.ndarray":
+        """Anzahl der Treffer je Experte für die geforderten Begriffe"""
+        postings = [rows[indptr[i]:indptr[i + 1]] for i in (vocab.get(term) for term in terms) if i is not None]
+        if not postings:
+            return np.zeros(len(self.features), dtype=np.float64)
+        return np.bincount(np.concatenate(postings), minlength=len(self.features)).astype(np.float64)
+
+    def _industry_hits(self, industry: str) -> "np.ndarray":
+        """Experten, deren Branchenkenntnisse `industry` als Teilstring enthalten"""
+        if not industry:
+            return np.zeros(len(self.features), dtype=bool)
+        hits = np.fromiter((industry in text for text in self._industries), dtype=bool, count=len(self._industries))
+        return hits[self._industry_codes]
+
+    def score(self, requirements: ProjectRequirements) -> "np.ndarray":
+        """Scores aller Experten für ein Projekt (Reihenfolge wie `features`)"""
+        score = np.zeros(len(self.features), dtype=np.float64)
+
+        if requirements.skill_count:
+            skill_matches = self._term_counts(self._skill_vocab, self._skill_indptr, self._skill_rows,
+                                              requirements.skills)
+            score += skill_matches / requirements.skill_count * SKILL_WEIGHT
+
+        np.add(score, EXPERIENCE_WEIGHT, out=score, where=self._experience >= requirements.min_experience)
+        np.add(score, INDUSTRY_WEIGHT, out=score, where=self._industry_hits(requirements.industry))
+        np.add(score, AVAILABILITY_WEIGHT, out=score, where=self._available)
+
+        if requirements.cert_count:
+            cert_matches = self._term_counts(self._cert_vocab, self._cert_indptr, self._cert_rows,
+                                             requirements.certifications)
+            score += cert_matches / requirements.cert_count * CERT_WEIGHT
+
+        return np.minimum(score, 1.0, out=score)
+
+    def score_many(self, requirements: Sequence[ProjectRequirements]) -> "np.ndarray":
+        """Score-Matrix Projekte x Experten"""
+        result = np.empty((len(requirements), len(self.features)), dtype=np.float64)
+        for row, item in enumerate(requirements):
+            result[row] = self.score(item)
+        return result
+
+    def matches(self, requirements: ProjectRequirements, threshold: float,
+                top_k: Optional[int] = None) -> List[Tuple[ExpertFeatures, float]]:
+        """(Features, Score) aller Experten mit Score >= `threshold`, in Bestands-Reihenfolge
+
+        Mit `top_k` nur die K besten, absteigend nach Score (bei Gleichstand
+        in Bestands-Reihenfolge wie heapq.nlargest).
+        """
+        scores = self.score(requirements)
+        rows = np.flatnonzero(scores >= threshold)
+        if top_k is not None and len(rows) > top_k:
+            rows = rows[np.argsort(-scores[rows], kind="stable")[:max(top_k, 0)]]
+        return [(self.features[row], value) for row, value in zip(rows.tolist(), scores[rows].tolist())]
+
+    def matches_many(self, requirements: Sequence[ProjectRequirements], threshold: float,
+                     top_k: Optional[int] = None) -> List[List[Tuple[ExpertFeatures, float]]]:
+        """matches() für mehrere Projekte (ohne die volle Score-Matrix zu halten)"""
+        return [self.matches(item, threshold, top_k) for item in requirements]
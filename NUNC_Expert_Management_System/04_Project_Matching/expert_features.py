@@ -0,0 +1,210 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Vorberechnete, unveränderliche Matching-Features je Experte und Projekt
+"""
+
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, replace
+from typing import Dict, FrozenSet, Optional, Tuple
+
+EXPERIENCE_PATTERN = re.compile(r'(\d+)\s*(?:jahr|year|jahren|years)')
+HOURS_PATTERN = re.compile(r'\d+')
+
+# Annahme, wenn Experte oder Projekt keine Wochenstunden angeben (Vollzeit)
+DEFAULT_HOURS_PER_WEEK = 40
+
+
+def content_version(expert: Dict) -> Optional[str]:
+    """updated_at plus Inhalts-Hash eines vom Client übergebenen Profils
+
+    Übergebene Profile können sich ändern, ohne dass der Client
+    `updated_at` anpasst - erst der Hash macht die Version eindeutig.
+    """
+    updated_at = expert.get("updated_at")
+    if updated_at is None:
+        return None
+    payload = json.dumps(expert, sort_keys=True, default=str).encode("utf-8")
+    return f"{updated_at}#{hashlib.sha1(payload).hexdigest()[:16]}"
+
+
+def split_list_field(text: str) -> FrozenSet[str]:
+    """Zerlegt ein Listen-Feld wie "Salesforce, Python" (Trenner ", ")"""
+    if not text:
+        return frozenset()
+    return frozenset(item.strip() for item in text.split(", ") if item.strip())
+
+
+def extract_experience_years(text: str) -> int:
+    """Größte Jahresangabe im Text ("5 Jahre", "10 years"), sonst 0"""
+    if not text:
+        return 0
+    years = EXPERIENCE_PATTERN.findall(text.lower())
+    return max(int(year) for year in years) if years else 0
+
+
+def parse_hours(value, default: int = DEFAULT_HOURS_PER_WEEK) -> int:
+    """Wochenstunden aus Zahl oder Text ("40", "32 h"), sonst `default`"""
+    if isinstance(value, (int, float)):
+        return max(int(value), 0)
+    match = HOURS_PATTERN.search(value or "")
+    return int(match.group()) if match else default
+
+
+@dataclass(frozen=True)
+class ExpertFeatures:
+    """Matching-relevante Merkmale eines Experten (einmal geparst)"""
+    expert_id: str
+    expert_name: str
+    skills: FrozenSet[str]
+    certifications: FrozenSet[str]
+    industries: str  # branchenkenntnisse in Kleinbuchstaben (Teilstring-Vergleich)
+    experience_years: int
+    available: bool
+    hours_per_week: int = DEFAULT_HOURS_PER_WEEK
+    version: Optional[str] = None  # updated_at des Profils
+
+    @classmethod
+    def from_profile(cls, expert: Dict) -> 'ExpertFeatures':
+        """Extrahiert die Features aus einem Experten-Profil"""
+        return cls(
+            expert_id=expert.get("id", ""),
+            expert_name=expert.get("expert_name", ""),
+            skills=split_list_field(expert.get("technologien", "")),
+            certifications=split_list_field(expert.get("zertifizierungen", "")),
+            industries=expert.get("branchenkenntnisse", "").lower(),
+            experience_years=extract_experience_years(expert.get("projekthistorie_text", "")),
+            available=expert.get("availability", {}).get("status") == "available",
+            hours_per_week=parse_hours(expert.get("availability", {}).get("hours_per_week")),
+            version=expert.get("updated_at"),
+        )
+
+
+@dataclass(frozen=True)
+class ProjectRequirements:
+    """Anforderungen eines Projekts, einmal je Matching-Lauf aufbereitet"""
+    skills: FrozenSet[str]
+    skill_count: int  # Länge der Original-Liste (Nenner des Skill-Scores)
+    certifications: FrozenSet[str]
+    cert_count: int
+    min_experience: int
+    industry: str  # in Kleinbuchstaben
+    hours_per_week: int = DEFAULT_HOURS_PER_WEEK
+    project_id: str = ""
+    version: Optional[str] = None  # updated_at des Projekts
+
+    @classmethod
+    def from_project(cls, project: Dict) -> 'ProjectRequirements':
+        """Bereitet die Anforderungen eines Projekts auf"""
+        required_skills = project.get("required_skills", [])
+        required_certs = project.get("certifications", [])
+        return cls(
+            skills=frozenset(required_skills),
+            skill_count=len(required_skills),
+            certifications=frozenset(required_certs),
+            cert_count=len(required_certs),
+            min_experience=project.get("min_experience", 0),
+            industry=project.get("industry", "").lower(),
+            hours_per_week=parse_hours(project.get("hours_per_week")),
+            project_id=project.get("id", ""),
+            version=project.get("updated_at"),
+        )
+
+
+def score_features(requirements: ProjectRequirements, features: ExpertFeatures) -> float:
+    """Match-Score aus vorberechneten Features (nur Mengen-Operationen)"""
+    score = 0.0
+
+    # Skills-Matching (40% Gewichtung)
+    if requirements.skill_count:
+        skill_matches = len(requirements.skills & features.skills)
+        skill_score = skill_matches / requirements.skill_count
+        score += skill_score * 0.4
+
+    # Erfahrungs-Matching (20% Gewichtung)
+    if features.experience_years >= requirements.min_experience:
+        score += 0.2
+
+    # Branchen-Matching (15% Gewichtung)
+    if requirements.industry and requirements.industry in features.industries:
+        score += 0.15
+
+    # Verfügbarkeit (15% Gewichtung)
+    if features.available:
+        score += 0.15
+
+    # Zertifizierungen (10% Gewichtung)
+    if requirements.cert_count:
+        cert_matches = len(requirements.certifications & features.certifications)
+        cert_score = cert_matches / requirements.cert_count
+        score += cert_score * 0.1
+
+    return min(score, 1.0)  # Maximal 1.0
+
+
+class ExpertFeatureCache:
+    """Cache der Experten-Features, Schlüssel Profil-ID + updated_at.
+
+    Ein geändertes Profil hat ein neues `updated_at` und wird beim nächsten
+    Zugriff neu extrahiert; zusätzlich kann der Cache als Änderungs-Listener
+    am ProfileManager hängen (on_profile_change). Profile ohne ID oder
+    `updated_at` werden nicht gecacht. Für übergebene Profile (`inline`)
+    gilt content_version() als Version, auch im Match-Score-Cache.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Optional[str], ExpertFeatures]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, expert: Dict, inline: bool = False) -> ExpertFeatures:
+        """Features eines Profils (aus dem Cache, falls aktuell)"""
+        expert_id = expert.get("id")
+        version = content_version(expert) if inline else expert.get("updated_at")
+        if not expert_id or version is None:
+            self.misses += 1
+            return ExpertFeatures.from_profile(expert)
+
+        entry = self._entries.get(expert_id)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        features = ExpertFeatures.from_profile(expert)
+        if inline:
+            features = replace(features, version=version)
+        with self._lock:
+            self._entries[expert_id] = (version, features)
+        return features
+
+    def invalidate(self, expert_id: Optional[str] = None):
+        """Verwirft einen Eintrag (oder alle ohne ID)"""
+        with self._lock:
+            if expert_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(expert_id, None)
+
+    def on_profile_change(self, event: str, profile_id: Optional[str], profile: Optional[Dict]):
+        """Listener für ProfileManager.add_change_listener"""
+        if event == "reload":
+            self.invalidate()
+        elif profile_id:
+            self.invalidate(profile_id)
+
+    def stats(self) -> Dict:
+        """Cache-Statistik"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,302 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Append-only Match-Historie mit Index nach Projekt und Experte
+"""
+
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from file_lock import FileLock, file_stamp
+from storage_backends import StorageBackend
+
+
+class MatchHistory:
+    """Match-Läufe als Append-only Log (JSON-Lines) mit In-Memory-Indizes.
+
+    Jeder neue oder geänderte Match-Datensatz wird als eine Zeile angehängt
+    ({"op": "put", "record": ...}), entfernte Läufe als {"op": "delete"}.
+    Je Projekt bleiben die letzten `retention_runs` Läufe erhalten; sobald
+    das Log mehr als doppelt so viele Zeilen wie lebende Datensätze hat
+    (mindestens `compact_threshold`), wird es neu geschrieben.
+
+    Indizes: Läufe je Projekt (der letzte ist der aktuelle) und die Ränge
+    jedes Experten in den aktuellen Läufen. Mit `storage` (z.B. SQLite)
+    werden Datensätze zeilenweise dort gespeichert statt im Log.
+
+    Mehrere Prozesse können dasselbe Log nutzen: Schreiber und Kompaktierung
+    halten einen Datei-Lock und spielen vorher die seit dem letzten Stand
+    angehängten Zeilen ein; Lesezugriffe laden nur nach, wenn sich das Log
+    (bzw. der Speicher) geändert hat. Kollidiert die ID eines Datensatzes
+    mit einem Lauf eines anderen Projekts, erhält er ein Suffix (_2, _3, ...).
+    """
+
+    def __init__(self, log_file: Path, retention_runs: int = 10, compact_threshold: int = 1000,
+                 storage: Optional[StorageBackend] = None, migrate_from: Optional[Path] = None):
+        self.log_file = Path(log_file)
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.retention_runs = retention_runs
+        self.compact_threshold = compact_threshold
+        self.storage = storage
+
+        self._records: Dict[str, Dict] = {}
+        self._runs: Dict[str, List[str]] = defaultdict(list)
+        self._ranked: Dict[str, List[str]] = {}  # project_id -> Experten des aktuellen Laufs
+        self._expert_ranks: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._log_lines = 0
+
+        # Gelesener Stand: Stempel, Inode und Offset des Logs bzw. Generation des Speichers
+        self.file_lock = FileLock(self.log_file.with_suffix(".lock"))
+        self._stamp = None
+        self._inode = None
+        self._offset = 0
+        self._generation = None
+
+        with self.file_lock:
+            if storage is not None:
+                self._generation = storage.generation()
+                records = storage.load_all()
+            elif self.log_file.exists():
+                self._sync()
+                records = []
+            else:
+                records = self._load_legacy(migrate_from)
+            for record in records:
+                self._rekey(record)
+                self._put(record)
+            removed = [record_id for record in list(self._records.values())
+                       for record_id in self._enforce_retention(record)]
+
+            if storage is not None:
+                if removed:
+                    storage.save([], deleted=removed)
+            elif removed or not self.log_file.exists() or self._needs_compaction():
+                self.compact()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._records)
+
+    def __contains__(self, record_id: str) -> bool:
+        self.refresh()
+        return record_id in self._records
+
+    def __iter__(self) -> Iterator[Dict]:
+        self.refresh()
+        return iter(list(self._records.values()))
+
+    def _clear(self):
+        """Leert Bestand und Indizes"""
+        self._records.clear()
+        self._runs.clear()
+        self._ranked.clear()
+        self._expert_ranks.clear()
+        self._log_lines = 0
+
+    def refresh(self):
+        """Übernimmt Änderungen anderer Prozesse (nur bei geändertem Log bzw. Speicher)"""
+        if self.storage is not None:
+            if self.storage.generation() == self._generation:
+                return
+        elif file_stamp(self.log_file) == self._stamp:
+            return
+        with self.file_lock:
+            self._sync()
+
+    def _sync(self):
+        """Spielt fremde Änderungen ein (Aufrufer hält den Lock)
+
+        Im Log-Modus werden nur die seit dem letzten Stand angehängten Zeilen
+        gelesen; wurde das Log inzwischen kompaktiert (neue Inode oder
+        kürzer als der Offset), wird es komplett neu eingelesen. Eine
+        unvollständige letzte Zeile wird erst beim nächsten Mal gelesen.
+        """
+        if self.storage is not None:
+            generation = self.storage.generation()
+            if generation != self._generation:
+                self._clear()
+                for record in self.storage.load_all():
+                    self._put(record)
+                self._generation = generation
+            return
+
+        stamp = file_stamp(self.log_file)
+        if stamp is None:
+            return
+        if stamp[2] != self._inode or stamp[1] < self._offset:
+            self._clear()
+            self._inode = stamp[2]
+            self._offset = 0
+
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            self._log_lines += 1
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry["op"] == "put":
+                self._put(entry["record"])
+            elif entry["op"] == "delete":
+                self._remove(entry["id"])
+        self._offset += complete
+        self._stamp = file_stamp(self.log_file)
+
+    def _rekey(self, record: Dict):
+        """Vergibt eine neue ID, falls die ID schon zu einem Lauf eines anderen Projekts gehört
+
+        Die Basis-IDs (match_YYYYmmdd_HHMMSS) kollidieren, wenn Projekte in
+        derselben Sekunde gematcht werden (in Alt-Daten oder in parallelen
+        Prozessen); der Datensatz wird dabei direkt umbenannt.
+        """
+        existing = self._records.get(record["id"])
+        if existing is None or existing["project_id"] == record["project_id"]:
+            return
+        base_id = record["id"]
+        suffix = 2
+        while f"{base_id}_{suffix}" in self._records:
+            suffix += 1
+        record["id"] = f"{base_id}_{suffix}"
+
+    @staticmethod
+    def _load_legacy(json_file: Optional[Path]) -> List[Dict]:
+        """Übernimmt eine bestehende project_matches.json (einmalig)"""
+        if json_file is None or not Path(json_file).exists():
+            return []
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _put(self, record: Dict):
+        """Nimmt einen Datensatz in Bestand und Indizes auf"""
+        record_id = record["id"]
+        project_id = record["project_id"]
+        existing = self._records.get(record_id)
+        if existing is not None and existing["project_id"] != project_id:
+            # Alte Logs: kollidierte ID eines anderen Projekts - dort austragen
+            self._remove(record_id)
+            existing = None
+        if existing is None:
+            self._runs[project_id].append(record_id)
+        self._records[record_id] = record
+        if self._runs[project_id][-1] == record_id:
+            self._index_latest(project_id)
+
+    def _remove(self, record_id: str):
+        """Entfernt einen Datensatz aus Bestand und Indizes"""
+        record = self._records.pop(record_id, None)
+        if record is None:
+            return
+        project_id = record["project_id"]
+        runs = self._runs[project_id]
+        runs.remove(record_id)
+        if not runs:
+            del self._runs[project_id]
+        self._index_latest(project_id)
+
+    def _index_latest(self, project_id: str):
+        """Aktualisiert die Experten-Ränge für den aktuellen Lauf eines Projekts"""
+        for expert_id in self._ranked.pop(project_id, ()):
+            ranks = self._expert_ranks[expert_id]
+            ranks.pop(project_id, None)
+            if not ranks:
+                del self._expert_ranks[expert_id]
+
+        runs = self._runs.get(project_id)
+        latest = self._records[runs[-1]] if runs else None
+        if latest is None:
+            return
+        ranked = [match["expert_id"] for match in latest["matches"]]
+        for rank, expert_id in enumerate(ranked, 1):
+            self._expert_ranks[expert_id].setdefault(project_id, rank)
+        self._ranked[project_id] = ranked
+
+    def _enforce_retention(self, record: Dict) -> List[str]:
+        """Verwirft die ältesten Läufe eines Projekts über `retention_runs`"""
+        runs = self._runs.get(record["project_id"], [])
+        expired = runs[:max(len(runs) - self.retention_runs, 0)]
+        for record_id in expired:
+            self._remove(record_id)
+        return expired
+
+    def append(self, records: Iterable[Dict]):
+        """Hängt neue oder geänderte Match-Datensätze an"""
+        records = list(records)
+        if not records:
+            return
+
+        with self.file_lock:
+            self._sync()
+            removed = []
+            for record in records:
+                self._rekey(record)
+                self._put(record)
+                removed += self._enforce_retention(record)
+
+            if self.storage is not None:
+                self.storage.save([], changed=[r for r in records if r["id"] in self._records])
+                if removed:
+                    self.storage.save([], deleted=removed)
+                self._generation = self.storage.generation()
+                return
+
+            entries = [{"op": "put", "record": record} for record in records]
+            entries += [{"op": "delete", "id": record_id} for record_id in removed]
+            with open(self.log_file, 'ab') as f:
+                f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode('utf-8'))
+                self._offset = f.tell()
+            self._log_lines += len(entries)
+            self._stamp = file_stamp(self.log_file)
+            self._inode = self._stamp[2]
+
+            if self._needs_compaction():
+                self.compact()
+
+    def _needs_compaction(self) -> bool:
+        return self._log_lines >= self.compact_threshold and self._log_lines > 2 * len(self._records)
+
+    def compact(self):
+        """Schreibt das Log mit einer Zeile je lebendem Datensatz neu"""
+        if self.storage is not None:
+            return
+        with self.file_lock:
+            self._sync()
+            tmp_file = self.log_file.with_name(self.log_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                for record in self._records.values():
+                    f.write((json.dumps({"op": "put", "record": record}, ensure_ascii=False) + "\n").encode('utf-8'))
+                offset = f.tell()
+            tmp_file.replace(self.log_file)
+            self._log_lines = len(self._records)
+            self._stamp = file_stamp(self.log_file)
+            self._inode = self._stamp[2]
+            self._offset = offset
+
+    def latest(self, project_id: str) -> Optional[Dict]:
+        """Aktueller (letzter) Lauf eines Projekts"""
+        self.refresh()
+        runs = self._runs.get(project_id)
+        return self._records[runs[-1]] if runs else None
+
+    def runs(self, project_id: str) -> List[Dict]:
+        """Alle gespeicherten Läufe eines Projekts, älteste zuerst"""
+        self.refresh()
+        return [self._records[record_id] for record_id in self._runs.get(project_id, ())]
+
+    def projects_for_expert(self, expert_id: str, max_rank: Optional[int] = None) -> List[Dict]:
+        """Projekte, in deren aktuellem Lauf der Experte (höchstens auf Rang `max_rank`) steht"""
+        self.refresh()
+        result = []
+        for project_id, rank in self._expert_ranks.get(expert_id, {}).items():
+            if max_rank is None or rank <= max_rank:
+                match = self._records[self._runs[project_id][-1]]["matches"][rank - 1]
+                result.append({"project_id": project_id, "rank": rank, "match_score": match["match_score"]})
+        result.sort(key=lambda x: x["rank"])
+        return result
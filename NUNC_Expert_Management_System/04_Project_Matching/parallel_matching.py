@@ -0,0 +1,112 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Paralleles Matching über einen Prozess-Pool (Experten-Bestand in Shards)
+"""
+
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from expert_features import ExpertFeatures, ProjectRequirements, score_features
+
+# Unterhalb dieser Shard-Größe lohnt der Prozess-Overhead nicht
+MIN_SHARD_SIZE = 1000
+
+# Kompakter Feature-Datensatz für die Übertragung an die Worker:
+# (skills, certifications, industries, experience_years, available)
+FeatureRecord = Tuple[Tuple[str, ...], Tuple[str, ...], str, int, bool]
+
+
+def to_record(features: ExpertFeatures) -> FeatureRecord:
+    """Score-relevante Felder eines Experten (ohne ID, Name, Stunden)"""
+    return (tuple(features.skills), tuple(features.certifications), features.industries,
+            features.experience_years, features.available)
+
+
+def from_record(record: FeatureRecord) -> ExpertFeatures:
+    """Features aus einem übertragenen Datensatz (nur für die Bewertung)"""
+    skills, certifications, industries, experience_years, available = record
+    return ExpertFeatures(expert_id="", expert_name="", skills=frozenset(skills),
+                          certifications=frozenset(certifications), industries=industries,
+                          experience_years=experience_years, available=available)
+
+
+def score_shard(offset: int, records: List[FeatureRecord], all_requirements: List[ProjectRequirements],
+                threshold: float, top_k: Optional[int]) -> List[List[Tuple[int, float]]]:
+    """Worker: bewertet einen Shard gegen alle Projekte
+
+    Liefert je Projekt (globaler Index, Score) der Experten mit Mindest-Score,
+    mit `top_k` nur die K besten des Shards (absteigend, bei Gleichstand
+    nach Index), sonst in Index-Reihenfolge.
+    """
+    shard = [from_record(record) for record in records]
+    results = []
+    for requirements in all_requirements:
+        scored = []
+        for i, features in enumerate(shard, offset):
+            match_score = score_features(requirements, features)
+            if match_score >= threshold:
+                scored.append((i, match_score))
+        if top_k is not None:
+            scored = heapq.nlargest(max(top_k, 0), scored, key=itemgetter(1))
+        results.append(scored)
+    return results
+
+
+class ParallelScorer:
+    """Bewertet einen Experten-Bestand in Shards auf mehreren Prozessen.
+
+    Die Experten werden in zusammenhängende Shards (einer je Worker)
+    zerlegt; jeder Worker erhält seinen Shard einmal als kompakte
+    Feature-Datensätze zusammen mit allen Projekt-Anforderungen und gibt
+    je Projekt nur (Index, Score) seiner Top-K zurück. Die Top-K-Listen der
+    Shards werden zusammengeführt - Scores und Reihenfolge entsprechen
+    dem skalaren Lauf in einem Prozess.
+    """
+
+    def __init__(self, features: Iterable[ExpertFeatures], workers: int, min_shard_size: Optional[int] = None):
+        self.features: List[ExpertFeatures] = list(features)
+        if min_shard_size is None:
+            min_shard_size = MIN_SHARD_SIZE
+        self.workers = max(1, min(workers, len(self.features) // max(min_shard_size, 1)))
+
+    def _shards(self) -> List[Tuple[int, List[FeatureRecord]]]:
+        """Zusammenhängende Shards als (Offset, Datensätze)"""
+        size = -(-len(self.features) // self.workers)
+        return [(offset, [to_record(f) for f in self.features[offset:offset + size]])
+                for offset in range(0, len(self.features), size)]
+
+    def matches_many(self, all_requirements: Sequence[ProjectRequirements], threshold: float,
+                     top_k: Optional[int] = None) -> List[List[Tuple[ExpertFeatures, float]]]:
+        """(Features, Score) der Experten mit Mindest-Score je Projekt (mit `top_k` nur die K besten)"""
+        all_requirements = list(all_requirements)
+        if not self.features or not all_requirements:
+            return [[] for _ in all_requirements]
+
+        if self.workers == 1:
+            shard_results = [score_shard(0, [to_record(f) for f in self.features], all_requirements,
+                                         threshold, top_k)]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(score_shard, offset, records, all_requirements, threshold, top_k)
+                           for offset, records in self._shards()]
+                shard_results = [future.result() for future in futures]
+
+        results = []
+        for p in range(len(all_requirements)):
+            per_shard = [result[p] for result in shard_results]
+            if top_k is None:
+                merged = [item for scored in per_shard for item in scored]
+            else:
+                # Shard-Listen sind nach (-Score, Index) sortiert
+                merged = list(islice(heapq.merge(*per_shard, key=lambda item: (-item[1], item[0])),
+                                     max(top_k, 0)))
+            results.append([(self.features[i], match_score) for i, match_score in merged])
+        return results
+
+    def matches(self, requirements: ProjectRequirements, threshold: float,
+                top_k: Optional[int] = None) -> List[Tuple[ExpertFeatures, float]]:
+        """(Features, Score) der Experten mit Mindest-Score für ein Projekt"""
+        return self.matches_many([requirements], threshold, top_k)[0]
@@ -4,16 +4,45 @@ NUNC Expert Management System - Projekt-Matching
 AI-basiertes Matching von Projekten mit Experten
 """
 
+import heapq
 import json
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import re
 
+# Importiere Shared Components
+import sys
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from config import Config
+from storage_backends import create_storage
+from utils import generate_record_id
+
+from assignment_solver import solve_assignment
+from batch_scoring import NUMPY_AVAILABLE, BatchScorer
+from expert_features import ExpertFeatureCache, ExpertFeatures, ProjectRequirements, extract_experience_years
+from match_history import MatchHistory
+from parallel_matching import ParallelScorer
+from score_cache import MatchScoreCache
+from skill_index import SkillIndex
+from standing_matches import StandingMatches
+
 class ProjectMatcher:
     """AI-basiertes Matching von Projekten mit Experten"""
     
-    def __init__(self):
+    # Mindest-Score für einen Match
+    MIN_MATCH_SCORE = 0.3
+    
+    # Beste Kandidaten je Projekt, die beim Portfolio-Matching verteilt werden
+    PORTFOLIO_CANDIDATES = 50
+    
+    # Projektfelder, deren Änderung ein Re-Matching auslöst
+    MATCH_FIELDS = {"required_skills", "certifications", "min_experience", "industry", "status"}
+    
+    def __init__(self, config: Optional[Config] = None, profile_manager=None):
+        self.config = config or Config()
         self.projects_file = Path("08_Output_Files/projects.json")
         self.matches_file = Path("08_Output_Files/project_matches.json")
         
@@ -21,37 +50,133 @@ class ProjectMatcher:
         self.projects_file.parent.mkdir(parents=True, exist_ok=True)
         self.matches_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Speicher-Backend (JSON-Datei oder SQLite, siehe Config.STORAGE)
+        self.projects_storage = create_storage("projects", self.projects_file,
+                                               {"status": "status"}, config=self.config)
+        
+        # Match-Läufe: Append-only Historie (im SQLite-Backend zeilenweise in der Datenbank)
+        matches_storage = None
+        if self.config.STORAGE.get("backend") == "sqlite":
+            matches_storage = create_storage("project_matches", self.matches_file,
+                                             {"project_id": "project_id"}, config=self.config)
+        matching_config = self.config.PROJECT_MATCHING
+        self.match_history = MatchHistory(self.matches_file.with_suffix(".jsonl"),
+                                          retention_runs=matching_config["history_retention_runs"],
+                                          compact_threshold=matching_config["history_compact_threshold"],
+                                          storage=matches_storage, migrate_from=self.matches_file)
+        
         # Lade bestehende Daten
         self.projects = self._load_projects()
-        self.matches = self._load_matches()
+        
+        # Vorberechnete Experten-Features (Profil-ID + updated_at, übergebene
+        # Profile zusätzlich mit Inhalts-Hash)
+        self.feature_cache = ExpertFeatureCache()
+        
+        # Match-Scores je (Projekt, Experte), gültig für deren updated_at
+        self.score_cache = MatchScoreCache(matching_config["score_cache_max_mb"])
+        
+        # Mit ProfileManager: Skill-Index über den Profil-Bestand, per Listener aktuell gehalten
+        self.profile_manager = profile_manager
+        self.skill_index = SkillIndex()
+        self._batch_scorer: Optional[BatchScorer] = None  # lazy, bei Profil-Änderungen verworfen
+        
+        # Laufend aktuelle Match-Listen der gegen den Bestand gematchten aktiven Projekte
+        self.standing: Dict[str, StandingMatches] = {}
+        if profile_manager is not None:
+            self._rebuild_skill_index()
+            profile_manager.add_change_listener(self._on_profile_change)
+    
+    def _rebuild_skill_index(self):
+        """Baut den Skill-Index aus dem Profil-Bestand neu auf"""
+        self.skill_index.rebuild(self.feature_cache.get(p) for p in self.profile_manager.get_all_profiles())
+    
+    def _on_profile_change(self, event: str, profile_id: Optional[str], profile: Optional[Dict]):
+        """Listener: hält Feature-Cache und Skill-Index beim Profil-Bestand aktuell"""
+        self.feature_cache.on_profile_change(event, profile_id, profile)
+        self._batch_scorer = None
+        if event == "put":
+            self.skill_index.add(self.feature_cache.get(profile))
+        elif event == "delete":
+            self.skill_index.remove(profile_id)
+        elif event == "reload":
+            self._rebuild_skill_index()
+        self._update_standing(event, profile_id)
+    
+    def _update_standing(self, event: str, profile_id: Optional[str]):
+        """Bewertet nur den geänderten Experten gegen die laufenden Match-Listen neu
+        
+        Der Listener läuft in jedem Prozess, auch für Änderungen anderer
+        Prozesse. Nachgeführt (und gespeichert) wird eine Liste nur von dem
+        Prozess, dessen Lauf der aktuelle des Projekts ist; so entsteht je
+        Änderung höchstens ein Eintrag in der Historie.
+        """
+        self._drop_superseded_standing()
+        if not self.standing:
+            return
+        
+        features = self.skill_index.get(profile_id) if event == "put" else None
+        changed = []
+        for standing in self.standing.values():
+            if event == "reload":
+                self._rematch_standing(standing)
+                changed.append(standing.record)
+                continue
+            
+            match = None
+            if features is not None:
+                match_score = self._score_features(standing.requirements, features)
+                if match_score >= self.MIN_MATCH_SCORE:
+                    match = self._match_entry(standing.project, standing.requirements, features, match_score)
+            
+            result = standing.update(profile_id, match)
+            if result is None:
+                # Nachrücker unbekannt - nur dieses Projekt neu berechnen
+                self._rematch_standing(standing)
+            if result is not False:
+                changed.append(standing.record)
+        
+        if changed:
+            self._save_matches(changed)
+    
+    def _drop_superseded_standing(self):
+        """Beendet das Nachführen von Listen, deren Lauf nicht mehr der aktuelle ist
+        
+        Hat ein anderer Prozess das Projekt inzwischen neu gematcht, führt
+        dieser die Liste weiter (oder bei einem Lauf mit übergebenen
+        Profilen niemand mehr).
+        """
+        for project_id, standing in list(self.standing.items()):
+            latest = self.match_history.latest(project_id)
+            if latest is None or latest["id"] != standing.record["id"]:
+                del self.standing[project_id]
+    
+    def _rematch_standing(self, standing: StandingMatches):
+        """Berechnet die Match-Liste eines Projekts über den Skill-Index neu"""
+        requirements = ProjectRequirements.from_project(standing.project)
+        candidates = self.skill_index.candidates(requirements, self.MIN_MATCH_SCORE)
+        standing.replace(self._build_matches(standing.project, requirements,
+                                             self._qualifying(requirements, candidates), standing.top_k))
     
     def _load_projects(self) -> List[Dict]:
-        """Lädt Projekte aus lokaler Datei"""
-        if self.projects_file.exists():
-            with open(self.projects_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
-    
-    def _load_matches(self) -> List[Dict]:
-        """Lädt Matches aus lokaler Datei"""
-        if self.matches_file.exists():
-            with open(self.matches_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
-    
-    def _save_projects(self):
-        """Speichert Projekte in lokaler Datei"""
-        with open(self.projects_file, 'w', encoding='utf-8') as f:
-            json.dump(self.projects, f, indent=4, ensure_ascii=False)
-    
-    def _save_matches(self):
-        """Speichert Matches in lokaler Datei"""
-        with open(self.matches_file, 'w', encoding='utf-8') as f:
-            json.dump(self.matches, f, indent=4, ensure_ascii=False)
+        """Lädt Projekte aus dem Speicher-Backend"""
+        return self.projects_storage.load_all()
+    
+    @property
+    def matches(self) -> List[Dict]:
+        """Alle gespeicherten Match-Läufe"""
+        return list(self.match_history)
+    
+    def _save_projects(self, changed: Optional[List[Dict]] = None):
+        """Speichert Projekte (nur `changed`, sofern das Backend es unterstützt)"""
+        self.projects_storage.save(self.projects, changed=changed or ())
+    
+    def _save_matches(self, changed: List[Dict]):
+        """Hängt neue oder geänderte Match-Läufe an die Historie an"""
+        self.match_history.append(changed)
     
     def create_project(self, project_data: Dict) -> str:
         """Erstellt ein neues Projekt"""
-        project_id = f"project_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        project_id = generate_record_id("project", {p["id"] for p in self.projects})
         
         # Vollständige Projekt-Struktur
         full_project = {
@@ -110,13 +235,26 @@ class ProjectMatcher:
         
         # Projekt speichern
         self.projects.append(full_project)
-        self._save_projects()
+        self._save_projects([full_project])
         
         print(f"✅ Projekt erstellt: {project_id}")
         return project_id
     
-    def match_experts_to_project(self, project_id: str, expert_profiles: List[Dict]) -> List[Dict]:
-        """Matcht Experten zu einem Projekt"""
+    def match_experts_to_project(self, project_id: str, expert_profiles: Optional[List[Dict]] = None,
+                                 batch: bool = False, top_k: Optional[int] = None,
+                                 workers: Optional[int] = None,
+                                 candidate_ids: Optional[AbstractSet[str]] = None) -> List[Dict]:
+        """Matcht Experten zu einem Projekt
+        
+        Ohne `expert_profiles` wird der Bestand des ProfileManagers gematcht;
+        dabei bewertet der Skill-Index nur Experten, die den Mindest-Score
+        überhaupt erreichen können. `candidate_ids` (z.B. aus
+        select_profile_ids) beschränkt das auf diese Profile, die
+        Vorauswahl über den Skill-Index bleibt (skalar bewertet). Mit `batch=True` werden alle Experten
+        vektorisiert bewertet (NumPy, identische Scores), mit `workers` > 1
+        auf mehrere Prozesse verteilt. Mit `top_k` werden nur die K besten
+        Matches erklärt, zurückgegeben und gespeichert.
+        """
         project = self._get_project(project_id)
         if not project:
             print(f"❌ Projekt nicht gefunden: {project_id}")
@@ -124,41 +262,284 @@ class ProjectMatcher:
         
         print(f"🔍 Matche Experten zu Projekt: {project['title']}")
         
-        matches = []
+        requirements = ProjectRequirements.from_project(project)
+        if candidate_ids is not None:
+            scored = self._score_candidates(requirements, expert_profiles, candidate_ids)
+        elif workers is not None and workers > 1:
+            scored = self._parallel_scorer_for(expert_profiles, workers).matches(requirements, self.MIN_MATCH_SCORE, top_k)
+        elif batch and NUMPY_AVAILABLE:
+            scored = self._batch_scorer_for(expert_profiles).matches(requirements, self.MIN_MATCH_SCORE, top_k)
+        else:
+            scored = self._score_candidates(requirements, expert_profiles)
         
-        for expert in expert_profiles:
-            # Berechne Match-Score
-            match_score = self._calculate_match_score(project, expert)
+        matches = self._build_matches(project, requirements, scored, top_k)
+        match_record = self._new_match_record(project_id, matches)
+        self._track_standing(project, match_record, top_k, expert_profiles is None and candidate_ids is None)
+        
+        print(f"✅ {len(matches)} Matches gefunden")
+        return matches
+    
+    def match_projects_batch(self, project_ids: Optional[List[str]] = None,
+                             expert_profiles: Optional[List[Dict]] = None,
+                             top_k: Optional[int] = None, workers: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Matcht mehrere Projekte (Standard: alle aktiven) in einem Durchlauf
+        
+        Der Experten-Bestand wird nur einmal kodiert und je Projekt per
+        Matrix-Operation bewertet; ohne NumPy wird skalar bewertet. Mit
+        `workers` > 1 (z.B. os.cpu_count() für das nächtliche Re-Matching)
+        wird der Bestand in Shards auf einen Prozess-Pool verteilt.
+        """
+        if project_ids is None:
+            projects = self.get_active_projects()
+        else:
+            projects = [p for p in (self._get_project(pid) for pid in project_ids) if p]
+        if not projects:
+            return {}
+        
+        print(f"🔍 Batch-Matching für {len(projects)} Projekte")
+        
+        all_requirements = [ProjectRequirements.from_project(p) for p in projects]
+        scored_lists = self._score_projects(all_requirements, expert_profiles, top_k, workers)
+        
+        results = {}
+        for project, requirements, scored in zip(projects, all_requirements, scored_lists):
+            matches = self._build_matches(project, requirements, scored, top_k)
+            match_record = self._new_match_record(project["id"], matches)
+            results[project["id"]] = matches
+            self._track_standing(project, match_record, top_k, expert_profiles is None)
+        
+        print(f"✅ {sum(len(m) for m in results.values())} Matches in {len(results)} Projekten gefunden")
+        return results
+    
+    def match_all_active_projects(self, expert_profiles: Optional[List[Dict]] = None,
+                                  candidates_per_project: Optional[int] = None) -> Dict:
+        """Verteilt Experten auf alle aktiven Projekte (Portfolio-Matching)
+        
+        Alle aktiven Projekte werden in einem Durchlauf bewertet. Danach
+        bestimmt ein Min-Cost-Flow die Zuordnung mit maximaler Summe aus
+        Score x Stunden: Ein Experte kann mehrere Projekte übernehmen,
+        solange seine hours_per_week reichen, und jedes Projekt erhält
+        höchstens seine hours_per_week. Je Projekt werden die besten
+        `candidates_per_project` Experten (Standard PORTFOLIO_CANDIDATES)
+        berücksichtigt.
+        """
+        projects = self.get_active_projects()
+        if not projects:
+            return {"assignments": {}, "unfilled_hours": {}, "total_weighted_score": 0.0}
+        
+        print(f"🔍 Portfolio-Matching für {len(projects)} aktive Projekte")
+        
+        if candidates_per_project is None:
+            candidates_per_project = self.PORTFOLIO_CANDIDATES
+        all_requirements = [ProjectRequirements.from_project(p) for p in projects]
+        scored_lists = self._score_projects(all_requirements, expert_profiles, candidates_per_project)
+        
+        experts: Dict[str, ExpertFeatures] = {}
+        scores = {}
+        for project, scored in zip(projects, scored_lists):
+            for features, match_score in heapq.nlargest(candidates_per_project, scored, key=itemgetter(1)):
+                experts[features.expert_id] = features
+                scores[(features.expert_id, project["id"])] = match_score
+        
+        demands = {p["id"]: r.hours_per_week for p, r in zip(projects, all_requirements)}
+        hours = solve_assignment({expert_id: f.hours_per_week for expert_id, f in experts.items()},
+                                 demands, scores)
+        
+        assignments = {project["id"]: [] for project in projects}
+        for (expert_id, project_id), assigned_hours in hours.items():
+            assignments[project_id].append({
+                "expert_id": expert_id,
+                "expert_name": experts[expert_id].expert_name,
+                "match_score": scores[(expert_id, project_id)],
+                "hours": assigned_hours
+            })
+        for assigned in assignments.values():
+            assigned.sort(key=lambda x: x["match_score"], reverse=True)
+        
+        unfilled = {}
+        for project_id, demand in demands.items():
+            missing = demand - sum(a["hours"] for a in assignments[project_id])
+            if missing > 0:
+                unfilled[project_id] = missing
+        
+        total = sum(scores[pair] * assigned_hours for pair, assigned_hours in hours.items())
+        print(f"✅ {len(hours)} Zuordnungen, {len(unfilled)} Projekte mit offenem Bedarf")
+        return {"assignments": assignments, "unfilled_hours": unfilled, "total_weighted_score": total}
+    
+    def _score_projects(self, all_requirements: List[ProjectRequirements], expert_profiles: Optional[List[Dict]],
+                        top_k: Optional[int] = None,
+                        workers: Optional[int] = None) -> List[Iterable[Tuple[ExpertFeatures, float]]]:
+        """Bewertete Kandidaten je Projekt (Experten-Bestand nur einmal kodiert, ohne NumPy skalar)"""
+        if workers is not None and workers > 1:
+            return self._parallel_scorer_for(expert_profiles, workers).matches_many(
+                all_requirements, self.MIN_MATCH_SCORE, top_k)
+        if NUMPY_AVAILABLE:
+            return self._batch_scorer_for(expert_profiles).matches_many(all_requirements, self.MIN_MATCH_SCORE, top_k)
+        return [self._score_candidates(r, expert_profiles) for r in all_requirements]
+    
+    def update_project(self, project_id: str, updates: Dict) -> bool:
+        """Aktualisiert ein Projekt; geänderte Anforderungen matchen nur dieses Projekt neu"""
+        project = self._get_project(project_id)
+        if not project:
+            print(f"❌ Projekt nicht gefunden: {project_id}")
+            return False
+        
+        project.update({key: value for key, value in updates.items() if key not in ("id", "created_at")})
+        project["updated_at"] = datetime.now().isoformat()
+        self._save_projects([project])
+        
+        self._drop_superseded_standing()
+        standing = self.standing.get(project_id)
+        if standing is not None and self.MATCH_FIELDS & updates.keys():
+            if project["status"] != "active":
+                del self.standing[project_id]
+            else:
+                self._rematch_standing(standing)
+                self._save_matches([standing.record])
+        
+        print(f"✅ Projekt aktualisiert: {project_id}")
+        return True
+    
+    def _track_standing(self, project: Dict, match_record: Dict, top_k: Optional[int], whole_store: bool):
+        """Hält die Match-Liste eines aktiven Projekts ab jetzt bei Profil-Änderungen aktuell
+        
+        Nur Läufe gegen den gesamten Profil-Bestand werden nachgeführt; ein
+        Lauf mit übergebenen oder ausgewählten Profilen ist der neue aktuelle
+        Lauf und beendet das.
+        """
+        if whole_store and self.profile_manager is not None and project["status"] == "active":
+            self.standing[project["id"]] = StandingMatches(project, match_record, top_k, self.skill_index.position)
+        else:
+            self.standing.pop(project["id"], None)
+    
+    def _score_candidates(self, requirements: ProjectRequirements, expert_profiles: Optional[List[Dict]],
+                          candidate_ids: Optional[AbstractSet[str]] = None) -> Iterator[Tuple[ExpertFeatures, float]]:
+        """(Features, Score) der Kandidaten mit Mindest-Score, skalar bewertet"""
+        return self._qualifying(requirements, self._candidate_features(requirements, expert_profiles, candidate_ids))
+    
+    def _qualifying(self, requirements: ProjectRequirements,
+                    candidates: Iterable[ExpertFeatures]) -> Iterator[Tuple[ExpertFeatures, float]]:
+        """Bewertet Kandidaten und liefert die mit Mindest-Score"""
+        for features in candidates:
+            # Berechne Match-Score (Features aus dem Cache)
+            match_score = self._score_features(requirements, features)
             
             # Nur relevante Matches
-            if match_score >= 0.3:  # Mindest-Score
-                match = {
-                    "expert_id": expert.get("id", ""),
-                    "expert_name": expert.get("expert_name", ""),
-                    "match_score": match_score,
-                    "matched_at": datetime.now().isoformat(),
-                    "match_reasons": self._get_match_reasons(project, expert),
-                    "gaps": self._get_gaps(project, expert)
-                }
-                matches.append(match)
-        
-        # Sortiere nach Match-Score
-        matches.sort(key=lambda x: x["match_score"], reverse=True)
-        
-        # Speichere Matches
+            if match_score >= self.MIN_MATCH_SCORE:
+                yield features, match_score
+    
+    def _batch_scorer_for(self, expert_profiles: Optional[List[Dict]]) -> BatchScorer:
+        """BatchScorer für die übergebenen Profile bzw. den Bestand des ProfileManagers"""
+        if expert_profiles is not None:
+            return BatchScorer(self.feature_cache.get(expert, inline=True) for expert in expert_profiles)
+        if self.profile_manager is None:
+            raise ValueError("Ohne ProfileManager müssen expert_profiles übergeben werden")
+        
+        # Änderungen anderer Prozesse übernehmen (verwirft den Scorer per Listener)
+        self.profile_manager.refresh()
+        if self._batch_scorer is None:
+            self._batch_scorer = BatchScorer(self.skill_index.ordered())
+        return self._batch_scorer
+    
+    def _parallel_scorer_for(self, expert_profiles: Optional[List[Dict]], workers: int) -> ParallelScorer:
+        """ParallelScorer für die übergebenen Profile bzw. den Bestand des ProfileManagers"""
+        if expert_profiles is not None:
+            return ParallelScorer((self.feature_cache.get(expert, inline=True) for expert in expert_profiles),
+                                  workers)
+        if self.profile_manager is None:
+            raise ValueError("Ohne ProfileManager müssen expert_profiles übergeben werden")
+        
+        # Änderungen anderer Prozesse übernehmen (aktualisiert den Index per Listener)
+        self.profile_manager.refresh()
+        return ParallelScorer(self.skill_index.ordered(), workers)
+    
+    def _build_matches(self, project: Dict, requirements: ProjectRequirements,
+                       scored: Iterable[Tuple[ExpertFeatures, float]], top_k: Optional[int] = None) -> List[Dict]:
+        """Match-Einträge absteigend nach Score, Gründe und Lücken nur für die ausgewählten Experten"""
+        # Sortiere nach Match-Score (Top-K über einen begrenzten Heap; beides stabil bei Gleichstand)
+        if top_k is not None:
+            selected = heapq.nlargest(max(top_k, 0), scored, key=itemgetter(1))
+        else:
+            selected = sorted(scored, key=itemgetter(1), reverse=True)
+        
+        return [self._match_entry(project, requirements, features, match_score)
+                for features, match_score in selected]
+    
+    def _match_entry(self, project: Dict, requirements: ProjectRequirements,
+                     features: ExpertFeatures, match_score: float) -> Dict:
+        """Match-Eintrag eines Experten mit Gründen und Lücken"""
+        return {
+            "expert_id": features.expert_id,
+            "expert_name": features.expert_name,
+            "match_score": match_score,
+            "matched_at": datetime.now().isoformat(),
+            "match_reasons": self._reasons_from_features(project, requirements, features),
+            "gaps": self._gaps_from_features(requirements, features)
+        }
+    
+    def _new_match_record(self, project_id: str, matches: List[Dict]) -> Dict:
+        """Neuer Match-Datensatz (sofort in der Historie, damit IDs im Batch-Lauf eindeutig bleiben)"""
         match_record = {
-            "id": f"match_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "id": generate_record_id("match", self.match_history),
             "project_id": project_id,
             "created_at": datetime.now().isoformat(),
             "matches": matches,
             "total_matches": len(matches)
         }
-        
-        self.matches.append(match_record)
-        self._save_matches()
-        
-        print(f"✅ {len(matches)} Matches gefunden")
-        return matches
+        self._save_matches([match_record])
+        return match_record
+    
+    def select_profile_ids(self, selector=None) -> Optional[Set[str]]:
+        """Löst einen Profil-Selektor über die Indizes des ProfileManagers in Profil-IDs auf
+        
+        "all" bzw. None ergibt None (gesamter Bestand über den Skill-Index),
+        "available" die verfügbaren Profile, {"tags": [...]} Profile mit
+        einem der Tags und {"ids": [...]} genau diese Profile (unbekannte
+        IDs entfallen). Schlüssel eines Dicts werden UND-verknüpft, z.B.
+        {"available": True, "tags": ["sap"]}. Das Ergebnis geht als
+        `candidate_ids` an match_experts_to_project.
+        """
+        if self.profile_manager is None:
+            raise ValueError("Profil-Selektoren benötigen einen ProfileManager")
+        if selector is None or selector == "all":
+            return None
+        if selector == "available":
+            selector = {"available": True}
+        if not isinstance(selector, dict):
+            raise ValueError(f"Unbekannter Profil-Selektor: {selector}")
+        unknown = selector.keys() - {"available", "tags", "ids"}
+        if unknown:
+            raise ValueError(f"Unbekannte Selektor-Felder: {', '.join(sorted(unknown))}")
+        
+        filters = {}
+        if selector.get("available"):
+            filters["availability_status"] = "available"
+        if "tags" in selector:
+            tags = selector["tags"]
+            filters["tags"] = [tags] if isinstance(tags, str) else list(tags)
+        
+        selected = None
+        if filters:
+            selected = {p["id"] for p in self.profile_manager.find(**filters)}
+        if "ids" in selector:
+            ids = {p["id"] for p in self.profile_manager.read_profiles(selector["ids"])}
+            selected = ids if selected is None else selected & ids
+        return selected
+    
+    def _candidate_features(self, requirements: ProjectRequirements, expert_profiles: Optional[List[Dict]],
+                            candidate_ids: Optional[AbstractSet[str]] = None) -> List[ExpertFeatures]:
+        """Features der zu bewertenden Experten (Bestand: Skill-Index, ggf. auf `candidate_ids` beschränkt)"""
+        if expert_profiles is not None:
+            return [self.feature_cache.get(expert, inline=True) for expert in expert_profiles]
+        if self.profile_manager is None:
+            raise ValueError("Ohne ProfileManager müssen expert_profiles übergeben werden")
+        
+        # Änderungen anderer Prozesse übernehmen (aktualisiert den Index per Listener)
+        self.profile_manager.refresh()
+        candidates = self.skill_index.candidates(requirements, self.MIN_MATCH_SCORE)
+        if candidate_ids is not None:
+            candidates = [features for features in candidates if features.expert_id in candidate_ids]
+        return candidates
     
     def _get_project(self, project_id: str) -> Optional[Dict]:
         """Gibt ein Projekt anhand der ID zurück"""
@@ -169,85 +550,38 @@ class ProjectMatcher:
     
     def _calculate_match_score(self, project: Dict, expert: Dict) -> float:
         """Berechnet den Match-Score zwischen Projekt und Experte"""
-        score = 0.0
-        
-        # Skills-Matching (40% Gewichtung)
-        required_skills = project.get("required_skills", [])
-        expert_skills = expert.get("technologien", "").split(", ")
-        expert_skills = [skill.strip() for skill in expert_skills if skill.strip()]
-        
-        if required_skills:
-            skill_matches = len(set(required_skills) & set(expert_skills))
-            skill_score = skill_matches / len(required_skills)
-            score += skill_score * 0.4
-        
-        # Erfahrungs-Matching (20% Gewichtung)
-        required_experience = project.get("min_experience", 0)
-        expert_experience = self._extract_experience_from_text(expert.get("projekthistorie_text", ""))
-        
-        if expert_experience >= required_experience:
-            score += 0.2
-        
-        # Branchen-Matching (15% Gewichtung)
-        project_industry = project.get("industry", "").lower()
-        expert_industries = expert.get("branchenkenntnisse", "").lower()
-        
-        if project_industry and project_industry in expert_industries:
-            score += 0.15
-        
-        # Verfügbarkeit (15% Gewichtung)
-        if expert.get("availability", {}).get("status") == "available":
-            score += 0.15
-        
-        # Zertifizierungen (10% Gewichtung)
-        required_certs = project.get("certifications", [])
-        expert_certs = expert.get("zertifizierungen", "").split(", ")
-        expert_certs = [cert.strip() for cert in expert_certs if cert.strip()]
-        
-        if required_certs:
-            cert_matches = len(set(required_certs) & set(expert_certs))
-            cert_score = cert_matches / len(required_certs)
-            score += cert_score * 0.1
-        
-        return min(score, 1.0)  # Maximal 1.0
+        return self._score_features(ProjectRequirements.from_project(project),
+                                    self.feature_cache.get(expert, inline=True))
+    
+    def _score_features(self, requirements: ProjectRequirements, features: ExpertFeatures) -> float:
+        """Match-Score aus vorberechneten Features (nur Mengen-Operationen, memoisiert je Version)"""
+        return self.score_cache.score(requirements, features)
     
     def _extract_experience_from_text(self, text: str) -> int:
         """Extrahiert Jahre aus Text"""
-        if not text:
-            return 0
-        
-        # Suche nach Jahren in der Projekthistorie
-        years = re.findall(r'(\d+)\s*(?:jahr|year|jahren|years)', text.lower())
-        if years:
-            return max([int(year) for year in years])
-        
-        return 0
+        return extract_experience_years(text)
     
     def _get_match_reasons(self, project: Dict, expert: Dict) -> List[str]:
         """Gibt Gründe für das Matching zurück"""
+        return self._reasons_from_features(project, ProjectRequirements.from_project(project),
+                                           self.feature_cache.get(expert, inline=True))
+    
+    def _reasons_from_features(self, project: Dict, requirements: ProjectRequirements,
+                               features: ExpertFeatures) -> List[str]:
+        """Match-Gründe aus vorberechneten Features"""
         reasons = []
         
         # Skills-Matches
-        required_skills = project.get("required_skills", [])
-        expert_skills = expert.get("technologien", "").split(", ")
-        expert_skills = [skill.strip() for skill in expert_skills if skill.strip()]
-        
-        matching_skills = set(required_skills) & set(expert_skills)
+        matching_skills = requirements.skills & features.skills
         if matching_skills:
             reasons.append(f"Skills: {', '.join(matching_skills)}")
         
         # Branchen-Match
-        project_industry = project.get("industry", "")
-        expert_industries = expert.get("branchenkenntnisse", "")
-        if project_industry and project_industry.lower() in expert_industries.lower():
-            reasons.append(f"Branche: {project_industry}")
+        if requirements.industry and requirements.industry in features.industries:
+            reasons.append(f"Branche: {project.get('industry', '')}")
         
         # Zertifizierungen
-        required_certs = project.get("certifications", [])
-        expert_certs = expert.get("zertifizierungen", "").split(", ")
-        expert_certs = [cert.strip() for cert in expert_certs if cert.strip()]
-        
-        matching_certs = set(required_certs) & set(expert_certs)
+        matching_certs = requirements.certifications & features.certifications
         if matching_certs:
             reasons.append(f"Zertifizierungen: {', '.join(matching_certs)}")
         
@@ -255,34 +589,33 @@ class ProjectMatcher:
     
     def _get_gaps(self, project: Dict, expert: Dict) -> List[str]:
         """Gibt Lücken zwischen Projekt und Experte zurück"""
+        return self._gaps_from_features(ProjectRequirements.from_project(project),
+                                        self.feature_cache.get(expert, inline=True))
+    
+    def _gaps_from_features(self, requirements: ProjectRequirements, features: ExpertFeatures) -> List[str]:
+        """Lücken aus vorberechneten Features"""
         gaps = []
         
         # Fehlende Skills
-        required_skills = project.get("required_skills", [])
-        expert_skills = expert.get("technologien", "").split(", ")
-        expert_skills = [skill.strip() for skill in expert_skills if skill.strip()]
-        
-        missing_skills = set(required_skills) - set(expert_skills)
+        missing_skills = requirements.skills - features.skills
         if missing_skills:
             gaps.append(f"Fehlende Skills: {', '.join(missing_skills)}")
         
         # Fehlende Zertifizierungen
-        required_certs = project.get("certifications", [])
-        expert_certs = expert.get("zertifizierungen", "").split(", ")
-        expert_certs = [cert.strip() for cert in expert_certs if cert.strip()]
-        
-        missing_certs = set(required_certs) - set(expert_certs)
+        missing_certs = requirements.certifications - features.certifications
         if missing_certs:
             gaps.append(f"Fehlende Zertifizierungen: {', '.join(missing_certs)}")
         
         return gaps
     
     def get_project_matches(self, project_id: str) -> List[Dict]:
-        """Gibt Matches für ein Projekt zurück"""
-        for match_record in self.matches:
-            if match_record["project_id"] == project_id:
-                return match_record["matches"]
-        return []
+        """Gibt die Matches des letzten Laufs für ein Projekt zurück"""
+        match_record = self.match_history.latest(project_id)
+        return match_record["matches"] if match_record else []
+    
+    def get_expert_projects(self, expert_id: str, max_rank: Optional[int] = None) -> List[Dict]:
+        """Projekte, in deren letztem Lauf der Experte (bis Rang `max_rank`) gematcht wurde"""
+        return self.match_history.projects_for_expert(expert_id, max_rank)
     
     def get_all_projects(self) -> List[Dict]:
         """Gibt alle Projekte zurück"""
@@ -0,0 +1,75 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+LRU-Cache der Match-Scores, Schlüssel Projekt + updated_at und Experte + updated_at
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from expert_features import ExpertFeatures, ProjectRequirements, score_features
+
+# Geschätzter Speicherbedarf je Eintrag (Schlüssel-Tupel, Wert-Tupel, Float, OrderedDict-Knoten)
+ENTRY_BYTES = 256
+
+
+class MatchScoreCache:
+    """Memoisiert Match-Scores je (Projekt, Experte) mit LRU-Verdrängung.
+
+    Ein Eintrag gilt nur für die gespeicherten Versionen (updated_at, bei
+    übergebenen Profilen mit Inhalts-Hash) von Projekt und Profil; nach einer Änderung wird der Score beim nächsten
+    Zugriff neu berechnet und der Eintrag überschrieben. Paare ohne
+    Projekt-ID oder Versionen werden immer berechnet. Die Größe ist über
+    `max_mb` begrenzt (Schätzung über ENTRY_BYTES); 0 schaltet den Cache ab.
+    """
+
+    def __init__(self, max_mb: float = 50):
+        self.max_entries = int(max_mb * 1024 * 1024) // ENTRY_BYTES
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def score(self, requirements: ProjectRequirements, features: ExpertFeatures) -> float:
+        """Match-Score aus dem Cache, falls Projekt und Profil unverändert sind"""
+        if not (self.max_entries and requirements.project_id and requirements.version and features.version):
+            return score_features(requirements, features)
+
+        key = (requirements.project_id, features.expert_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == requirements.version and entry[1] == features.version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+
+        self.misses += 1
+        match_score = score_features(requirements, features)
+        with self._lock:
+            self._entries[key] = (requirements.version, features.version, match_score)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return match_score
+
+    def clear(self):
+        """Leert den Cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Cache-Statistik"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
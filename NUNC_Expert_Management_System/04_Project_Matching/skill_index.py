@@ -0,0 +1,196 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Invertierter Index (Skill, Zertifikat, Branche -> Experten) zur Kandidaten-Vorauswahl
+"""
+
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set
+
+from expert_features import ExpertFeatures, ProjectRequirements
+
+# Gewichte des Match-Scores (siehe ProjectMatcher._score_features)
+SKILL_WEIGHT = 0.4
+EXPERIENCE_WEIGHT = 0.2
+INDUSTRY_WEIGHT = 0.15
+AVAILABILITY_WEIGHT = 0.15
+CERT_WEIGHT = 0.1
+
+# Toleranz für Rundungsunterschiede zwischen Schranke und exaktem Score
+BOUND_EPSILON = 1e-9
+
+
+def trigrams(text: str) -> Set[str]:
+    """Alle Zeichen-Trigramme eines Textes"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SkillIndex:
+    """Invertierter Index über die Experten-Features, inkrementell gepflegt.
+
+    Skills und Zertifikate werden exakt indexiert (wie im Score), Branchen
+    über Trigramme mit anschließender Teilstring-Prüfung. Verfügbarkeit und
+    Erfahrung liegen als Mengen vor. candidates() liefert alle Experten,
+    deren Score die Schwelle erreichen kann - alle übrigen müssen nicht
+    bewertet werden.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Leert den Index"""
+        self._features: Dict[str, ExpertFeatures] = {}
+        self._order: Dict[str, int] = {}
+        self._counter = count()
+        self._skills: Dict[str, Set[str]] = defaultdict(set)
+        self._certs: Dict[str, Set[str]] = defaultdict(set)
+        self._industry_trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._available: Set[str] = set()
+        self._by_experience: Dict[int, Set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def __contains__(self, expert_id: str) -> bool:
+        return expert_id in self._features
+
+    def get(self, expert_id: str) -> Optional[ExpertFeatures]:
+        """Features eines indexierten Experten"""
+        return self._features.get(expert_id)
+
+    def position(self, expert_id: str) -> int:
+        """Einfüge-Position eines Experten (Reihenfolge bei Score-Gleichstand)"""
+        return self._order[expert_id]
+
+    def ordered(self) -> List[ExpertFeatures]:
+        """Alle indexierten Features in Einfüge-Reihenfolge (wie candidates())"""
+        return sorted(self._features.values(), key=lambda features: self._order[features.expert_id])
+
+    def rebuild(self, features: Iterable[ExpertFeatures]):
+        """Baut den Index komplett neu auf"""
+        self.clear()
+        for item in features:
+            self.add(item)
+
+    def add(self, features: ExpertFeatures):
+        """Indexiert einen Experten (ersetzt einen vorhandenen Eintrag)"""
+        expert_id = features.expert_id
+        if expert_id in self._features:
+            self._unindex(expert_id)
+        else:
+            self._order[expert_id] = next(self._counter)
+
+        self._features[expert_id] = features
+        for skill in features.skills:
+            self._skills[skill].add(expert_id)
+        for cert in features.certifications:
+            self._certs[cert].add(expert_id)
+        for trigram in trigrams(features.industries):
+            self._industry_trigrams[trigram].add(expert_id)
+        if features.available:
+            self._available.add(expert_id)
+        self._by_experience[features.experience_years].add(expert_id)
+
+    def remove(self, expert_id: str):
+        """Entfernt einen Experten aus dem Index"""
+        self._unindex(expert_id)
+        self._order.pop(expert_id, None)
+
+    def _unindex(self, expert_id: str):
+        """Entfernt die Postings eines Experten (Reihenfolge bleibt erhalten)"""
+        features = self._features.pop(expert_id, None)
+        if features is None:
+            return
+
+        for postings, keys in ((self._skills, features.skills),
+                               (self._certs, features.certifications),
+                               (self._industry_trigrams, trigrams(features.industries)),
+                               (self._by_experience, (features.experience_years,))):
+            for key in keys:
+                ids = postings[key]
+                ids.discard(expert_id)
+                if not ids:
+                    del postings[key]
+        self._available.discard(expert_id)
+
+    def _industry_matches(self, industry: str) -> Set[str]:
+        """Experten, deren Branchenkenntnisse `industry` als Teilstring enthalten"""
+        if not industry:
+            return set()
+
+        grams = trigrams(industry)
+        if grams:
+            postings = sorted((self._industry_trigrams.get(gram, set()) for gram in grams), key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= ids
+        else:
+            # Zu kurz für Trigramme - alle Experten prüfen
+            candidates = self._features.keys()
+
+        return {expert_id for expert_id in candidates if industry in self._features[expert_id].industries}
+
+    def _experienced(self, min_experience) -> Set[str]:
+        """Experten mit mindestens `min_experience` Jahren"""
+        experienced = set()
+        for years, ids in self._by_experience.items():
+            if years >= min_experience:
+                experienced |= ids
+        return experienced
+
+    def candidates(self, requirements: ProjectRequirements, threshold: float) -> List[ExpertFeatures]:
+        """Experten, deren maximal möglicher Score `threshold` erreicht
+
+        Skill- und Zertifikats-Treffer werden aus den Postings aufsummiert;
+        zusammen mit Branche, Verfügbarkeit und Erfahrung ergibt das eine
+        Schranke je Experte. Experten ohne jeden Skill-/Zertifikats-/Branchen-
+        Treffer erreichen höchstens 0.2 (Erfahrung) + 0.15 (Verfügbarkeit)
+        und werden nur über diese Mengen aufgenommen. Die Reihenfolge
+        entspricht der Einfüge-Reihenfolge des Index.
+        """
+        limit = threshold - BOUND_EPSILON
+        skill_hits: Dict[str, int] = defaultdict(int)
+        cert_hits: Dict[str, int] = defaultdict(int)
+        for skill in requirements.skills:
+            for expert_id in self._skills.get(skill, ()):
+                skill_hits[expert_id] += 1
+        for cert in requirements.certifications:
+            for expert_id in self._certs.get(cert, ()):
+                cert_hits[expert_id] += 1
+        industry_hits = self._industry_matches(requirements.industry)
+        experienced = self._experienced(requirements.min_experience)
+
+        candidate_ids: Set[str] = set(skill_hits) | set(cert_hits) | industry_hits
+
+        # Experten ohne Treffer: nur Erfahrung/Verfügbarkeit zählen
+        if limit <= 0:
+            candidate_ids |= self._features.keys()
+        else:
+            if EXPERIENCE_WEIGHT + AVAILABILITY_WEIGHT >= limit:
+                candidate_ids |= experienced & self._available
+            if EXPERIENCE_WEIGHT >= limit:
+                candidate_ids |= experienced
+            if AVAILABILITY_WEIGHT >= limit:
+                candidate_ids |= self._available
+
+        result = []
+        for expert_id in candidate_ids:
+            bound = 0.0
+            if requirements.skill_count:
+                bound += skill_hits.get(expert_id, 0) / requirements.skill_count * SKILL_WEIGHT
+            if expert_id in experienced:
+                bound += EXPERIENCE_WEIGHT
+            if expert_id in industry_hits:
+                bound += INDUSTRY_WEIGHT
+            if expert_id in self._available:
+                bound += AVAILABILITY_WEIGHT
+            if requirements.cert_count:
+                bound += cert_hits.get(expert_id, 0) / requirements.cert_count * CERT_WEIGHT
+            if bound >= limit:
+                result.append(expert_id)
+
+        result.sort(key=self._order.__getitem__)
+        return [self._features[expert_id] for expert_id in result]
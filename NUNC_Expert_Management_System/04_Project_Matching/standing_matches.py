@@ -0,0 +1,81 @@
+"""
+NUNC Expert Management System - Projekt-Matching
+Laufend aktuelle Match-Listen je Projekt (inkrementelles Re-Matching)
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from expert_features import ProjectRequirements
+
+
+class StandingMatches:
+    """Gespeicherte Match-Liste eines Projekts, die bei Änderungen nachgeführt wird.
+
+    Hält die Matches des letzten Laufs gegen den Profil-Bestand (Top-K oder
+    alle über dem Mindest-Score) und übernimmt geänderte Scores einzelner
+    Experten. Die Reihenfolge entspricht einem vollständigen Lauf: absteigend
+    nach Score, bei Gleichstand nach Position im Skill-Index.
+    """
+
+    def __init__(self, project: Dict, record: Dict, top_k: Optional[int], position: Callable[[str], int]):
+        self.project = project
+        self.requirements = ProjectRequirements.from_project(project)
+        self.record = record
+        self.top_k = top_k
+        self._position = position
+        self._matches: Dict[str, Dict] = {m["expert_id"]: m for m in record["matches"]}
+
+    def __contains__(self, expert_id: str) -> bool:
+        return expert_id in self._matches
+
+    @property
+    def full(self) -> bool:
+        """True, wenn die Top-K-Liste voll ist (weitere Experten können fehlen)"""
+        return self.top_k is not None and len(self._matches) >= self.top_k
+
+    def _rank(self, match: Dict) -> Tuple[float, int]:
+        """Sortierschlüssel (kleiner = besser)"""
+        return -match["match_score"], self._position(match["expert_id"])
+
+    def update(self, expert_id: str, match: Optional[Dict]) -> Optional[bool]:
+        """Übernimmt den neuen Match eines Experten (None = unter dem Mindest-Score)
+
+        Gibt zurück, ob sich die Liste geändert hat, oder None, wenn sie ohne
+        Neuberechnung nicht bestimmt werden kann: Ein Eintrag einer vollen
+        Top-K-Liste ist schlechter geworden oder weggefallen, und der
+        Nachrücker ist unbekannt.
+        """
+        old = self._matches.get(expert_id)
+        if old is None:
+            if match is None:
+                return False
+            if self.full:
+                if not self._matches:
+                    return False  # top_k == 0
+                worst = max(self._matches.values(), key=self._rank)
+                if self._rank(match) > self._rank(worst):
+                    return False
+                del self._matches[worst["expert_id"]]
+        elif self.full and (match is None or self._rank(match) > self._rank(old)):
+            return None
+
+        if match is None:
+            del self._matches[expert_id]
+        else:
+            self._matches[expert_id] = match
+        self._sync()
+        return True
+
+    def replace(self, matches: List[Dict]):
+        """Ersetzt die Liste nach einer Neuberechnung des Projekts"""
+        self.requirements = ProjectRequirements.from_project(self.project)
+        self._matches = {m["expert_id"]: m for m in matches}
+        self._sync()
+
+    def _sync(self):
+        """Schreibt die Liste in den Match-Datensatz zurück"""
+        matches = sorted(self._matches.values(), key=self._rank)
+        self.record["matches"] = matches
+        self.record["total_matches"] = len(matches)
+        self.record["updated_at"] = datetime.now().isoformat()
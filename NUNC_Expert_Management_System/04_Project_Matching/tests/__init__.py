@@ -0,0 +1,4 @@
+"""
+NUNC Expert Management System - Projekt-Matching Tests
+Unit-Tests für ProjectMatcher
+"""
@@ -0,0 +1,91 @@
+"""
+NUNC Expert Management System - Projekt-Matching Tests
+Unit-Tests für den Min-Cost-Flow-Solver und das Portfolio-Matching
+"""
+
+import random
+from itertools import permutations
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+
+from assignment_solver import MinCostFlow, solve_assignment
+from project_matcher import ProjectMatcher
+
+
+def make_expert(expert_id, skills, hours=40, status="available"):
+    """Experten-Profil mit Wochenstunden"""
+    return {
+        "id": expert_id,
+        "updated_at": "2025-01-01T00:00:00",
+        "expert_name": f"Experte {expert_id}",
+        "technologien": skills,
+        "branchenkenntnisse": "",
+        "projekthistorie_text": "5 Jahre Erfahrung",
+        "availability": {"status": status, "hours_per_week": hours},
+    }
+
+
+class TestMinCostFlow:
+    """Test-Klasse für den Solver"""
+
+    def test_min_cost_max_flow(self):
+        """Test klassisches Beispiel mit eindeutiger Lösung"""
+        solver = MinCostFlow(4)
+        solver.add_edge(0, 1, 2, 1)
+        solver.add_edge(0, 2, 1, 2)
+        solver.add_edge(1, 2, 1, 1)
+        solver.add_edge(1, 3, 1, 3)
+        solver.add_edge(2, 3, 2, 1)
+        assert solver.solve(0, 3, only_improving=False) == (3, 10)
+
+    def test_matches_brute_force_assignment(self):
+        """Test Ein-Stunden-Kapazitäten entsprechen der optimalen Paarung"""
+        rng = random.Random(3)
+        for _ in range(30):
+            experts = [f"e{i}" for i in range(rng.randint(1, 5))]
+            projects = [f"p{j}" for j in range(rng.randint(1, 4))]
+            scores = {(e, p): rng.randint(30, 100) / 100 for e in experts for p in projects if rng.random() < 0.7}
+
+            result = solve_assignment({e: 1 for e in experts}, {p: 1 for p in projects}, scores)
+            size = max(len(experts), len(projects))
+            padded = projects + [None] * (size - len(projects))
+            best = max(sum(scores.get((e, p), 0.0) for e, p in zip(experts, order))
+                       for order in permutations(padded))
+            assert round(sum(scores[pair] for pair in result), 6) == round(best, 6)
+
+    def test_respects_hours(self):
+        """Test Stunden eines Experten werden auf Projekte aufgeteilt"""
+        result = solve_assignment({"a": 40, "b": 20}, {"x": 30, "y": 30},
+                                  {("a", "x"): 0.9, ("a", "y"): 0.8, ("b", "y"): 0.5})
+        assert result == {("a", "x"): 30, ("a", "y"): 10, ("b", "y"): 20}
+
+
+class TestPortfolioMatching:
+    """Test-Klasse für match_all_active_projects"""
+
+    def test_top_expert_not_given_to_every_project(self, tmp_path, monkeypatch):
+        """Test ein gefragter Experte wird nur im Rahmen seiner Stunden verplant"""
+        monkeypatch.chdir(tmp_path)
+        matcher = ProjectMatcher()
+        first = matcher.create_project({"title": "A", "required_skills": ["Salesforce", "SAP"], "hours_per_week": "40"})
+        second = matcher.create_project({"title": "B", "required_skills": ["Salesforce"], "hours_per_week": "40"})
+        experts = [make_expert("star", "Salesforce, SAP"), make_expert("sap", "SAP"),
+                   make_expert("sf", "Salesforce")]
+
+        result = matcher.match_all_active_projects(experts)
+        assert [a["expert_id"] for a in result["assignments"][first]] == ["star"]
+        assert [a["expert_id"] for a in result["assignments"][second]] == ["sf"]
+        assert result["unfilled_hours"] == {}
+
+    def test_unfilled_demand_reported(self, tmp_path, monkeypatch):
+        """Test nicht gedeckter Bedarf wird je Projekt ausgewiesen"""
+        monkeypatch.chdir(tmp_path)
+        matcher = ProjectMatcher()
+        project_id = matcher.create_project({"title": "A", "required_skills": ["SAP"], "hours_per_week": "60"})
+
+        result = matcher.match_all_active_projects([make_expert("sap", "SAP", hours="32 h")])
+        assert result["assignments"][project_id][0]["hours"] == 32
+        assert result["unfilled_hours"] == {project_id: 28}
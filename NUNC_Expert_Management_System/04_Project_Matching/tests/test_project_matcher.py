@@ -0,0 +1,662 @@
+"""
+NUNC Expert Management System - Projekt-Matching Tests
+Unit-Tests für ProjectMatcher und den Experten-Feature-Cache
+"""
+
+import json
+import random
+import pytest
+from pathlib import Path
+
+# Importiere die zu testenden Module
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent / '01_Core_System'))
+
+from batch_scoring import NUMPY_AVAILABLE, BatchScorer
+import parallel_matching
+from parallel_matching import ParallelScorer
+from expert_features import ExpertFeatures, ProjectRequirements, extract_experience_years
+from match_history import MatchHistory
+from project_matcher import ProjectMatcher
+from profile_manager import ProfileManager
+from score_cache import ENTRY_BYTES, MatchScoreCache
+
+
+PROJECT = {
+    "title": "Salesforce Implementation",
+    "industry": "Banking",
+    "required_skills": ["Salesforce", "CRM", "Python"],
+    "certifications": ["Salesforce Certified Administrator"],
+    "min_experience": 3,
+}
+
+
+def make_expert(expert_id, skills="Salesforce, CRM", certs="", industries="Banking, Retail",
+                history="5 Jahre Erfahrung", status="available", updated_at="2025-01-01T00:00:00"):
+    """Erzeugt ein Experten-Profil in der Struktur des ProfileManagers"""
+    return {
+        "id": expert_id,
+        "updated_at": updated_at,
+        "expert_name": f"Experte {expert_id}",
+        "technologien": skills,
+        "zertifizierungen": certs,
+        "branchenkenntnisse": industries,
+        "projekthistorie_text": history,
+        "availability": {"status": status},
+    }
+
+
+@pytest.fixture
+def matcher(tmp_path, monkeypatch):
+    """ProjectMatcher mit leerem Speicher im temporären Verzeichnis"""
+    monkeypatch.chdir(tmp_path)
+    return ProjectMatcher()
+
+
+class TestExpertFeatures:
+    """Test-Klasse für die Feature-Extraktion"""
+
+    def test_features_are_parsed_once(self):
+        """Test Listen-Felder und Erfahrung werden korrekt zerlegt"""
+        features = ExpertFeatures.from_profile(make_expert("e1", skills="Salesforce, , CRM ", history="3 years, 10 Jahren"))
+        assert features.skills == {"Salesforce", "CRM"}
+        assert features.experience_years == 10
+        assert features.industries == "banking, retail"
+        assert features.available is True
+        assert extract_experience_years("") == 0
+
+    def test_cache_keyed_by_updated_at(self, matcher):
+        """Test geänderte Profile werden neu extrahiert, unveränderte nicht"""
+        expert = make_expert("e1")
+        first = matcher.feature_cache.get(expert)
+        assert matcher.feature_cache.get(expert) is first
+
+        expert = make_expert("e1", skills="SAP", updated_at="2025-02-01T00:00:00")
+        assert matcher.feature_cache.get(expert).skills == {"SAP"}
+        assert matcher.feature_cache.stats()["hits"] == 1
+
+
+class TestMatchScore:
+    """Test-Klasse für den Match-Score"""
+
+    def test_weighted_score(self, matcher):
+        """Test Gewichtung 0.4 Skills, 0.2 Erfahrung, 0.15 Branche, 0.15 Verfügbarkeit, 0.1 Zertifikate"""
+        full = make_expert("e1", skills="Salesforce, CRM, Python", certs="Salesforce Certified Administrator")
+        assert matcher._calculate_match_score(PROJECT, full) == pytest.approx(1.0)
+
+        partial = make_expert("e2", industries="Retail", history="1 Jahr", status="busy")
+        assert matcher._calculate_match_score(PROJECT, partial) == 2 / 3 * 0.4
+
+        assert matcher._get_gaps(PROJECT, partial) == [
+            "Fehlende Skills: Python",
+            "Fehlende Zertifizierungen: Salesforce Certified Administrator",
+        ]
+        assert matcher._get_match_reasons(PROJECT, full)[1] == "Branche: Banking"
+
+    def test_match_filters_and_sorts(self, matcher):
+        """Test nur Matches ab 0.3, absteigend sortiert"""
+        project_id = matcher.create_project(PROJECT)
+        experts = [
+            make_expert("low", skills="SAP", industries="", history="", status="busy"),
+            make_expert("mid"),
+            make_expert("top", skills="Salesforce, CRM, Python"),
+        ]
+
+        matches = matcher.match_experts_to_project(project_id, experts)
+        assert [m["expert_id"] for m in matches] == ["top", "mid"]
+
+    def test_profile_changes_invalidate_cache(self, matcher, tmp_path):
+        """Test der Cache hängt als Listener am ProfileManager"""
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        matcher = ProjectMatcher(profile_manager=manager)
+
+        profile_id = manager.create_profile({"expert_name": "A", "technologien": "SAP"})
+        matcher.feature_cache.get(manager.read_profile(profile_id))
+        assert len(matcher.feature_cache) == 1
+
+        manager.update_profile(profile_id, {"technologien": "Salesforce"})
+        assert matcher.feature_cache.get(manager.read_profile(profile_id)).skills == {"Salesforce"}
+        assert matcher.skill_index.get(profile_id).skills == {"Salesforce"}
+
+
+class TestTopK:
+    """Test-Klasse für Top-K-Matching"""
+
+    def experts(self):
+        """Experten mit vielen Gleichständen im Score"""
+        skills = ["Salesforce", "Salesforce, CRM", "Salesforce, CRM, Python", "SAP"]
+        return [make_expert(f"e{i}", skills=skills[i % 4], status=["available", "busy"][i % 3 == 0])
+                for i in range(40)]
+
+    def test_top_k_is_prefix_of_full_ranking(self, matcher):
+        """Test Top-K liefert die ersten K des vollständigen Rankings"""
+        project_id = matcher.create_project(PROJECT)
+        full = matcher.match_experts_to_project(project_id, self.experts())
+        top = matcher.match_experts_to_project(project_id, self.experts(), top_k=5)
+        assert [m["expert_id"] for m in top] == [m["expert_id"] for m in full[:5]]
+        assert matcher.match_experts_to_project(project_id, self.experts(), top_k=0) == []
+
+    def test_explanations_only_for_top_k(self, matcher, monkeypatch):
+        """Test Gründe/Lücken werden nur für die K Ergebnisse erzeugt, gespeichert werden nur K"""
+        project_id = matcher.create_project(PROJECT)
+        calls = []
+        explain = matcher._reasons_from_features
+        monkeypatch.setattr(matcher, "_reasons_from_features", lambda *args: calls.append(1) or explain(*args))
+
+        matches = matcher.match_experts_to_project(project_id, self.experts(), top_k=3)
+        assert len(matches) == len(calls) == 3
+        assert len(matcher.matches[-1]["matches"]) == matcher.matches[-1]["total_matches"] == 3
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy nicht installiert")
+    def test_batch_top_k_equals_scalar_top_k(self, matcher):
+        """Test Batch-Auswahl behandelt Gleichstände wie heapq.nlargest"""
+        project_id = matcher.create_project(PROJECT)
+        for k in (1, 7, 20, 100):
+            scalar = matcher.match_experts_to_project(project_id, self.experts(), top_k=k)
+            batched = matcher.match_experts_to_project(project_id, self.experts(), batch=True, top_k=k)
+            assert [(m["expert_id"], m["match_score"]) for m in batched] == \
+                [(m["expert_id"], m["match_score"]) for m in scalar]
+
+
+class TestSkillIndex:
+    """Test-Klasse für die Kandidaten-Vorauswahl über den Skill-Index"""
+
+    SKILLS = ["Salesforce", "CRM", "Python", "SAP", "Java", "Apex"]
+    CERTS = ["PMP", "Salesforce Certified Administrator", "ITIL"]
+    INDUSTRIES = ["Banking", "Retail", "Automotive", "Pharma", ""]
+
+    def random_profile(self, rng):
+        """Zufälliges Profil für den Vergleich Index vs. vollständiger Scan"""
+        return {
+            "expert_name": "Zufall",
+            "technologien": ", ".join(rng.sample(self.SKILLS, rng.randint(0, 3))),
+            "zertifizierungen": ", ".join(rng.sample(self.CERTS, rng.randint(0, 2))),
+            "branchenkenntnisse": ", ".join(rng.sample(self.INDUSTRIES, rng.randint(0, 2))),
+            "projekthistorie_text": f"{rng.randint(0, 8)} Jahre Erfahrung",
+            "availability": {"status": rng.choice(["available", "busy"])},
+        }
+
+    def test_index_matches_full_scan(self, tmp_path, monkeypatch):
+        """Test Index-Matching liefert dieselben Matches wie der vollständige Scan"""
+        monkeypatch.chdir(tmp_path)
+        rng = random.Random(7)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        manager.create_profiles_bulk(self.random_profile(rng) for _ in range(200))
+        matcher = ProjectMatcher(profile_manager=manager)
+
+        for _ in range(20):
+            project_id = matcher.create_project({
+                "title": "Zufallsprojekt",
+                "industry": rng.choice(self.INDUSTRIES + ["ban", "ta"]),
+                "required_skills": rng.sample(self.SKILLS, rng.randint(0, 3)),
+                "certifications": rng.sample(self.CERTS, rng.randint(0, 2)),
+                "min_experience": rng.randint(0, 9),
+            })
+            indexed = matcher.match_experts_to_project(project_id)
+            scanned = matcher.match_experts_to_project(project_id, manager.get_all_profiles())
+            assert [(m["expert_id"], m["match_score"]) for m in indexed] == \
+                [(m["expert_id"], m["match_score"]) for m in scanned]
+
+    def test_selective_project_prunes_candidates(self, tmp_path, monkeypatch):
+        """Test bei seltenen Skills werden nur wenige Experten bewertet"""
+        monkeypatch.chdir(tmp_path)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        manager.create_profiles_bulk(
+            [{"technologien": "Java", "availability": {"status": "busy"}} for _ in range(50)]
+            + [{"technologien": "Salesforce, Apex", "availability": {"status": "busy"}}]
+        )
+        matcher = ProjectMatcher(profile_manager=manager)
+
+        requirements = ProjectRequirements.from_project(
+            {"required_skills": ["Salesforce", "Apex"], "min_experience": 5}
+        )
+        candidates = matcher.skill_index.candidates(requirements, ProjectMatcher.MIN_MATCH_SCORE)
+        assert [c.skills for c in candidates] == [{"Salesforce", "Apex"}]
+
+    def test_deleted_profiles_leave_the_index(self, tmp_path, monkeypatch):
+        """Test gelöschte Profile werden nicht mehr gematcht"""
+        monkeypatch.chdir(tmp_path)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        profile_id = manager.create_profile({"technologien": "SAP"})
+        matcher = ProjectMatcher(profile_manager=manager)
+
+        manager.delete_profile(profile_id)
+        assert profile_id not in matcher.skill_index
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy nicht installiert")
+class TestBatchScoring:
+    """Test-Klasse für die vektorisierte Batch-Bewertung"""
+
+    def test_scores_identical_to_scalar_path(self, matcher):
+        """Test Matrix-Scores sind bitgenau gleich den skalaren Scores"""
+        rng = random.Random(11)
+        index_test = TestSkillIndex()
+        features = [ExpertFeatures.from_profile(dict(index_test.random_profile(rng), id=f"e{i}"))
+                    for i in range(300)]
+        scorer = BatchScorer(features)
+
+        projects = [{
+            "industry": rng.choice(TestSkillIndex.INDUSTRIES + ["ban", "ta"]),
+            "required_skills": rng.sample(TestSkillIndex.SKILLS + ["Cobol"], rng.randint(0, 4)),
+            "certifications": rng.sample(TestSkillIndex.CERTS, rng.randint(0, 3)),
+            "min_experience": rng.randint(0, 9),
+        } for _ in range(30)]
+        requirements = [ProjectRequirements.from_project(p) for p in projects]
+
+        matrix = scorer.score_many(requirements)
+        for row, item in enumerate(requirements):
+            assert matrix[row].tolist() == [matcher._score_features(item, f) for f in features]
+
+    def test_batch_matching_equals_index_matching(self, tmp_path, monkeypatch):
+        """Test Batch-Modus liefert dieselben Matches wie der Skill-Index"""
+        monkeypatch.chdir(tmp_path)
+        rng = random.Random(5)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        manager.create_profiles_bulk(TestSkillIndex().random_profile(rng) for _ in range(150))
+        matcher = ProjectMatcher(profile_manager=manager)
+
+        project_ids = [matcher.create_project({
+            "title": f"Projekt {i}",
+            "industry": rng.choice(TestSkillIndex.INDUSTRIES),
+            "required_skills": rng.sample(TestSkillIndex.SKILLS, rng.randint(1, 3)),
+            "min_experience": rng.randint(0, 6),
+        }) for i in range(5)]
+
+        batched = matcher.match_projects_batch()
+        assert list(batched) == project_ids
+        for project_id in project_ids:
+            indexed = matcher.match_experts_to_project(project_id)
+            assert [(m["expert_id"], m["match_score"]) for m in batched[project_id]] == \
+                [(m["expert_id"], m["match_score"]) for m in indexed]
+        assert len({record["id"] for record in matcher.matches}) == 10
+
+    def test_scorer_rebuilt_after_profile_change(self, tmp_path, monkeypatch):
+        """Test Profil-Änderungen verwerfen den kodierten Bestand"""
+        monkeypatch.chdir(tmp_path)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        profile_id = manager.create_profile({"technologien": "Java"})
+        matcher = ProjectMatcher(profile_manager=manager)
+        project_id = matcher.create_project({"title": "SAP", "required_skills": ["SAP"], "min_experience": 5})
+
+        assert matcher.match_experts_to_project(project_id, batch=True) == []
+        manager.update_profile(profile_id, {"technologien": "SAP"})
+        assert [m["expert_id"] for m in matcher.match_experts_to_project(project_id, batch=True)] == [profile_id]
+
+
+class TestParallelMatching:
+    """Test-Klasse für das Matching über einen Prozess-Pool"""
+
+    @staticmethod
+    def random_projects(rng, count):
+        return [{
+            "industry": rng.choice(TestSkillIndex.INDUSTRIES),
+            "required_skills": rng.sample(TestSkillIndex.SKILLS, rng.randint(1, 3)),
+            "certifications": rng.sample(TestSkillIndex.CERTS, rng.randint(0, 2)),
+            "min_experience": rng.randint(0, 6),
+        } for _ in range(count)]
+
+    @pytest.mark.parametrize("top_k", [None, 0, 7])
+    def test_shards_equal_single_process(self, matcher, top_k):
+        """Test zusammengeführte Shard-Ergebnisse entsprechen dem skalaren Lauf"""
+        rng = random.Random(17)
+        index_test = TestSkillIndex()
+        features = [ExpertFeatures.from_profile(dict(index_test.random_profile(rng), id=f"e{i}"))
+                    for i in range(200)]
+        requirements = [ProjectRequirements.from_project(p) for p in self.random_projects(rng, 6)]
+
+        scorer = ParallelScorer(features, workers=3, min_shard_size=10)
+        assert scorer.workers == 3
+        for item, scored in zip(requirements, scorer.matches_many(requirements, matcher.MIN_MATCH_SCORE, top_k)):
+            expected = matcher._build_matches(PROJECT, item, matcher._qualifying(item, features), top_k)
+            actual = matcher._build_matches(PROJECT, item, scored, top_k)
+            assert [(m["expert_id"], m["match_score"]) for m in actual] == \
+                [(m["expert_id"], m["match_score"]) for m in expected]
+            if top_k is not None:
+                assert [f.expert_id for f, _ in scored] == [m["expert_id"] for m in expected]
+
+    def test_small_pools_stay_in_process(self):
+        """Test kleine Bestände werden nicht auf Prozesse verteilt"""
+        features = [ExpertFeatures.from_profile(make_expert(f"e{i}")) for i in range(50)]
+        assert ParallelScorer(features, workers=8).workers == 1
+        assert ParallelScorer(features, workers=8, min_shard_size=20).workers == 2
+
+    def test_batch_matching_with_workers(self, tmp_path, monkeypatch):
+        """Test match_projects_batch mit Workern liefert dieselben Matches"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(parallel_matching, "MIN_SHARD_SIZE", 20)
+        rng = random.Random(8)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        manager.create_profiles_bulk(TestSkillIndex().random_profile(rng) for _ in range(120))
+        matcher = ProjectMatcher(profile_manager=manager)
+        for i, project in enumerate(self.random_projects(rng, 4)):
+            matcher.create_project(dict(project, title=f"Projekt {i}"))
+
+        serial = matcher.match_projects_batch(top_k=10)
+        parallel = matcher.match_projects_batch(top_k=10, workers=2)
+        assert list(parallel) == list(serial)
+        for project_id, matches in serial.items():
+            assert [(m["expert_id"], m["match_score"]) for m in parallel[project_id]] == \
+                [(m["expert_id"], m["match_score"]) for m in matches]
+
+
+class TestScoreCache:
+    """Test-Klasse für den Match-Score-Cache"""
+
+    def test_repeat_match_uses_cache(self, matcher):
+        """Test ein wiederholter Lauf berechnet nur geänderte Paare neu"""
+        project_id = matcher.create_project(PROJECT)
+        experts = [make_expert(f"e{i}") for i in range(5)]
+        first = matcher.match_experts_to_project(project_id, experts)
+        assert matcher.score_cache.stats()["misses"] == 5
+
+        experts[2] = make_expert("e2", skills="Python", updated_at="2025-02-01T00:00:00")
+        second = matcher.match_experts_to_project(project_id, experts)
+        stats = matcher.score_cache.stats()
+        assert (stats["hits"], stats["misses"]) == (4, 6)
+        assert [m["match_score"] for m in first if m["expert_id"] != "e2"] == \
+            [m["match_score"] for m in second if m["expert_id"] != "e2"]
+
+    def test_inline_profile_change_without_new_version(self, matcher):
+        """Test übergebene Profile mit geändertem Inhalt, aber gleichem updated_at werden neu bewertet"""
+        project_id = matcher.create_project(PROJECT)
+        before = matcher.match_experts_to_project(project_id, [make_expert("e1", skills="Python")])
+        after = matcher.match_experts_to_project(project_id, [make_expert("e1")])
+        again = matcher.match_experts_to_project(project_id, [make_expert("e1")])
+
+        assert after[0]["match_score"] > before[0]["match_score"]
+        assert after[0]["match_reasons"] != before[0]["match_reasons"]
+        assert again[0]["match_score"] == after[0]["match_score"]
+        assert matcher.score_cache.stats()["hits"] == 1
+
+    def test_project_update_invalidates(self, matcher):
+        """Test ein geändertes Projekt wird neu bewertet"""
+        project_id = matcher.create_project(PROJECT)
+        experts = [make_expert("e1")]
+        before = matcher.match_experts_to_project(project_id, experts)[0]["match_score"]
+        matcher.update_project(project_id, {"required_skills": ["Salesforce"]})
+        after = matcher.match_experts_to_project(project_id, experts)[0]["match_score"]
+
+        assert after > before
+        assert matcher.score_cache.stats()["misses"] == 2
+
+    def test_lru_eviction(self):
+        """Test die ältesten Einträge werden über der Speichergrenze verdrängt"""
+        cache = MatchScoreCache(max_mb=2 * ENTRY_BYTES / (1024 * 1024))
+        requirements = ProjectRequirements.from_project(dict(PROJECT, id="p1", updated_at="v1"))
+        features = [ExpertFeatures.from_profile(make_expert(f"e{i}")) for i in range(3)]
+
+        cache.score(requirements, features[0])
+        cache.score(requirements, features[1])
+        cache.score(requirements, features[0])
+        cache.score(requirements, features[2])
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+        cache.score(requirements, features[0])
+        cache.score(requirements, features[1])
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_unversioned_pairs_are_not_cached(self):
+        """Test Projekte ohne ID oder Profile ohne updated_at werden immer berechnet"""
+        cache = MatchScoreCache()
+        features = ExpertFeatures.from_profile(make_expert("e1", updated_at=None))
+        cache.score(ProjectRequirements.from_project(PROJECT), features)
+        cache.score(ProjectRequirements.from_project(dict(PROJECT, id="p1", updated_at="v1")), features)
+        assert len(cache) == 0
+
+
+class TestIncrementalMatching:
+    """Test-Klasse für laufend aktuelle Match-Listen"""
+
+    def setup_matcher(self, tmp_path, monkeypatch, count=60):
+        """ProfileManager mit Zufallsprofilen und verbundenem ProjectMatcher"""
+        monkeypatch.chdir(tmp_path)
+        rng = random.Random(21)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        manager.create_profiles_bulk(TestSkillIndex().random_profile(rng) for _ in range(count))
+        return rng, manager, ProjectMatcher(profile_manager=manager)
+
+    @pytest.mark.parametrize("top_k", [None, 3])
+    def test_profile_changes_keep_lists_current(self, tmp_path, monkeypatch, top_k):
+        """Test nach zufälligen Profil-Änderungen entspricht die Liste einem vollständigen Lauf"""
+        rng, manager, matcher = self.setup_matcher(tmp_path, monkeypatch)
+        project_ids = [matcher.create_project({
+            "title": f"Projekt {i}",
+            "industry": rng.choice(TestSkillIndex.INDUSTRIES),
+            "required_skills": rng.sample(TestSkillIndex.SKILLS, 2),
+            "min_experience": rng.randint(0, 6),
+        }) for i in range(3)]
+        for project_id in project_ids:
+            matcher.match_experts_to_project(project_id, top_k=top_k)
+
+        profile_ids = [p["id"] for p in manager.get_all_profiles()]
+        for step in range(40):
+            profile_id = rng.choice(profile_ids)
+            if step % 10 == 9:
+                manager.delete_profile(profile_id)
+                profile_ids.remove(profile_id)
+            else:
+                manager.update_profile(profile_id, TestSkillIndex().random_profile(rng))
+
+        for project_id in project_ids:
+            standing = [(m["expert_id"], m["match_score"]) for m in matcher.standing[project_id].record["matches"]]
+            fresh = matcher.match_experts_to_project(project_id, top_k=top_k)
+            assert standing == [(m["expert_id"], m["match_score"]) for m in fresh]
+
+    def test_only_changed_expert_is_rescored(self, tmp_path, monkeypatch):
+        """Test ein Profil-Update bewertet nur diesen Experten neu und speichert den Datensatz"""
+        rng, manager, matcher = self.setup_matcher(tmp_path, monkeypatch)
+        project_id = matcher.create_project({"title": "SAP", "required_skills": ["SAP"]})
+        matcher.match_experts_to_project(project_id)
+
+        scored = []
+        score = matcher._score_features
+        monkeypatch.setattr(matcher, "_score_features", lambda *args: scored.append(args[1].expert_id) or score(*args))
+        profile_id = manager.create_profile({"technologien": "SAP, Cobol"})
+
+        assert scored == [profile_id]
+        stored = ProjectMatcher().matches[-1]
+        assert profile_id in [m["expert_id"] for m in stored["matches"]]
+
+    def test_only_owner_of_latest_run_writes_update(self, tmp_path, monkeypatch):
+        """Test eine Profil-Änderung wird nur vom Prozess mit dem aktuellen Lauf gespeichert"""
+        monkeypatch.chdir(tmp_path)
+        profiles_file = str(tmp_path / "profiles.json")
+        first = ProjectMatcher(profile_manager=ProfileManager(profiles_file=profiles_file, storage_mode="journal"))
+        profile_id = first.profile_manager.create_profile({"technologien": "SAP"})
+        project_id = first.create_project({"title": "SAP", "required_skills": ["SAP"]})
+        second = ProjectMatcher(profile_manager=ProfileManager(profiles_file=profiles_file, storage_mode="journal"))
+
+        first.match_experts_to_project(project_id)
+        second.match_experts_to_project(project_id)
+        log_file = first.match_history.log_file
+        lines = len(log_file.read_text(encoding='utf-8').splitlines())
+
+        # Lokale Änderung im ersten Prozess, Replay im zweiten
+        first.profile_manager.update_profile(profile_id, {"technologien": "SAP, ABAP"})
+        second.profile_manager.refresh()
+
+        assert project_id not in first.standing
+        assert project_id in second.standing
+        assert len(log_file.read_text(encoding='utf-8').splitlines()) == lines + 1
+        assert first.get_project_matches(project_id) == second.standing[project_id].record["matches"]
+
+    def test_project_update_rematches_only_that_project(self, tmp_path, monkeypatch):
+        """Test geänderte Anforderungen berechnen nur die Liste dieses Projekts neu"""
+        rng, manager, matcher = self.setup_matcher(tmp_path, monkeypatch)
+        sap = matcher.create_project({"title": "SAP", "required_skills": ["SAP"]})
+        java = matcher.create_project({"title": "Java", "required_skills": ["Java"]})
+        matcher.match_experts_to_project(sap, top_k=5)
+        matcher.match_experts_to_project(java, top_k=5)
+        java_record = dict(matcher.standing[java].record)
+
+        assert matcher.update_project(sap, {"required_skills": ["Python"]})
+        expected = matcher._build_matches(matcher._get_project(sap), ProjectRequirements.from_project(
+            matcher._get_project(sap)), matcher._score_candidates(matcher.standing[sap].requirements, None), 5)
+        assert [m["expert_id"] for m in matcher.standing[sap].record["matches"]] == [m["expert_id"] for m in expected]
+        assert matcher.standing[java].record == java_record
+
+        matcher.update_project(sap, {"status": "completed"})
+        assert sap not in matcher.standing
+
+
+class TestMatchHistory:
+    """Test-Klasse für die Append-only Match-Historie"""
+
+    def test_latest_run_is_returned(self, matcher):
+        """Test get_project_matches liefert den letzten statt des ersten Laufs"""
+        project_id = matcher.create_project(PROJECT)
+        matcher.match_experts_to_project(project_id, [make_expert("old")])
+        matcher.match_experts_to_project(project_id, [make_expert("new")])
+
+        assert [m["expert_id"] for m in matcher.get_project_matches(project_id)] == ["new"]
+        assert [m["expert_id"] for m in ProjectMatcher().get_project_matches(project_id)] == ["new"]
+
+    def test_runs_are_appended_not_rewritten(self, matcher):
+        """Test jeder Lauf hängt genau eine Zeile an das Log"""
+        project_id = matcher.create_project(PROJECT)
+        log_file = matcher.match_history.log_file
+        matcher.match_experts_to_project(project_id, [make_expert("e1")])
+        first = log_file.read_text(encoding='utf-8')
+
+        matcher.match_experts_to_project(project_id, [make_expert("e2")])
+        content = log_file.read_text(encoding='utf-8')
+        assert content.startswith(first)
+        assert len(content.splitlines()) == len(first.splitlines()) + 1
+
+    def test_retention_and_compaction(self, matcher):
+        """Test alte Läufe fallen weg, das Log wird kompaktiert"""
+        matcher.match_history.retention_runs = 2
+        matcher.match_history.compact_threshold = 5
+        project_id = matcher.create_project(PROJECT)
+        for i in range(6):
+            matcher.match_experts_to_project(project_id, [make_expert(f"e{i}")])
+
+        runs = matcher.match_history.runs(project_id)
+        assert [r["matches"][0]["expert_id"] for r in runs] == ["e4", "e5"]
+        assert len(matcher.match_history.log_file.read_text(encoding='utf-8').splitlines()) < 12
+        assert [r["id"] for r in ProjectMatcher().match_history.runs(project_id)] == [r["id"] for r in runs]
+
+    def test_projects_by_expert_rank(self, matcher):
+        """Test Projekte, in denen ein Experte unter den Top-3 steht, ohne Scan"""
+        experts = [make_expert("star", skills="Salesforce, CRM, Python")] + \
+            [make_expert(f"e{i}", skills="Salesforce, CRM, Python") for i in range(4)]
+        front = matcher.create_project(PROJECT)
+        back = matcher.create_project(PROJECT)
+        matcher.match_experts_to_project(front, experts)
+        matcher.match_experts_to_project(back, experts[1:] + experts[:1])
+
+        assert [p["project_id"] for p in matcher.get_expert_projects("star", max_rank=3)] == [front]
+        assert [(p["project_id"], p["rank"]) for p in matcher.get_expert_projects("star")] == [(front, 1), (back, 5)]
+
+    def test_legacy_json_is_migrated(self, tmp_path, monkeypatch):
+        """Test eine bestehende project_matches.json wird übernommen"""
+        monkeypatch.chdir(tmp_path)
+        legacy = tmp_path / "08_Output_Files" / "project_matches.json"
+        legacy.parent.mkdir()
+        legacy.write_text(json.dumps([
+            {"id": "match_1", "project_id": "p1", "matches": [{"expert_id": "a", "match_score": 0.5}]},
+            {"id": "match_2", "project_id": "p1", "matches": [{"expert_id": "b", "match_score": 0.6}]},
+        ]), encoding='utf-8')
+
+        matcher = ProjectMatcher()
+        assert matcher.get_project_matches("p1")[0]["expert_id"] == "b"
+        assert matcher.match_history.log_file.exists()
+
+    def test_colliding_legacy_ids_are_rekeyed(self, tmp_path):
+        """Test gleiche Alt-IDs verschiedener Projekte überschreiben sich nicht"""
+        legacy = tmp_path / "project_matches.json"
+        legacy.write_text(json.dumps([
+            {"id": "match_1", "project_id": "p1", "matches": [{"expert_id": "a", "match_score": 0.5}]},
+            {"id": "match_1", "project_id": "p2", "matches": [{"expert_id": "b", "match_score": 0.6}]},
+        ]), encoding='utf-8')
+
+        history = MatchHistory(tmp_path / "project_matches.jsonl", migrate_from=legacy)
+        assert history.latest("p1")["matches"][0]["expert_id"] == "a"
+        assert history.latest("p2")["id"] == "match_1_2"
+        assert MatchHistory(tmp_path / "project_matches.jsonl").latest("p1")["id"] == "match_1"
+
+    def test_processes_share_the_log(self, tmp_path):
+        """Test Anhängen und Kompaktieren übernimmt die Läufe anderer Prozesse"""
+        log_file = tmp_path / "project_matches.jsonl"
+        first = MatchHistory(log_file)
+        second = MatchHistory(log_file)
+
+        first.append([{"id": "match_1", "project_id": "p1", "matches": []}])
+        second.append([{"id": "match_1", "project_id": "p2", "matches": []}])
+        assert second.latest("p1")["id"] == "match_1"
+        assert first.latest("p2")["id"] == "match_1_2"
+
+        second.compact()
+        first.append([{"id": "match_3", "project_id": "p1", "matches": []}])
+        first.compact()
+
+        restarted = MatchHistory(log_file)
+        assert [r["id"] for r in restarted.runs("p1")] == ["match_1", "match_3"]
+        assert [r["id"] for r in restarted.runs("p2")] == ["match_1_2"]
+        assert len(log_file.read_text(encoding='utf-8').splitlines()) == 3
+
+
+class TestProfileSelector:
+    """Test-Klasse für serverseitig aufgelöste Profil-Selektoren"""
+
+    @pytest.fixture
+    def selecting(self, tmp_path, monkeypatch):
+        """ProjectMatcher mit getaggten, teils belegten Profilen"""
+        monkeypatch.chdir(tmp_path)
+        manager = ProfileManager(profiles_file=str(tmp_path / "profiles.json"))
+        ids = {
+            "sap_free": manager.create_profile({"expert_name": "A", "technologien": "SAP", "tags": ["sap"]}),
+            "sap_busy": manager.create_profile({"expert_name": "B", "technologien": "SAP", "tags": ["sap"]}),
+            "java_free": manager.create_profile({"expert_name": "C", "technologien": "Java", "tags": ["java"]}),
+        }
+        manager.update_availability(ids["sap_busy"], {"status": "busy"})
+        return ProjectMatcher(profile_manager=manager), ids
+
+    def test_all_uses_whole_store(self, selecting):
+        """Test "all" bzw. kein Selektor ergibt den gesamten Bestand (None)"""
+        matcher, _ = selecting
+        assert matcher.select_profile_ids() is None
+        assert matcher.select_profile_ids("all") is None
+
+    def test_available_and_tags(self, selecting):
+        """Test Verfügbarkeit und Tags werden über die Indizes aufgelöst"""
+        matcher, ids = selecting
+        assert matcher.select_profile_ids("available") == {ids["sap_free"], ids["java_free"]}
+        assert matcher.select_profile_ids({"tags": "sap"}) == {ids["sap_free"], ids["sap_busy"]}
+        assert matcher.select_profile_ids({"available": True, "tags": ["sap"]}) == {ids["sap_free"]}
+
+    def test_ids(self, selecting):
+        """Test explizite IDs, unbekannte werden übersprungen"""
+        matcher, ids = selecting
+        selected = matcher.select_profile_ids({"ids": [ids["java_free"], "unknown", ids["sap_busy"]]})
+        assert selected == {ids["java_free"], ids["sap_busy"]}
+        assert matcher.select_profile_ids({"ids": [ids["sap_busy"]], "available": True}) == set()
+
+    def test_invalid_selector(self, selecting):
+        """Test unbekannte Selektoren werden abgewiesen"""
+        matcher, _ = selecting
+        with pytest.raises(ValueError):
+            matcher.select_profile_ids("busy")
+        with pytest.raises(ValueError):
+            matcher.select_profile_ids({"skills": ["SAP"]})
+
+    def test_match_with_selector(self, selecting, monkeypatch):
+        """Test ein Match-Lauf über die ausgewählten Profile nutzt die Vorauswahl des Skill-Index"""
+        matcher, ids = selecting
+        project_id = matcher.create_project({"title": "SAP", "required_skills": ["SAP"]})
+
+        scored = []
+        score = matcher._score_features
+        monkeypatch.setattr(matcher, "_score_features", lambda *args: scored.append(args[1].expert_id) or score(*args))
+        selected = matcher.select_profile_ids("available")
+        matches = matcher.match_experts_to_project(project_id, candidate_ids=selected)
+
+        assert ids["sap_free"] in [m["expert_id"] for m in matches]
+        assert ids["sap_busy"] not in scored and set(scored) <= selected
+        assert project_id not in matcher.standing
+
+        everyone = matcher.match_experts_to_project(project_id)
+        assert [m["expert_id"] for m in matches] == [m["expert_id"] for m in everyone if m["expert_id"] in selected]
@@ -0,0 +1,102 @@
+"""
+NUNC Expert Management System - Binär-Snapshots
+Schneller Kaltstart: versionierter Pickle-Snapshot (Protokoll 5) neben jeder JSON-Datei
+"""
+
+import gc
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, List, Optional
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot.pkl"
+
+
+def snapshot_path(json_path: Path) -> Path:
+    """Pfad des Snapshots zu einer JSON-Datei (profiles.json -> profiles.snapshot.pkl)"""
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.stem + SNAPSHOT_SUFFIX)
+
+
+def _source_stamp(json_path: Path) -> Optional[tuple]:
+    """Änderungszeit und Größe der JSON-Datei (None, wenn sie fehlt)"""
+    try:
+        stat = json_path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_snapshot(json_path: Path) -> Optional[List[Any]]:
+    """Lädt den Snapshot, wenn er zur aktuellen JSON-Datei passt, sonst None
+
+    Der Kopf (Version, mtime/Größe der JSON-Datei) wird zuerst gelesen; bei
+    abweichendem Stand wird der Rumpf gar nicht erst entpickelt. Snapshots
+    werden nur von diesem Modul geschrieben und liegen im Datenverzeichnis.
+    """
+    json_path = Path(json_path)
+    path = snapshot_path(json_path)
+    stamp = _source_stamp(json_path)
+    if stamp is None or not path.exists():
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            header = pickle.load(f)
+            if header.get("version") != SNAPSHOT_VERSION or tuple(header.get("source", ())) != stamp:
+                return None
+            # Zyklische GC während des Entpickelns vieler kleiner Dicts pausieren
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                return pickle.load(f)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+    except Exception as e:
+        print(f"⚠️ Snapshot {path.name} nicht lesbar, lade JSON: {e}")
+        return None
+
+
+def write_snapshot(json_path: Path, records: List[Any]):
+    """Schreibt den Snapshot für den aktuellen Stand der JSON-Datei"""
+    json_path = Path(json_path)
+    stamp = _source_stamp(json_path)
+    if stamp is None:
+        return
+
+    path = snapshot_path(json_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"version": SNAPSHOT_VERSION, "source": stamp}, f, protocol=5)
+            pickle.dump(records, f, protocol=5)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠️ Snapshot {path.name} konnte nicht geschrieben werden: {e}")
+
+
+def load_json(json_path: Path, use_snapshot: bool = True) -> Optional[List[Any]]:
+    """Lädt eine JSON-Datei, bevorzugt über ihren Snapshot
+
+    Gibt None zurück, wenn die JSON-Datei nicht existiert. Ist der Snapshot
+    veraltet oder fehlt er, wird die JSON-Datei gelesen und der Snapshot neu
+    geschrieben.
+    """
+    json_path = Path(json_path)
+    if use_snapshot:
+        records = read_snapshot(json_path)
+        if records is not None:
+            return records
+
+    if not json_path.exists():
+        return None
+    with open(json_path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+
+    if use_snapshot:
+        write_snapshot(json_path, records)
+    return records
+
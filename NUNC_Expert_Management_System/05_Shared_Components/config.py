@@ -28,6 +28,9 @@ class Config:
     CV_PROCESSING: Dict[str, Any] = None
     PROFILE_MANAGEMENT: Dict[str, Any] = None
     WEB_INTERFACE: Dict[str, Any] = None
+    STORAGE: Dict[str, Any] = None
+    PROJECT_MATCHING: Dict[str, Any] = None
+    CANDIDATE_SEARCH: Dict[str, Any] = None
     
     def __post_init__(self):
         """Initialisierung nach Dataclass-Erstellung"""
@@ -59,6 +62,41 @@ class Config:
                 "debug": True,
                 "auto_reload": True
             }
+        
+        if self.STORAGE is None:
+            self.STORAGE = {
+                "backend": os.getenv("NEMS_STORAGE_BACKEND", "json"),  # json, sqlite
+                "sqlite_path": os.getenv("NEMS_SQLITE_PATH"),  # None = nems.db neben den JSON-Dateien
+                "profile_journal": False,  # ProfileManager im JSON-Backend als Journal betreiben
+                "binary_snapshot": os.getenv("NEMS_BINARY_SNAPSHOT", "0") == "1"  # Pickle-Snapshot neben JSON-Dateien
+            }
+        
+        if self.PROJECT_MATCHING is None:
+            self.PROJECT_MATCHING = {
+                "history_retention_runs": 10,  # gespeicherte Match-Läufe je Projekt
+                "history_compact_threshold": 1000,  # Log-Zeilen, ab denen die Historie kompaktiert wird
+                "score_cache_max_mb": 50  # Speichergrenze des Match-Score-Caches (0 = aus)
+            }
+        
+        if self.CANDIDATE_SEARCH is None:
+            self.CANDIDATE_SEARCH = {
+                "provider_timeout": 10,  # Sekunden je Plattform
+                "provider_timeouts": {},  # abweichende Timeouts je Plattform, z.B. {"linkedin": 15}
+                "search_deadline": 20,  # Sekunden für die gesamte Suche
+                "max_workers": 8,  # Threads für parallele Plattform-Abfragen
+                "deduplicate": True,  # Dubletten über Plattformen hinweg zusammenführen
+                "providers": {  # je Provider: enabled, base_url, rate_per_second, burst, max_concurrency, request_timeout
+                    "linkedin": {"base_url": os.getenv("NEMS_LINKEDIN_URL")},
+                    "freelancermap": {"base_url": os.getenv("NEMS_FREELANCERMAP_URL")}
+                },
+                "cache": {
+                    "enabled": True,
+                    "ttl": 3600,  # Sekunden, die Ergebnisse einer Plattform gültig bleiben
+                    "provider_ttls": {},  # abweichende TTLs je Plattform, z.B. {"linkedin": 600}
+                    "max_entries": 1000,  # LRU-Grenze (Plattform x Suchparameter)
+                    "persist": False  # Cache in 08_Output_Files speichern (übersteht Neustarts)
+                }
+            }
     
     def get_upload_path(self, filename: str) -> Path:
         """Gibt den vollständigen Upload-Pfad zurück"""
@@ -0,0 +1,135 @@
+"""
+NUNC Expert Management System - Datei-Locks
+Prozessübergreifende Advisory-Locks und atomares Schreiben für dateibasierte Speicher
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+def _lock_handle(handle, blocking: bool = True) -> bool:
+    """Sperrt eine geöffnete Lock-Datei exklusiv, gibt False zurück wenn belegt"""
+    if fcntl is not None:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(handle.fileno(), flags)
+        except BlockingIOError:
+            return False
+    elif msvcrt is not None:
+        handle.seek(0)
+        while True:
+            try:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if not blocking:
+                    return False
+                # LK_LOCK gibt nach ~10 Sekunden auf - weiter warten
+    return True
+
+
+def _unlock_handle(handle):
+    """Gibt die Sperre einer Lock-Datei frei"""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """Exklusiver Lock über eine Lock-Datei (fcntl bzw. msvcrt).
+
+    Schützt Schreibvorgänge zwischen Prozessen (z.B. mehrere Flask-Worker
+    und CLI-Skripte) und zwischen Threads desselben Prozesses. Der Lock ist
+    reentrant: verschachtelte `with`-Blöcke im selben Thread sperren die
+    Datei nur einmal.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._handle = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Holt den Lock; mit blocking=False sofort False, wenn er belegt ist"""
+        if not self._thread_lock.acquire(blocking):
+            return False
+        if self._depth == 0:
+            try:
+                handle = open(self.path, 'a+b')
+                if not _lock_handle(handle, blocking):
+                    handle.close()
+                    self._thread_lock.release()
+                    return False
+            except Exception:
+                self._thread_lock.release()
+                raise
+            self._handle = handle
+        self._depth += 1
+        return True
+
+    def release(self):
+        """Gibt den Lock frei"""
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                _unlock_handle(self._handle)
+            finally:
+                self._handle.close()
+                self._handle = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def file_stamp(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Änderungsstempel einer Datei (mtime_ns, Größe, Inode) oder None
+
+    Atomares Ersetzen erzeugt eine neue Inode, daher erkennt der Stempel
+    auch Änderungen innerhalb derselben mtime-Auflösung.
+    """
+    try:
+        stat = Path(path).stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def atomic_write_json(path: Path, data: Any):
+    """Schreibt JSON in eine temporäre Datei und ersetzt das Ziel atomar
+
+    Leser sehen so immer entweder den alten oder den neuen Stand, nie eine
+    halb geschriebene Datei.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
@@ -0,0 +1,219 @@
+"""
+NUNC Expert Management System - Storage Backends
+Austauschbare Speicher-Backends (JSON-Datei, SQLite) für alle Manager
+"""
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from binary_snapshot import load_json, write_snapshot
+from config import Config
+from file_lock import atomic_write_json, file_stamp
+from utils import safe_get
+
+Records = Union[Iterable[Dict[str, Any]], Callable[[], Iterable[Dict[str, Any]]]]
+
+
+class StorageBackend(ABC):
+    """Basis-Interface für die Persistenz einer Datensatz-Sammlung"""
+
+    @abstractmethod
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Lädt alle Datensätze in Einfüge-Reihenfolge"""
+        raise NotImplementedError("Subclasses must implement load_all")
+
+    @abstractmethod
+    def save(self, records: Records, changed: Iterable[Dict[str, Any]] = (),
+             deleted: Iterable[str] = ()):
+        """Persistiert Änderungen
+
+        `records` ist der komplette Bestand (Liste oder Callable) und wird nur
+        von Backends ohne Einzel-Schreibzugriff benötigt. `changed`/`deleted`
+        beschreiben die Änderung; sind beide leer, wird der komplette Bestand
+        geschrieben.
+        """
+        raise NotImplementedError("Subclasses must implement save")
+
+    def find_by(self, column: str, value: Any) -> List[Dict[str, Any]]:
+        """Datensätze mit einem bestimmten Wert einer indizierten Spalte"""
+        return [record for record in self.load_all() if safe_get(record, column) == value]
+
+    def generation(self) -> Any:
+        """Günstiger Änderungsstempel; ändert sich, wenn ein anderer Prozess schreibt"""
+        return None
+
+    def close(self):
+        """Gibt Ressourcen frei"""
+
+
+class JsonFileStorage(StorageBackend):
+    """Bisheriges Verhalten: der komplette Bestand als eine JSON-Datei
+
+    Mit `binary_snapshot=True` wird zusätzlich ein Pickle-Snapshot gepflegt,
+    der beim Laden bevorzugt wird, solange er zur JSON-Datei passt.
+    """
+
+    def __init__(self, path: Path, binary_snapshot: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.binary_snapshot = binary_snapshot
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        return load_json(self.path, self.binary_snapshot) or []
+
+    def save(self, records: Records, changed: Iterable[Dict[str, Any]] = (),
+             deleted: Iterable[str] = ()):
+        if callable(records):
+            records = records()
+        records = list(records)
+        atomic_write_json(self.path, records)
+        if self.binary_snapshot:
+            write_snapshot(self.path, records)
+
+    def generation(self) -> Any:
+        return file_stamp(self.path)
+
+
+class SQLiteStorage(StorageBackend):
+    """SQLite-Backend: eine Tabelle je Sammlung, WAL-Modus, indizierte Spalten.
+
+    Jeder Datensatz wird als JSON in `data` gespeichert; `id` ist der
+    Primärschlüssel, `seq` hält die Einfüge-Reihenfolge. Zusätzliche Spalten
+    (z.B. Fremdschlüssel wie `project_id`) werden aus dem Datensatz
+    extrahiert und indiziert. Mehrzeilige Änderungen laufen in einer
+    Transaktion. Existiert beim ersten Öffnen noch die JSON-Datei der
+    Sammlung, wird sie einmalig übernommen.
+    """
+
+    def __init__(self, db_path: Path, table: str, index_columns: Optional[Dict[str, str]] = None,
+                 migrate_from: Optional[Path] = None):
+        if not table.isidentifier():
+            raise ValueError(f"Ungültiger Tabellenname: {table}")
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        # Spaltenname -> Pfad im Datensatz (Punkt-Notation für verschachtelte Felder)
+        self.index_columns = dict(index_columns or {})
+        for column in self.index_columns:
+            if not column.isidentifier():
+                raise ValueError(f"Ungültiger Spaltenname: {column}")
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        if migrate_from is not None:
+            self._migrate_json(Path(migrate_from))
+
+    def _create_schema(self):
+        """Legt Tabelle und Indizes an"""
+        extra_columns = "".join(f", {column} TEXT" for column in self.index_columns)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                f"(id TEXT PRIMARY KEY, seq INTEGER NOT NULL, data TEXT NOT NULL{extra_columns})"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table}_seq ON {self.table} (seq)")
+            for column in self.index_columns:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{self.table}_{column} ON {self.table} ({column})"
+                )
+
+        row = self._conn.execute(f"SELECT COALESCE(MAX(seq), 0) FROM {self.table}").fetchone()
+        self._next_seq = row[0] + 1
+
+    def _migrate_json(self, json_path: Path):
+        """Übernimmt eine bestehende JSON-Datei, wenn die Tabelle noch leer ist"""
+        if not json_path.exists():
+            return
+        if self._conn.execute(f"SELECT 1 FROM {self.table} LIMIT 1").fetchone():
+            return
+
+        records = JsonFileStorage(json_path).load_all()
+        self.save(records, changed=records)
+        print(f"✅ {len(records)} Datensätze aus {json_path.name} nach SQLite übernommen")
+
+    def _row(self, record: Dict[str, Any]) -> tuple:
+        """Werte für INSERT: id, seq, data, indizierte Spalten"""
+        seq = self._next_seq
+        self._next_seq += 1
+        values = [record["id"], seq, json.dumps(record, ensure_ascii=False)]
+        for path in self.index_columns.values():
+            value = safe_get(record, path)
+            values.append(None if value is None else str(value))
+        return tuple(values)
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT data FROM {self.table} ORDER BY seq").fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def save(self, records: Records, changed: Iterable[Dict[str, Any]] = (),
+             deleted: Iterable[str] = ()):
+        changed = list(changed)
+        deleted = list(deleted)
+
+        columns = ["id", "seq", "data", *self.index_columns]
+        # seq bleibt bei Updates erhalten (Reihenfolge wie in der JSON-Datei)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column not in ("id", "seq"))
+        upsert = (
+            f"INSERT INTO {self.table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+
+        with self._lock, self._conn:
+            if not changed and not deleted:
+                # Kompletten Bestand ersetzen
+                if callable(records):
+                    records = records()
+                self._conn.execute(f"DELETE FROM {self.table}")
+                changed = list(records)
+            if changed:
+                self._conn.executemany(upsert, [self._row(record) for record in changed])
+            if deleted:
+                self._conn.executemany(f"DELETE FROM {self.table} WHERE id = ?", [(record_id,) for record_id in deleted])
+
+    def find_by(self, column: str, value: Any) -> List[Dict[str, Any]]:
+        if column != "id" and column not in self.index_columns:
+            return super().find_by(column, value)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM {self.table} WHERE {column} = ? ORDER BY seq", (str(value),)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def generation(self) -> Any:
+        # data_version ändert sich nur bei Commits anderer Verbindungen
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_storage(collection: str, json_path: Path, index_columns: Optional[Dict[str, str]] = None,
+                   config: Optional[Config] = None, backend: Optional[str] = None) -> StorageBackend:
+    """Erzeugt das in der Konfiguration gewählte Backend für eine Sammlung
+
+    `collection` ist der Tabellenname (SQLite), `json_path` die bisherige
+    JSON-Datei. Ohne konfigurierten SQLite-Pfad liegt die Datenbank
+    (nems.db) neben der JSON-Datei.
+    """
+    config = config or Config()
+    backend = backend or config.STORAGE.get("backend", "json")
+    json_path = Path(json_path)
+
+    if backend == "sqlite":
+        db_path = config.STORAGE.get("sqlite_path") or json_path.parent / "nems.db"
+        return SQLiteStorage(db_path, collection, index_columns, migrate_from=json_path)
+    if backend == "json":
+        return JsonFileStorage(json_path, binary_snapshot=config.STORAGE.get("binary_snapshot", False))
+    raise ValueError(f"Unbekanntes Storage-Backend: {backend}")
@@ -204,3 +204,14 @@ def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
             return default
     
     return current
+
+
+def generate_record_id(prefix: str, existing_ids) -> str:
+    """Erzeugt eine ID im Format prefix_YYYYmmdd_HHMMSS, bei Kollision mit Suffix _2, _3, ..."""
+    base_id = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    record_id = base_id
+    suffix = 2
+    while record_id in existing_ids:
+        record_id = f"{base_id}_{suffix}"
+        suffix += 1
+    return record_id
@@ -4,8 +4,9 @@ NUNC Expert Management System - Web Interface
 Vollständiges Web-Interface für alle System-Komponenten
 """
 
-from flask import Flask, request, jsonify, render_template, send_file
+from flask import Flask, Response, request, jsonify, render_template, send_file, stream_with_context
 from pathlib import Path
+import json
 import os
 import sys
 import time
@@ -13,6 +14,8 @@ import webbrowser
 import threading
 from datetime import datetime
 
+from config import Config
+
 # Importiere alle System-Komponenten mit Fehlerbehandlung
 try:
     sys.path.append(str(Path(__file__).parent.parent / '01_Core_System'))
@@ -56,11 +59,14 @@ except ImportError as e:
 
 app = Flask(__name__)
 
+# Gemeinsame Konfiguration (u.a. Speicher-Backend, siehe Config.STORAGE)
+config = Config()
+
 # Globale System-Komponenten mit Null-Checks
-profile_manager = ProfileManager() if ProfileManager else None
-availability_manager = AvailabilityManager() if AvailabilityManager else None
-candidate_search = CandidateSearch() if CandidateSearch else None
-project_matcher = ProjectMatcher() if ProjectMatcher else None
+profile_manager = ProfileManager(storage_mode=os.environ.get('NEMS_PROFILE_STORAGE'), config=config) if ProfileManager else None
+availability_manager = AvailabilityManager(config=config) if AvailabilityManager else None
+candidate_search = CandidateSearch(config=config) if CandidateSearch else None
+project_matcher = ProjectMatcher(config=config, profile_manager=profile_manager) if ProjectMatcher else None
 
 # CV-Processing Komponenten
 cv_processor = CvProcessor() if CvProcessor else None
@@ -110,12 +116,38 @@ def cv_processing_page():
 # API-Endpunkte für Profile
 @app.route('/api/profiles', methods=['GET'])
 def get_profiles():
-    """Gibt alle Profile zurück"""
+    """Gibt alle Profile zurück
+    
+    Optionale Query-Parameter: `fields` (kommagetrennt, z.B.
+    fields=expert_name,hauptfokus,availability), `limit` und `after`
+    (Cursor aus `next_cursor` der vorherigen Seite).
+    """
     try:
         if not profile_manager:
             return jsonify({'success': False, 'error': 'ProfileManager not available'})
-        profiles = profile_manager.get_all_profiles()
-        return jsonify({'success': True, 'profiles': profiles})
+        
+        fields = request.args.get('fields')
+        fields = [f.strip() for f in fields.split(',') if f.strip()] if fields else None
+        after = request.args.get('after') or None
+        limit = request.args.get('limit', type=int)
+        
+        if after is None and limit is None:
+            profiles = profile_manager.get_all_profiles(fields=fields)
+            return jsonify({'success': True, 'profiles': profiles})
+        
+        limit = max(1, min(limit or 100, 1000))
+        page = profile_manager.get_profiles_page(fields=fields, after=after, limit=limit)
+        return jsonify({'success': True, 'profiles': page['profiles'], 'next_cursor': page['next_cursor']})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
+@app.route('/api/profiles/replication', methods=['GET'])
+def get_profile_replication():
+    """Gibt Metriken der Supabase-Spiegelung zurück (Queue-Tiefe, Verzögerung)"""
+    try:
+        if not profile_manager:
+            return jsonify({'success': False, 'error': 'ProfileManager not available'})
+        return jsonify({'success': True, 'replication': profile_manager.get_replication_metrics()})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
@@ -199,8 +231,53 @@ def search_candidates():
     """Sucht Kandidaten auf verschiedenen Plattformen"""
     try:
         search_params = request.json
-        results = candidate_search.search_all_platforms(search_params)
-        return jsonify({'success': True, 'candidates': results})
+        search_result = candidate_search.search(search_params)
+        return jsonify({'success': True, 'candidates': search_result['results'],
+                        'platforms': search_result['platform_status']})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)})
+
+@app.route('/api/candidates/search/stream', methods=['GET', 'POST'])
+def search_candidates_stream():
+    """Sucht Kandidaten und sendet die Ergebnisse je Plattform als Server-Sent Events
+    
+    POST mit den Suchparametern als JSON oder GET (für EventSource) mit
+    ?skills=Salesforce,CRM&location=München&min_experience=3&min_match_score=0.7.
+    Ereignisse: `platform` (gefilterte, bewertete Kandidaten einer Plattform,
+    sobald sie vorliegen), zum Schluss `done` bzw. `error`. Ungültige
+    Zahlenwerte werden vor dem Öffnen des Streams mit 400 abgewiesen.
+    """
+    if request.method == 'POST':
+        search_params = request.get_json(silent=True) or {}
+        numbers = search_params
+    else:
+        search_params = {
+            'required_skills': [s.strip() for s in request.args.get('skills', '').split(',') if s.strip()],
+            'location': request.args.get('location', '')
+        }
+        numbers = request.args
+    for key in ('min_experience', 'min_match_score'):
+        if key in numbers:
+            try:
+                search_params[key] = float(numbers[key])
+            except (TypeError, ValueError):
+                return jsonify({'success': False, 'error': f'Ungültiger Wert für {key}: {numbers[key]}'}), 400
+    
+    def generate():
+        try:
+            for event in candidate_search.search_stream(search_params):
+                yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'success': False, 'error': str(e)})}\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/candidates/cache', methods=['GET'])
+def candidate_cache_stats():
+    """Gibt die Statistik des Such-Caches zurück"""
+    try:
+        return jsonify({'success': True, 'cache': candidate_search.get_cache_stats()})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
@@ -224,12 +301,35 @@ def create_project():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+# Standard-Anzahl der zurückgegebenen Matches
+MATCH_TOP_K = 20
+
 @app.route('/api/projects/<project_id>/match', methods=['POST'])
 def match_project(project_id):
-    """Matcht Experten zu einem Projekt"""
+    """Matcht Experten zu einem Projekt
+    
+    Body (optional): `selector` wählt die Profile serverseitig aus - "all"
+    (Standard), "available", {"tags": [...]}, {"ids": [...]} oder
+    Kombinationen wie {"available": true, "tags": ["sap"]}; bewertet werden
+    nur ausgewählte Profile, die der Skill-Index vorauswählt. Alternativ
+    werden `expert_profiles` wie bisher direkt übergeben. `top_k` (max. 1000)
+    begrenzt die zurückgegebenen Matches - bei Auswahl per Selector
+    standardmäßig auf 20, bei übergebenen Profilen nur, wenn angegeben.
+    """
     try:
-        expert_profiles = request.json.get('expert_profiles', [])
-        matches = project_matcher.match_experts_to_project(project_id, expert_profiles)
+        body = request.get_json(silent=True) or {}
+        expert_profiles = body.get('expert_profiles')
+        candidate_ids = None
+        if expert_profiles is None:
+            if profile_manager:
+                candidate_ids = project_matcher.select_profile_ids(body.get('selector'))
+            else:
+                expert_profiles = []
+        top_k = body.get('top_k') or (MATCH_TOP_K if expert_profiles is None else None)
+        if top_k is not None:
+            top_k = max(1, min(int(top_k), 1000))
+        matches = project_matcher.match_experts_to_project(project_id, expert_profiles, top_k=top_k,
+                                                           candidate_ids=candidate_ids)
         return jsonify({'success': True, 'matches': matches})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
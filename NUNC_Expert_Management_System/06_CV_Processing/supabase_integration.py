@@ -23,8 +23,11 @@ except ImportError:
     from sentence_transformers import SentenceTransformer
 
 class SupabaseIntegration:
-    def __init__(self, supabase_url: str = None, supabase_key: str = None, openai_api_key: str = None):
+    def __init__(self, supabase_url: str = None, supabase_key: str = None, openai_api_key: str = None,
+                 raise_errors: bool = False):
         self.supabase_url = supabase_url or os.getenv('SUPABASE_URL')
+        # Supabase-Fehler weiterreichen statt lokal zu speichern (z.B. für die Retry-Logik der Outbox)
+        self.raise_errors = raise_errors
         self.supabase_key = supabase_key or os.getenv('SUPABASE_KEY')
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         
@@ -90,9 +93,31 @@ class SupabaseIntegration:
                 return None
                 
         except Exception as e:
+            if self.raise_errors:
+                raise
             print(f"❌ Supabase Fehler: {e}")
             return self._save_locally(profile_data)
     
+    def insert_profiles(self, profiles_data: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Fügt mehrere Profile mit einem einzigen Aufruf in Supabase ein"""
+        if not self.supabase:
+            return [self._save_locally(profile_data) for profile_data in profiles_data]
+        
+        try:
+            supabase_rows = [self.prepare_profile_for_supabase(profile_data) for profile_data in profiles_data]
+            
+            result = self.supabase.table('profiles').insert(supabase_rows).execute()
+            
+            profile_ids = [row['id'] for row in (result.data or [])]
+            print(f"✅ {len(profile_ids)} Profile in Supabase eingefügt")
+            return profile_ids
+                
+        except Exception as e:
+            if self.raise_errors:
+                raise
+            print(f"❌ Supabase Fehler: {e}")
+            return [self._save_locally(profile_data) for profile_data in profiles_data]
+    
     def _save_locally(self, profile_data: Dict[str, Any]) -> str:
         """Speichert Profil lokal als Fallback"""
         local_db = "08_Output_Files/generated_profiles/supabase_local.json"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Skalierungs-Benchmark: paralleles Projekt-Matching
+Misst den Durchsatz (bewertete Experte/Projekt-Paare pro Sekunde) mit 1, 2, 4 und 8 Workern
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / '04_Project_Matching'))
+
+from expert_features import ExpertFeatures, ProjectRequirements
+from parallel_matching import ParallelScorer
+
+SKILLS = ["Salesforce", "SAP", "Python", "Java", "CRM", "Apex", "SQL", "Agile", "Azure", "AWS",
+          "Kubernetes", "React", "Scrum", "ABAP", "Tableau", "Power BI"]
+CERTS = ["PMP", "Salesforce Certified Administrator", "AWS Solutions Architect", "Scrum Master", "ITIL"]
+INDUSTRIES = ["Automotive", "Banking", "Retail", "Pharma", "Energie", "Versicherung", "Telekommunikation"]
+
+MIN_MATCH_SCORE = 0.3
+
+
+def make_features(count: int, rng: random.Random):
+    """Erzeugt synthetische Experten-Features"""
+    return [
+        ExpertFeatures(
+            expert_id=f"profile_{i}",
+            expert_name=f"Experte {i}",
+            skills=frozenset(rng.sample(SKILLS, rng.randint(2, 6))),
+            certifications=frozenset(rng.sample(CERTS, rng.randint(0, 2))),
+            industries=", ".join(rng.sample(INDUSTRIES, rng.randint(1, 3))).lower(),
+            experience_years=rng.randint(0, 15),
+            available=rng.random() < 0.6,
+        )
+        for i in range(count)
+    ]
+
+
+def make_requirements(count: int, rng: random.Random):
+    """Erzeugt synthetische Projekt-Anforderungen"""
+    return [
+        ProjectRequirements.from_project({
+            "industry": rng.choice(INDUSTRIES),
+            "required_skills": rng.sample(SKILLS, rng.randint(1, 4)),
+            "certifications": rng.sample(CERTS, rng.randint(0, 2)),
+            "min_experience": rng.randint(0, 8),
+        })
+        for _ in range(count)
+    ]
+
+
+def benchmark(experts: int, projects: int, top_k: int, worker_counts):
+    """Bewertet alle Projekte gegen den Bestand mit unterschiedlich vielen Workern"""
+    rng = random.Random(42)
+    features = make_features(experts, rng)
+    requirements = make_requirements(projects, rng)
+    pairs = experts * projects
+
+    baseline = None
+    baseline_time = None
+    for workers in worker_counts:
+        scorer = ParallelScorer(features, workers)
+        start = time.perf_counter()
+        result = scorer.matches_many(requirements, MIN_MATCH_SCORE, top_k)
+        elapsed = time.perf_counter() - start
+
+        ranked = [[(f.expert_id, score) for f, score in scored] for scored in result]
+        if baseline is None:
+            baseline, baseline_time = ranked, elapsed
+        assert ranked == baseline, "Ergebnis weicht vom Lauf mit einem Worker ab"
+
+        print(f"{workers:>3} Worker ({scorer.workers} genutzt) | {elapsed:8.2f} s | "
+              f"{pairs / elapsed / 1e6:6.2f} Mio. Paare/s | Faktor {baseline_time / elapsed:4.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skalierungs-Benchmark für paralleles Matching")
+    parser.add_argument("--experts", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"🔄 Matching-Benchmark: {args.experts} Experten x {args.projects} Projekte, "
+          f"Top-{args.top_k} ({os.cpu_count()} CPU-Kerne)")
+    benchmark(args.experts, args.projects, args.top_k, args.workers)
+
+
+if __name__ == "__main__":
+    main()
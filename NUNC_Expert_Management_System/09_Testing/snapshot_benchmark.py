@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Kaltstart-Benchmark: JSON vs. Binär-Snapshot
+Misst das Laden eines Profil-Bestands mit 10.000 und 100.000 Datensätzen
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / '05_Shared_Components'))
+
+from binary_snapshot import load_json, read_snapshot, write_snapshot
+
+
+def make_profiles(count: int):
+    """Erzeugt synthetische Profile in der Struktur von ProfileManager._build_profile"""
+    return [
+        {
+            "id": f"profile_20250101_000000_{i}",
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:00:00",
+            "status": "active",
+            "expert_name": f"Experte {i}",
+            "email": f"experte{i}@example.com",
+            "hauptfokus": "Salesforce CRM Beratung",
+            "technologien": "Salesforce, Apex, Python, SQL, Agile",
+            "zertifizierungen": "Salesforce Certified Administrator, PMP",
+            "branchenkenntnisse": "Automotive, Banking, Retail",
+            "projekthistorie_text": "Mehrjährige Projekterfahrung in CRM-Einführungen. " * 8,
+            "availability": {"status": "available", "hours_per_week": 40},
+            "tags": ["crm", "salesforce"],
+            "source": "manual",
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(runs: int, func):
+    """Beste Laufzeit aus mehreren Durchläufen (Sekunden)"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark(count: int, runs: int):
+    """Vergleicht json.load mit dem Snapshot für `count` Profile"""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "profiles.json"
+        profiles = make_profiles(count)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(profiles, f, indent=4, ensure_ascii=False)
+        write_snapshot(json_path, profiles)
+        assert read_snapshot(json_path) == profiles
+
+        json_time = best_of(runs, lambda: load_json(json_path, use_snapshot=False))
+        snapshot_time = best_of(runs, lambda: load_json(json_path, use_snapshot=True))
+
+    print(f"{count:>8} Profile | JSON {json_time * 1000:8.1f} ms | "
+          f"Snapshot {snapshot_time * 1000:8.1f} ms | Faktor {json_time / snapshot_time:5.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaltstart-Benchmark für Binär-Snapshots")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print("🔄 Lade-Benchmark (beste von %d Läufen)" % args.runs)
+    for count in args.sizes:
+        benchmark(count, args.runs)
+
+
+if __name__ == "__main__":
+    main()